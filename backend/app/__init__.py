@@ -1,39 +1,123 @@
 """Flask application factory."""
+import os
+import tempfile
 from flask import Flask
 from config import config
 from app.extensions import db, migrate, jwt, cors
 
-def create_app(config_name='default'):
+def create_app(config_name='default', overrides=None):
     """Create and configure the Flask application."""
     app = Flask(__name__)
     
+    from app.serializers import FastJSONProvider
+    app.json = FastJSONProvider(app)
+    
     # Load configuration
     app.config.from_object(config[config_name])
+    if app.config['SHARED_STATE_DIR'] is None:
+        # Stamps, snapshots, metrics and logs private to this app
+        state_dir = tempfile.mkdtemp(prefix='school-system-')
+        app.config.update(
+            SHARED_STATE_DIR=state_dir,
+            METRICS_DIR=os.path.join(state_dir, 'metrics'),
+            SLOW_QUERY_LOG_FILE=os.path.join(state_dir, 'slow_queries.log'),
+            PROFILE_DIR=os.path.join(state_dir, 'profiles'),
+        )
+    if overrides:
+        app.config.update(overrides)
     
     # Initialize extensions
+    from app.utils.pool_metrics import configure_engine_options, instrument_engine
+    configure_engine_options(app)
     db.init_app(app)
+    with app.app_context():
+        for name, engine in db.engines.items():
+            instrument_engine(name or 'default', engine)
+    
+    # Registered first so its timing wraps every other request hook
+    from app.utils.request_metrics import request_metrics
+    request_metrics.init_app(app)
+    
+    from app.utils import query_budget
+    from app.utils.slow_queries import slow_query_log
+    query_budget.init_app(app)
+    slow_query_log.init_app(app)
+    
+    # Early, so a profile covers the other hooks as well as the view
+    from app.utils.profiler import request_profiler
+    request_profiler.init_app(app)
+    
     migrate.init_app(app, db)
     jwt.init_app(app)
     cors.init_app(app, origins=app.config['CORS_ORIGINS'])
     
-    # Register blueprints
-    from app.routes.auth import auth_bp
-    from app.routes.public import public_bp
-    from app.routes.admin import admin_bp
+    from app import replica
+    replica.init_app(app, db)
+    
+    from app.utils.revocation import revocation_store
+    from app.utils.passwords import password_hasher, HashingBusyError
+    revocation_store.init_app(app)
+    password_hasher.init_app(app)
+    
+    from app.utils.compression import compressor
+    from app.utils.home_snapshot import home_snapshot
+    from app.utils.static_export import static_exporter
+    compressor.init_app(app)
+    home_snapshot.init_app(app)
+    static_exporter.init_app(app)
+    
+    @app.errorhandler(HashingBusyError)
+    def hashing_busy(error):
+        return {'success': False, 'message': 'Server is busy, please retry shortly'}, 503, {'Retry-After': '1'}
     
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-    app.register_blueprint(public_bp, url_prefix='/api/public')
-    app.register_blueprint(admin_bp, url_prefix='/api/admin')
+    from app.serializers import FieldSelectionError
+    
+    @app.errorhandler(FieldSelectionError)
+    def invalid_fields(error):
+        return {'success': False, 'message': str(error)}, 400
+    
+    from app.utils.list_query import ListQueryError
+    
+    @app.errorhandler(ListQueryError)
+    def invalid_list_query(error):
+        return {'success': False, 'message': str(error)}, 400
+    
+    # Register blueprints and CLI commands
+    from app.routes import register_blueprints
+    from app.cli import register_commands
+    register_blueprints(app)
+    register_commands(app)
     
     # Health check route
     @app.route('/api/health')
     def health_check():
         return {'status': 'healthy', 'message': 'School Information System API is running'}
     
-    # Create tables and seed data
-    with app.app_context():
-        db.create_all()
-        from app.utils.seed import seed_admin_user
-        seed_admin_user()
+    # Local convenience only: production runs `flask init-db` once per
+    # deploy so workers start without touching the database.
+    if app.config['DB_AUTO_INIT']:
+        with app.app_context():
+            db.create_all()
+            from app.utils.seed import seed_admin_user
+            seed_admin_user()
+    
+    return app
+
+def reset_after_fork(app):
+    """Drop process-local state inherited from a preloading parent."""
+    from app.utils.home_snapshot import home_snapshot
+    from app.utils.passwords import password_hasher
+    from app.utils.pool_metrics import reset_pool_stats
+    from app.utils.request_metrics import request_metrics
+    from app.utils.slow_queries import slow_query_log
     
-    return app
\ No newline at end of file
+    with app.app_context():
+        for engine in db.engines.values():
+            # Leave the parent's sockets alone; just stop sharing them
+            engine.dispose(close=False)
+        # Render the homepage off the request path before traffic arrives
+        home_snapshot.warm()
+    password_hasher.shutdown()
+    reset_pool_stats()
+    request_metrics.reset()
+    slow_query_log.reset()
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Flask CLI commands for one-off database tasks."""
+import json
+import click
+from flask import current_app
+from flask_migrate import stamp, upgrade
+
+from app.extensions import db
+from app.utils.seed import seed_admin_user
+
+# Revision matching the schema db.create_all() produced before migrations
+BASELINE_REVISION = '5a1d3c2b9e01'
+
+# Keys of app.utils.archiving.ARCHIVE_POLICIES; commands import their
+# helpers lazily so create_app does not load them for every worker
+ARCHIVE_TABLES = ('students', 'registrations')
+
+def _adopt_unversioned_database():
+    """Stamp a database created by db.create_all() so upgrades can run."""
+    tables = set(db.inspect(db.engine).get_table_names())
+    if not tables or 'alembic_version' in tables:
+        return
+    
+    if set(db.metadata.tables) <= tables:
+        stamp(revision='head')
+    else:
+        stamp(revision=BASELINE_REVISION)
+
+@click.command('init-db')
+def init_db_command():
+    """Create or upgrade the schema and seed the default admin."""
+    _adopt_unversioned_database()
+    upgrade()
+    seed_admin_user()
+
+@click.command('seed-admin')
+def seed_admin_command():
+    """Seed the default admin user if no users exist."""
+    seed_admin_user()
+
+@click.command('export-static')
+@click.option('--output', type=click.Path(file_okay=False), help='Directory to write (default: STATIC_EXPORT_DIR).')
+@click.option('--full', is_flag=True, help='Re-render every file, not just groups whose tables changed.')
+def export_static_command(output, full):
+    """Render public endpoints into static JSON files."""
+    from app.utils.static_export import static_exporter
+    
+    if not (output or current_app.config['STATIC_EXPORT_DIR']):
+        raise click.UsageError('Pass --output or set STATIC_EXPORT_DIR.')
+    
+    summary = static_exporter.export(output, full=full)
+    click.echo(
+        f"Export version {summary['version']}: {summary['written']} written, "
+        f"{summary['unchanged']} unchanged, {summary['removed']} removed "
+        f"(groups: {', '.join(summary['groups']) or 'none'})"
+    )
+
+@click.command('profile-token')
+@click.option('--minutes', default=10, show_default=True, help='How long the token stays valid.')
+def profile_token_command(minutes):
+    """Print an X-Profile header value that profiles requests."""
+    from app.utils.profiler import make_profile_token
+    
+    secret = current_app.config['PROFILE_SECRET'] or current_app.config['SECRET_KEY']
+    click.echo(make_profile_token(secret, minutes * 60))
+
+@click.command('index-advisor')
+@click.option('--json', 'as_json', is_flag=True, help='Print the full report as JSON.')
+@click.option('--no-slow-log', is_flag=True, help='Only check the built-in hot query shapes.')
+def index_advisor_command(as_json, no_slow_log):
+    """EXPLAIN hot and logged query shapes; report missing and unused indexes."""
+    from app.utils.index_advisor import advise
+    
+    report = advise(include_log=not no_slow_log)
+    if as_json:
+        click.echo(json.dumps(report, indent=2))
+        return
+    
+    click.echo(f"Checked {len(report['shapes'])} query shapes on {report['dialect']}.")
+    for shape in report['shapes']:
+        if shape.get('error'):
+            click.echo(f"  ? {shape['name']} ({shape['source']}): EXPLAIN failed: {shape['error']}")
+        elif shape['problems']:
+            click.echo(f"  ! {shape['name']} ({shape['source']}): {'; '.join(shape['problems'])}")
+    if not report['missing']:
+        click.echo('No full scans or uncovered sorts.')
+    for index in report['unused']:
+        click.echo(f"  - unused index {index['index']} on {index['table']}")
+
+@click.command('archive')
+@click.option('--table', 'tables', multiple=True, type=click.Choice(ARCHIVE_TABLES), help='Table to archive (repeatable; default: all).')
+@click.option('--retention-days', type=int, help='Archive rows older than this (default: ARCHIVE_RETENTION_DAYS).')
+@click.option('--batch-size', type=int, help='Rows per transaction (default: ARCHIVE_BATCH_SIZE).')
+@click.option('--pause', type=float, help='Seconds to sleep between batches (default: ARCHIVE_BATCH_PAUSE).')
+@click.option('--max-batches', type=int, help='Stop after this many batches per table.')
+@click.option('--dry-run', is_flag=True, help='Only count the rows that would move.')
+def archive_command(tables, retention_days, batch_size, pause, max_batches, dry_run):
+    """Move finished students and reviewed registrations to the archive tables."""
+    from app.utils.archiving import archive
+    
+    moved = archive(tables, retention_days, batch_size, pause, max_batches, dry_run)
+    for name, count in moved.items():
+        click.echo(f"{name}: {count} {'eligible' if dry_run else 'archived'}")
+
+def register_commands(app):
+    """Attach the CLI commands to the app."""
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(seed_admin_command)
+    app.cli.add_command(export_static_command)
+    app.cli.add_command(profile_token_command)
+    app.cli.add_command(index_advisor_command)
+    app.cli.add_command(archive_command)
\ No newline at end of file
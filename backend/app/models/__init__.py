@@ -5,5 +5,11 @@ from app.models.student import Student
 from app.models.teacher import Teacher
 from app.models.material import Material
 from app.models.schedule import Schedule
+from app.models.revoked_token import RevokedToken
+from app.models.rollover import Rollover, RolloverStudent, RolloverSchedule
+from app.models.archived_student import ArchivedStudent
+from app.models.archived_student_registration import ArchivedStudentRegistration
 
-__all__ = ['User', 'StudentRegistration', 'Student', 'Teacher', 'Material', 'Schedule']
\ No newline at end of file
+__all__ = ['User', 'StudentRegistration', 'Student', 'Teacher', 'Material', 'Schedule', 'RevokedToken',
+           'Rollover', 'RolloverStudent', 'RolloverSchedule', 'ArchivedStudent',
+           'ArchivedStudentRegistration']
\ No newline at end of file
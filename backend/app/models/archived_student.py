@@ -0,0 +1,48 @@
+"""Cold storage for students who have left the school."""
+from datetime import datetime
+from app.extensions import db
+from app.models.student import Student
+
+class ArchivedStudent(db.Model):
+    """Graduated or transferred student moved out of the hot students table.
+    
+    Columns mirror :class:`Student` (including its primary key) so rows can
+    be copied across with a single ``INSERT ... SELECT`` in either direction.
+    """
+    __tablename__ = 'archived_students'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    student_id = db.Column(db.String(20), unique=True, nullable=False, index=True)
+    first_name = db.Column(db.String(50), nullable=False)
+    last_name = db.Column(db.String(50), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    phone = db.Column(db.String(20))
+    date_of_birth = db.Column(db.Date, nullable=False)
+    gender = db.Column(db.String(10), nullable=False)
+    address = db.Column(db.Text)
+    enrollment_date = db.Column(db.Date, nullable=False)
+    grade_level = db.Column(db.String(20), nullable=False)
+    section = db.Column(db.String(10))
+    parent_name = db.Column(db.String(100), nullable=False)
+    parent_phone = db.Column(db.String(20), nullable=False)
+    parent_email = db.Column(db.String(120))
+    emergency_contact = db.Column(db.String(100), nullable=False)
+    emergency_phone = db.Column(db.String(20), nullable=False)
+    medical_notes = db.Column(db.Text)
+    status = db.Column(db.String(20))  # graduated, transferred
+    registration_id = db.Column(db.Integer)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    version = db.Column(db.Integer)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    rollover_id = db.Column(db.Integer, db.ForeignKey('rollovers.id'), index=True)
+    
+    def to_dict(self):
+        """Convert archived student to dictionary."""
+        data = Student.to_dict(self)
+        data['archived_at'] = self.archived_at.isoformat() if self.archived_at else None
+        data['rollover_id'] = self.rollover_id
+        return data
+    
+    def __repr__(self):
+        return f'<ArchivedStudent {self.student_id}: {self.first_name} {self.last_name}>'
\ No newline at end of file
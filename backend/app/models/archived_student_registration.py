@@ -0,0 +1,45 @@
+"""Cold storage for reviewed registrations."""
+from datetime import datetime
+from app.extensions import db
+from app.models.student_registration import StudentRegistration
+
+class ArchivedStudentRegistration(db.Model):
+    """Approved or rejected registration moved out of the hot table.
+    
+    Columns mirror :class:`StudentRegistration`, like
+    :class:`~app.models.archived_student.ArchivedStudent` does for students.
+    """
+    __tablename__ = 'archived_student_registrations'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    first_name = db.Column(db.String(50), nullable=False)
+    last_name = db.Column(db.String(50), nullable=False)
+    email = db.Column(db.String(120), nullable=False, index=True)
+    phone = db.Column(db.String(20), nullable=False)
+    date_of_birth = db.Column(db.Date, nullable=False)
+    gender = db.Column(db.String(10), nullable=False)
+    address = db.Column(db.Text, nullable=False)
+    parent_name = db.Column(db.String(100), nullable=False)
+    parent_phone = db.Column(db.String(20), nullable=False)
+    parent_email = db.Column(db.String(120))
+    previous_school = db.Column(db.String(200))
+    grade_applying = db.Column(db.String(20), nullable=False)
+    emergency_contact = db.Column(db.String(100), nullable=False)
+    emergency_phone = db.Column(db.String(20), nullable=False)
+    medical_notes = db.Column(db.Text)
+    status = db.Column(db.String(20))  # approved, rejected
+    admin_notes = db.Column(db.Text)
+    reviewed_by = db.Column(db.Integer)
+    reviewed_at = db.Column(db.DateTime)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    
+    def to_dict(self):
+        """Convert archived registration to dictionary."""
+        data = StudentRegistration.to_dict(self)
+        data['archived_at'] = self.archived_at.isoformat() if self.archived_at else None
+        return data
+    
+    def __repr__(self):
+        return f'<ArchivedStudentRegistration {self.first_name} {self.last_name}>'
\ No newline at end of file
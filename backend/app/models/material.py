@@ -24,6 +24,17 @@ class Material(db.Model):
     uploaded_by = db.Column(db.Integer, db.ForeignKey('users.id'))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = db.Column(db.Integer, nullable=False, server_default=db.text('1'))
+    
+    __table_args__ = (
+        # Admin list (newest first) and the public list, homepage and filters
+        db.Index('ix_materials_created_at', 'created_at'),
+        db.Index('ix_materials_public_created_at', 'created_at',
+                 postgresql_where=db.text('is_public'), sqlite_where=db.text('is_public = 1')),
+        db.Index('ix_materials_public_subject_grade_level', 'subject', 'grade_level', 'created_at',
+                 postgresql_where=db.text('is_public'), sqlite_where=db.text('is_public = 1')),
+    )
+    __mapper_args__ = {'version_id_col': version}
     
     # Relationship
     uploader = db.relationship('User', backref='materials_uploaded')
@@ -48,7 +59,8 @@ class Material(db.Model):
             'view_count': self.view_count,
             'uploaded_by': self.uploaded_by,
             'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'version': self.version
         }
     
     def __repr__(self):
@@ -0,0 +1,17 @@
+"""Revoked JWT model."""
+from datetime import datetime
+from app.extensions import db
+
+class RevokedToken(db.Model):
+    """Revoked JWT, kept until the token itself expires."""
+    __tablename__ = 'revoked_tokens'
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=False, index=True)
+    token_type = db.Column(db.String(10), nullable=False)  # access, refresh
+    user_identity = db.Column(db.String(50))
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f'<RevokedToken {self.jti}>'
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Academic year rollover and its undo snapshot."""
+from datetime import datetime
+from app.extensions import db
+
+class Rollover(db.Model):
+    """One academic year rollover run."""
+    __tablename__ = 'rollovers'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    grade_map = db.Column(db.JSON, nullable=False)
+    effective_date = db.Column(db.Date, nullable=False)
+    counts = db.Column(db.JSON)
+    performed_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    undone_at = db.Column(db.DateTime)
+    
+    def to_dict(self):
+        """Convert rollover to dictionary."""
+        return {
+            'id': self.id,
+            'grade_map': self.grade_map,
+            'effective_date': self.effective_date.isoformat() if self.effective_date else None,
+            'counts': self.counts,
+            'performed_by': self.performed_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'undone_at': self.undone_at.isoformat() if self.undone_at else None
+        }
+    
+    def __repr__(self):
+        return f'<Rollover {self.id} ({self.effective_date})>'
+
+class RolloverStudent(db.Model):
+    """A student's grade and status before a rollover changed them."""
+    __tablename__ = 'rollover_students'
+    
+    rollover_id = db.Column(db.Integer, db.ForeignKey('rollovers.id'), primary_key=True)
+    student_id = db.Column(db.Integer, primary_key=True)
+    grade_level = db.Column(db.String(20), nullable=False)
+    status = db.Column(db.String(20))
+
+class RolloverSchedule(db.Model):
+    """A schedule's end date before a rollover expired it."""
+    __tablename__ = 'rollover_schedules'
+    
+    rollover_id = db.Column(db.Integer, db.ForeignKey('rollovers.id'), primary_key=True)
+    schedule_id = db.Column(db.Integer, primary_key=True)
+    effective_until = db.Column(db.Date)
\ No newline at end of file
@@ -23,10 +23,27 @@ class Schedule(db.Model):
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = db.Column(db.Integer, nullable=False, server_default=db.text('1'))
+    
+    __table_args__ = (
+        # Public timetable filters, the admin list and the teacher join
+        db.Index('ix_schedules_grade_level_section_day_of_week', 'grade_level', 'section', 'day_of_week', 'start_time'),
+        db.Index('ix_schedules_created_at', 'created_at'),
+        db.Index('ix_schedules_teacher_id', 'teacher_id'),
+    )
+    __mapper_args__ = {'version_id_col': version}
     
     # Relationships
     creator = db.relationship('User', backref='schedules_created')
     
+    @classmethod
+    def in_effect(cls, on):
+        """SQL condition for schedules running on date ``on``."""
+        return db.and_(
+            db.or_(cls.effective_from.is_(None), cls.effective_from <= on),
+            db.or_(cls.effective_until.is_(None), cls.effective_until >= on)
+        )
+    
     def to_dict(self):
         """Convert schedule to dictionary."""
         return {
@@ -46,7 +63,8 @@ class Schedule(db.Model):
             'effective_from': self.effective_from.isoformat() if self.effective_from else None,
             'effective_until': self.effective_until.isoformat() if self.effective_until else None,
             'created_by': self.created_by,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'version': self.version
         }
     
     def __repr__(self):
@@ -28,6 +28,15 @@ class Student(db.Model):
     registration_id = db.Column(db.Integer, db.ForeignKey('student_registrations.id'))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Optimistic concurrency: bumped on every UPDATE, sent as the ETag
+    version = db.Column(db.Integer, nullable=False, server_default=db.text('1'))
+    
+    __table_args__ = (
+        # Admin list: optional status/grade filters, ordered by last name
+        db.Index('ix_students_status_grade_level_last_name', 'status', 'grade_level', 'last_name'),
+        db.Index('ix_students_last_name', 'last_name'),
+    )
+    __mapper_args__ = {'version_id_col': version}
     
     # Relationships
     registration = db.relationship('StudentRegistration', backref='student_record')
@@ -56,7 +65,8 @@ class Student(db.Model):
             'medical_notes': self.medical_notes,
             'status': self.status,
             'registration_id': self.registration_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'version': self.version
         }
     
     def __repr__(self):
@@ -29,6 +29,11 @@ class StudentRegistration(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Admin list by status (newest first) and the pending count
+        db.Index('ix_student_registrations_status_created_at', 'status', 'created_at'),
+    )
+    
     # Relationship
     reviewer = db.relationship('User', backref='registrations_reviewed')
     
@@ -23,10 +23,27 @@ class Teacher(db.Model):
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = db.Column(db.Integer, nullable=False, server_default=db.text('1'))
+    
+    __table_args__ = (
+        # Admin list, sorted by name or by department and name
+        db.Index('ix_teachers_last_name', 'last_name'),
+        db.Index('ix_teachers_department_last_name', 'department', 'last_name'),
+        # The public list only shows active teachers, by department or all of them
+        db.Index('ix_teachers_active_department_last_name', 'department', 'last_name',
+                 postgresql_where=db.text('is_active'), sqlite_where=db.text('is_active = 1')),
+        db.Index('ix_teachers_active_last_name', 'last_name',
+                 postgresql_where=db.text('is_active'), sqlite_where=db.text('is_active = 1')),
+    )
+    __mapper_args__ = {'version_id_col': version}
     
     # Relationships
     schedules = db.relationship('Schedule', backref='teacher', lazy='dynamic')
     
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}"
+    
     def to_dict(self):
         """Convert teacher to dictionary."""
         return {
@@ -47,7 +64,8 @@ class Teacher(db.Model):
             'bio': self.bio,
             'profile_image': self.profile_image,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'version': self.version
         }
     
     def __repr__(self):
@@ -1,7 +1,7 @@
 """User model for admin authentication."""
 from datetime import datetime
 from app.extensions import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.utils.passwords import password_hasher
 
 class User(db.Model):
     """Admin user model."""
@@ -20,11 +20,15 @@ class User(db.Model):
     
     def set_password(self, password):
         """Hash and set user password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
         """Check if password matches."""
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """Check if the stored hash uses outdated parameters."""
+        return password_hasher.needs_rehash(self.password_hash)
     
     def to_dict(self):
         """Convert user to dictionary."""
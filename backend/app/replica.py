@@ -0,0 +1,158 @@
+"""Read-replica routing for the database session."""
+import threading
+import time
+from contextlib import contextmanager
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+from sqlalchemy.sql.dml import UpdateBase
+
+REPLICA_BIND = 'replica'
+STICKY_COOKIE = 'read_primary_until'
+
+# Blueprints whose GET requests read from the replica unless a view opts out
+REPLICA_BLUEPRINTS = ('public',)
+
+class RoutingSession(Session):
+    """Session that sends reads to the replica when the request allows it.
+
+    Flushes, DML statements and every read after this session has written
+    go to the primary, so a request always sees its own writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing
+                and not isinstance(clause, UpdateBase)
+                and not self.info.get('primary_pinned')
+                and _request_reads_replica()):
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def _request_reads_replica():
+    return has_request_context() and g.get('read_replica', False)
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _pin_to_primary_after_flush(session, flush_context):
+    _pin_to_primary(session)
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _pin_to_primary_after_dml(orm_execute_state):
+    if not orm_execute_state.is_select:
+        # Counter updates (e.g. view counts) opt out of the sticky cookie
+        sticky = orm_execute_state.execution_options.get('sticky_primary', True)
+        _pin_to_primary(orm_execute_state.session, sticky)
+
+def _pin_to_primary(session, sticky=True):
+    session.info['primary_pinned'] = True
+    if sticky and has_request_context():
+        g.wrote_to_primary = True
+
+# ==================== VIEW DECORATORS ====================
+
+def replica_reads(view):
+    """Let a view read from the replica (e.g. admin reporting endpoints)."""
+    view._replica_reads = True
+    return view
+
+def primary_reads(view):
+    """Keep a view on the primary (read-your-writes endpoints)."""
+    view._replica_reads = False
+    return view
+
+@contextmanager
+def reading_primary():
+    """Force reads inside the block to the primary (e.g. auth checks)."""
+    if not has_request_context():
+        yield
+        return
+    previous = g.get('read_replica', False)
+    g.read_replica = False
+    try:
+        yield
+    finally:
+        g.read_replica = previous
+
+# ==================== LAG MONITOR ====================
+
+class ReplicaMonitor:
+    """Caches the replica's replication lag for a few seconds per worker."""
+
+    LAG_QUERIES = {
+        'postgresql': (
+            "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+            "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+        ),
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self._healthy = False
+        self.lag_seconds = None
+
+    def healthy(self, engine):
+        """Return True if the replica is reachable and within the lag budget."""
+        config = current_app.config
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < config['REPLICA_LAG_CHECK_SECONDS']:
+            return self._healthy
+        
+        with self._lock:
+            if self._checked_at is None or now - self._checked_at >= config['REPLICA_LAG_CHECK_SECONDS']:
+                self.lag_seconds = self._measure_lag(engine)
+                self._healthy = (
+                    self.lag_seconds is not None
+                    and self.lag_seconds <= config['REPLICA_MAX_LAG_SECONDS']
+                )
+                self._checked_at = now
+        return self._healthy
+
+    def _measure_lag(self, engine):
+        query = self.LAG_QUERIES.get(engine.dialect.name, 'SELECT 0')
+        try:
+            with engine.connect() as connection:
+                return float(connection.execute(text(query)).scalar() or 0)
+        except Exception:
+            current_app.logger.warning('Replica lag check failed; reading from primary', exc_info=True)
+            return None
+
+replica_monitor = ReplicaMonitor()
+
+# ==================== REQUEST HOOKS ====================
+
+def init_app(app, db):
+    """Decide per request whether reads may use the replica."""
+    app.config.setdefault('REPLICA_MAX_LAG_SECONDS', 10)
+    app.config.setdefault('REPLICA_LAG_CHECK_SECONDS', 5)
+    app.config.setdefault('REPLICA_STICKY_SECONDS', 5)
+    
+    if not app.config.get('SQLALCHEMY_BINDS', {}).get(REPLICA_BIND):
+        return
+    
+    @app.before_request
+    def choose_read_database():
+        view = app.view_functions.get(request.endpoint)
+        wants_replica = getattr(view, '_replica_reads', None)
+        if wants_replica is None:
+            wants_replica = request.method == 'GET' and request.blueprint in REPLICA_BLUEPRINTS
+        if not wants_replica:
+            return
+        
+        # A client that just wrote keeps reading from the primary briefly
+        sticky_until = request.cookies.get(STICKY_COOKIE, type=float)
+        if sticky_until and sticky_until > time.time():
+            return
+        
+        g.read_replica = replica_monitor.healthy(db.engines[REPLICA_BIND])
+    
+    @app.after_request
+    def remember_recent_write(response):
+        if g.get('wrote_to_primary'):
+            seconds = app.config['REPLICA_STICKY_SECONDS']
+            response.set_cookie(
+                STICKY_COOKIE, str(time.time() + seconds),
+                max_age=seconds, httponly=True, samesite='Lax'
+            )
+        return response
\ No newline at end of file
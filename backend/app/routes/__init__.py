@@ -1,6 +1,25 @@
 """API routes."""
-from app.routes.auth import auth_bp
-from app.routes.public import public_bp
-from app.routes.admin import admin_bp
+from werkzeug.utils import import_string
 
-__all__ = ['auth_bp', 'public_bp', 'admin_bp']
\ No newline at end of file
+# Blueprints are listed by import path so that importing this package does
+# not import every route module; each is imported when it is registered.
+BLUEPRINTS = (
+    ('app.routes.auth:auth_bp', '/api/auth'),
+    ('app.routes.public:public_bp', '/api/public'),
+    ('app.routes.admin:admin_bp', '/api/admin'),
+    ('app.routes.metrics:metrics_bp', '/api/metrics'),
+    ('app.routes.batch:batch_bp', '/api/batch'),
+)
+
+def register_blueprints(app):
+    """Import and register every API blueprint."""
+    for import_name, url_prefix in BLUEPRINTS:
+        app.register_blueprint(import_string(import_name), url_prefix=url_prefix)
+
+def __getattr__(name):
+    for import_name, _ in BLUEPRINTS:
+        if import_name.endswith(f':{name}'):
+            return import_string(import_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['auth_bp', 'public_bp', 'admin_bp', 'metrics_bp', 'batch_bp', 'register_blueprints']
\ No newline at end of file
@@ -1,6 +1,8 @@
 """Admin API routes (JWT authentication required)."""
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, current_app, request, jsonify, send_file
+from sqlalchemy.exc import IntegrityError
+from flask_jwt_extended import jwt_required
+from sqlalchemy import select
 from datetime import datetime, date
 
 from app.extensions import db
@@ -10,14 +12,74 @@ from app.models.student import Student
 from app.models.teacher import Teacher
 from app.models.material import Material
 from app.models.schedule import Schedule
+from app.models.rollover import Rollover
 from app.utils.validators import validate_email, validate_phone, validate_required
 from app.utils.helpers import generate_student_id, generate_teacher_id
+from app.utils.auth import current_admin
+from app.utils.query_budget import query_budget
+from app.utils.slow_queries import slow_query_log
+from app.utils.profiler import request_profiler
+from app.utils.archiving import union_archived
+from app.utils.list_query import ListSpec
+from app.utils.versioning import current_version, etag, expected_versions, first_with_version, update_returning
+from app.utils.bulk import BulkRequestError, bulk_conditions, bulk_delete, bulk_update, bulk_values
+from app.utils.rollover import DEFAULT_GRADE_MAP, preview_rollover, run_rollover, undo_rollover, validate_grade_map
+from app.replica import replica_reads
+from app.serializers import (
+    USER_PLAN, REGISTRATION_PLAN, STUDENT_PLAN, TEACHER_PLAN, MATERIAL_PLAN, SCHEDULE_PLAN,
+    requested_plan
+)
 
 admin_bp = Blueprint('admin', __name__)
 
+def include_archived():
+    """True if the request asks for archived rows as well (``?include_archived=1``)."""
+    return request.args.get('include_archived', '').lower() in ('1', 'true')
+
+def versioned_detail(plan, model, row_id, noun):
+    """Detail response for one versioned row, with its version as the ETag."""
+    plan = requested_plan(plan)
+    data, version = first_with_version(plan, model, plan.select().where(model.id == row_id))
+    if data is None:
+        return jsonify({'success': False, 'message': f'{noun} not found'}), 404
+    
+    return jsonify({'success': True, 'data': data}), 200, {'ETag': etag(version)}
+
+def versioned_update(plan, model, row_id, values, noun):
+    """Apply an edit as one UPDATE ... RETURNING, honouring If-Match."""
+    if not values:
+        # A no-op would still bump the version and fail other editors' If-Match
+        return jsonify({'success': False, 'message': 'No updatable fields provided'}), 400
+    
+    plan = requested_plan(plan)
+    versions = expected_versions(request.if_match)
+    try:
+        data, version = update_returning(plan, model, row_id, values, versions)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'{noun} conflicts with existing data'}), 409
+    
+    if data is None:
+        version = current_version(model, row_id) if versions is not None else None
+        if version is None:
+            return jsonify({'success': False, 'message': f'{noun} not found'}), 404
+        return jsonify({
+            'success': False,
+            'message': f'{noun} was changed by someone else; reload and try again'
+        }), 412, {'ETag': etag(version)}
+    
+    return jsonify({
+        'success': True,
+        'message': f'{noun} updated successfully',
+        'data': data
+    }), 200, {'ETag': etag(version)}
+
 # ==================== DASHBOARD STATS ====================
 
 @admin_bp.route('/dashboard/stats', methods=['GET'])
+@query_budget(9)
+@replica_reads
 @jwt_required()
 def get_dashboard_stats():
     """Get dashboard statistics."""
@@ -27,11 +89,12 @@ def get_dashboard_stats():
         'pending_registrations': StudentRegistration.query.filter_by(status='pending').count(),
         'total_materials': Material.query.filter_by(is_public=True).count(),
         'total_schedules': Schedule.query.count(),
-        'recent_registrations': [
-            r.to_dict() for r in StudentRegistration.query.filter_by(status='pending')
+        'recent_registrations': REGISTRATION_PLAN.all(
+            REGISTRATION_PLAN.select()
+            .where(StudentRegistration.status == 'pending')
             .order_by(StudentRegistration.created_at.desc())
-            .limit(5).all()
-        ]
+            .limit(5)
+        )
     }
     
     return jsonify({'success': True, 'data': stats}), 200
@@ -39,16 +102,19 @@ def get_dashboard_stats():
 # ==================== USER MANAGEMENT ====================
 
 @admin_bp.route('/users', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 def get_users():
     """Get all admin users."""
-    users = User.query.all()
+    plan = requested_plan(USER_PLAN)
+    users = plan.all(plan.select())
     return jsonify({
         'success': True,
-        'data': [u.to_dict() for u in users]
+        'data': users
     }), 200
 
 @admin_bp.route('/users', methods=['POST'])
+@query_budget(8)
 @jwt_required()
 def create_user():
     """Create new admin user."""
@@ -86,6 +152,7 @@ def create_user():
     }), 201
 
 @admin_bp.route('/users/<int:user_id>', methods=['PUT'])
+@query_budget(7)
 @jwt_required()
 def update_user(user_id):
     """Update admin user."""
@@ -115,10 +182,11 @@ def update_user(user_id):
     }), 200
 
 @admin_bp.route('/users/<int:user_id>', methods=['DELETE'])
+@query_budget(5)
 @jwt_required()
 def delete_user(user_id):
     """Delete admin user."""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_admin.id
     
     if current_user_id == user_id:
         return jsonify({'success': False, 'message': 'Cannot delete yourself'}), 400
@@ -135,6 +203,7 @@ def delete_user(user_id):
 # ==================== STUDENT REGISTRATIONS ====================
 
 @admin_bp.route('/registrations', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 def get_registrations():
     """Get all student registrations."""
@@ -142,19 +211,26 @@ def get_registrations():
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    query = StudentRegistration.query
+    plan = requested_plan(REGISTRATION_PLAN)
+    query = plan.select()
     
     if status:
-        query = query.filter_by(status=status)
+        query = query.where(StudentRegistration.status == status)
     
-    pagination = query.order_by(StudentRegistration.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    if include_archived():
+        pagination = plan.paginate(
+            union_archived(query, StudentRegistration, StudentRegistration.created_at.desc()), page, per_page
+        )
+    else:
+        paginate = plan.paginate_json if current_app.config['DB_JSON_ASSEMBLY'] else plan.paginate
+        pagination = paginate(
+            query.order_by(StudentRegistration.created_at.desc()), page, per_page
+        )
     
     return jsonify({
         'success': True,
         'data': {
-            'registrations': [r.to_dict() for r in pagination.items],
+            'registrations': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page
@@ -162,10 +238,11 @@ def get_registrations():
     }), 200
 
 @admin_bp.route('/registrations/<int:reg_id>/approve', methods=['POST'])
+@query_budget(9)
 @jwt_required()
 def approve_registration(reg_id):
     """Approve student registration and create student record."""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_admin.id
     registration = StudentRegistration.query.get(reg_id)
     
     if not registration:
@@ -218,10 +295,11 @@ def approve_registration(reg_id):
     }), 200
 
 @admin_bp.route('/registrations/<int:reg_id>/reject', methods=['POST'])
+@query_budget(5)
 @jwt_required()
 def reject_registration(reg_id):
     """Reject student registration."""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_admin.id
     registration = StudentRegistration.query.get(reg_id)
     
     if not registration:
@@ -247,7 +325,15 @@ def reject_registration(reg_id):
 
 # ==================== STUDENTS ====================
 
+STUDENT_UPDATABLE_FIELDS = (
+    'first_name', 'last_name', 'email', 'phone', 'gender',
+    'address', 'grade_level', 'section', 'parent_name',
+    'parent_phone', 'parent_email', 'emergency_contact',
+    'emergency_phone', 'medical_notes', 'status'
+)
+
 @admin_bp.route('/students', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 def get_students():
     """Get all students."""
@@ -257,15 +343,16 @@ def get_students():
     grade = request.args.get('grade')
     search = request.args.get('search')
     
-    query = Student.query
+    plan = requested_plan(STUDENT_PLAN)
+    query = plan.select()
     
     if status:
-        query = query.filter_by(status=status)
+        query = query.where(Student.status == status)
     if grade:
-        query = query.filter_by(grade_level=grade)
+        query = query.where(Student.grade_level == grade)
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             db.or_(
                 Student.first_name.ilike(search_filter),
                 Student.last_name.ilike(search_filter),
@@ -274,14 +361,16 @@ def get_students():
             )
         )
     
-    pagination = query.order_by(Student.last_name).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    if include_archived():
+        pagination = plan.paginate(union_archived(query, Student, Student.last_name.asc()), page, per_page)
+    else:
+        paginate = plan.paginate_json if current_app.config['DB_JSON_ASSEMBLY'] else plan.paginate
+        pagination = paginate(query.order_by(Student.last_name), page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'students': [s.to_dict() for s in pagination.items],
+            'students': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page
@@ -289,6 +378,7 @@ def get_students():
     }), 200
 
 @admin_bp.route('/students', methods=['POST'])
+@query_budget(6)
 @jwt_required()
 def create_student():
     """Create new student directly."""
@@ -345,51 +435,38 @@ def create_student():
     }), 201
 
 @admin_bp.route('/students/<int:student_id>', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 def get_student(student_id):
     """Get single student."""
-    student = Student.query.get(student_id)
+    if not include_archived():
+        return versioned_detail(STUDENT_PLAN, Student, student_id, 'Student')
+    
+    plan = requested_plan(STUDENT_PLAN)
+    student = plan.first(union_archived(plan.select().where(Student.id == student_id), Student))
     if not student:
         return jsonify({'success': False, 'message': 'Student not found'}), 404
     
-    return jsonify({'success': True, 'data': student.to_dict()}), 200
+    return jsonify({'success': True, 'data': student}), 200
 
-@admin_bp.route('/students/<int:student_id>', methods=['PUT'])
+@admin_bp.route('/students/<int:student_id>', methods=['PUT', 'PATCH'])
+@query_budget(4)
 @jwt_required()
 def update_student(student_id):
-    """Update student."""
-    student = Student.query.get(student_id)
-    if not student:
-        return jsonify({'success': False, 'message': 'Student not found'}), 404
-    
-    data = request.get_json()
-    
-    updatable_fields = [
-        'first_name', 'last_name', 'email', 'phone', 'gender',
-        'address', 'grade_level', 'section', 'parent_name',
-        'parent_phone', 'parent_email', 'emergency_contact',
-        'emergency_phone', 'medical_notes', 'status'
-    ]
-    
-    for field in updatable_fields:
-        if field in data:
-            setattr(student, field, data[field])
+    """Update student (send If-Match with the ETag to avoid lost updates)."""
+    data = request.get_json() or {}
+    values = {field: data[field] for field in STUDENT_UPDATABLE_FIELDS if field in data}
     
     if 'date_of_birth' in data:
         try:
-            student.date_of_birth = datetime.strptime(data['date_of_birth'], '%Y-%m-%d').date()
+            values['date_of_birth'] = datetime.strptime(data['date_of_birth'], '%Y-%m-%d').date()
         except ValueError:
             return jsonify({'success': False, 'message': 'Invalid date format'}), 400
     
-    db.session.commit()
-    
-    return jsonify({
-        'success': True,
-        'message': 'Student updated successfully',
-        'data': student.to_dict()
-    }), 200
+    return versioned_update(STUDENT_PLAN, Student, student_id, values, 'Student')
 
 @admin_bp.route('/students/<int:student_id>', methods=['DELETE'])
+@query_budget(5)
 @jwt_required()
 def delete_student(student_id):
     """Delete student."""
@@ -404,21 +481,40 @@ def delete_student(student_id):
 
 # ==================== TEACHERS ====================
 
+TEACHER_UPDATABLE_FIELDS = (
+    'first_name', 'last_name', 'email', 'phone', 'department',
+    'qualification', 'experience_years', 'address', 'bio',
+    'profile_image', 'is_active'
+)
+
+TEACHER_LIST = ListSpec(Teacher, {
+    'teacher_id': ('eq', 'in', 'prefix'),
+    'first_name': ('prefix',),
+    'last_name': ('eq', 'prefix'),
+    'department': ('eq', 'in', 'prefix'),
+    'experience_years': ('eq', 'in', 'range'),
+    'joining_date': ('range',),
+    'is_active': ('eq',),
+}, default_sort='last_name')
+
+def _subjects_text(subjects):
+    return subjects if isinstance(subjects, str) else ','.join(subjects)
+
 @admin_bp.route('/teachers', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 def get_all_teachers():
-    """Get all teachers (including inactive)."""
+    """Get all teachers (including inactive), filtered and sorted per TEACHER_LIST."""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    pagination = Teacher.query.order_by(Teacher.last_name).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    plan = requested_plan(TEACHER_PLAN)
+    pagination = plan.paginate(TEACHER_LIST.apply(plan.select(), request.args), page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'teachers': [t.to_dict() for t in pagination.items],
+            'teachers': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page
@@ -426,6 +522,7 @@ def get_all_teachers():
     }), 200
 
 @admin_bp.route('/teachers', methods=['POST'])
+@query_budget(8)
 @jwt_required()
 def create_teacher():
     """Create new teacher."""
@@ -451,7 +548,7 @@ def create_teacher():
         email=data['email'],
         phone=data['phone'],
         department=data['department'],
-        subjects=data['subjects'] if isinstance(data['subjects'], str) else ','.join(data['subjects']),
+        subjects=_subjects_text(data['subjects']),
         qualification=data.get('qualification'),
         experience_years=data.get('experience_years', 0),
         joining_date=joining_date,
@@ -471,53 +568,33 @@ def create_teacher():
     }), 201
 
 @admin_bp.route('/teachers/<int:teacher_id>', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 def get_teacher_admin(teacher_id):
     """Get single teacher (admin view)."""
-    teacher = Teacher.query.get(teacher_id)
-    if not teacher:
-        return jsonify({'success': False, 'message': 'Teacher not found'}), 404
-    
-    return jsonify({'success': True, 'data': teacher.to_dict()}), 200
+    return versioned_detail(TEACHER_PLAN, Teacher, teacher_id, 'Teacher')
 
-@admin_bp.route('/teachers/<int:teacher_id>', methods=['PUT'])
+@admin_bp.route('/teachers/<int:teacher_id>', methods=['PUT', 'PATCH'])
+@query_budget(4)
 @jwt_required()
 def update_teacher(teacher_id):
-    """Update teacher."""
-    teacher = Teacher.query.get(teacher_id)
-    if not teacher:
-        return jsonify({'success': False, 'message': 'Teacher not found'}), 404
-    
-    data = request.get_json()
-    
-    updatable_fields = [
-        'first_name', 'last_name', 'email', 'phone', 'department',
-        'qualification', 'experience_years', 'address', 'bio',
-        'profile_image', 'is_active'
-    ]
-    
-    for field in updatable_fields:
-        if field in data:
-            setattr(teacher, field, data[field])
+    """Update teacher (send If-Match with the ETag to avoid lost updates)."""
+    data = request.get_json() or {}
+    values = {field: data[field] for field in TEACHER_UPDATABLE_FIELDS if field in data}
     
     if 'subjects' in data:
-        teacher.subjects = data['subjects'] if isinstance(data['subjects'], str) else ','.join(data['subjects'])
+        values['subjects'] = _subjects_text(data['subjects'])
     
     if 'joining_date' in data:
         try:
-            teacher.joining_date = datetime.strptime(data['joining_date'], '%Y-%m-%d').date()
+            values['joining_date'] = datetime.strptime(data['joining_date'], '%Y-%m-%d').date()
         except ValueError:
             return jsonify({'success': False, 'message': 'Invalid date format'}), 400
     
-    db.session.commit()
-    
-    return jsonify({
-        'success': True,
-        'message': 'Teacher updated successfully',
-        'data': teacher.to_dict()
-    }), 200
+    return versioned_update(TEACHER_PLAN, Teacher, teacher_id, values, 'Teacher')
 
 @admin_bp.route('/teachers/<int:teacher_id>', methods=['DELETE'])
+@query_budget(5)
 @jwt_required()
 def delete_teacher(teacher_id):
     """Delete teacher."""
@@ -532,21 +609,38 @@ def delete_teacher(teacher_id):
 
 # ==================== MATERIALS ====================
 
+MATERIAL_UPDATABLE_FIELDS = (
+    'title', 'description', 'subject', 'grade_level', 'material_type',
+    'file_url', 'external_link', 'file_size', 'file_format',
+    'author', 'publisher', 'is_public'
+)
+
+MATERIAL_LIST = ListSpec(Material, {
+    'title': ('prefix',),
+    'subject': ('eq', 'in', 'prefix'),
+    'grade_level': ('eq', 'in'),
+    'material_type': ('eq', 'in'),
+    'is_public': ('eq',),
+    'uploaded_by': ('eq', 'in'),
+    'created_at': ('range',),
+}, default_sort='-created_at')
+
 @admin_bp.route('/materials', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 def get_all_materials():
-    """Get all materials (admin view)."""
+    """Get all materials (admin view), filtered and sorted per MATERIAL_LIST."""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    pagination = Material.query.order_by(Material.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    plan = requested_plan(MATERIAL_PLAN)
+    paginate = plan.paginate_json if current_app.config['DB_JSON_ASSEMBLY'] else plan.paginate
+    pagination = paginate(MATERIAL_LIST.apply(plan.select(), request.args), page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'materials': [m.to_dict() for m in pagination.items],
+            'materials': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page
@@ -554,10 +648,11 @@ def get_all_materials():
     }), 200
 
 @admin_bp.route('/materials', methods=['POST'])
+@query_budget(5)
 @jwt_required()
 def create_material():
     """Create new material."""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_admin.id
     data = request.get_json()
     
     required = ['title', 'subject', 'grade_level', 'material_type']
@@ -591,44 +686,24 @@ def create_material():
     }), 201
 
 @admin_bp.route('/materials/<int:material_id>', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 def get_material_admin(material_id):
     """Get single material (admin view)."""
-    material = Material.query.get(material_id)
-    if not material:
-        return jsonify({'success': False, 'message': 'Material not found'}), 404
-    
-    return jsonify({'success': True, 'data': material.to_dict()}), 200
+    return versioned_detail(MATERIAL_PLAN, Material, material_id, 'Material')
 
-@admin_bp.route('/materials/<int:material_id>', methods=['PUT'])
+@admin_bp.route('/materials/<int:material_id>', methods=['PUT', 'PATCH'])
+@query_budget(4)
 @jwt_required()
 def update_material(material_id):
-    """Update material."""
-    material = Material.query.get(material_id)
-    if not material:
-        return jsonify({'success': False, 'message': 'Material not found'}), 404
-    
-    data = request.get_json()
-    
-    updatable_fields = [
-        'title', 'description', 'subject', 'grade_level', 'material_type',
-        'file_url', 'external_link', 'file_size', 'file_format',
-        'author', 'publisher', 'is_public'
-    ]
-    
-    for field in updatable_fields:
-        if field in data:
-            setattr(material, field, data[field])
-    
-    db.session.commit()
+    """Update material (send If-Match with the ETag to avoid lost updates)."""
+    data = request.get_json() or {}
+    values = {field: data[field] for field in MATERIAL_UPDATABLE_FIELDS if field in data}
     
-    return jsonify({
-        'success': True,
-        'message': 'Material updated successfully',
-        'data': material.to_dict()
-    }), 200
+    return versioned_update(MATERIAL_PLAN, Material, material_id, values, 'Material')
 
 @admin_bp.route('/materials/<int:material_id>', methods=['DELETE'])
+@query_budget(5)
 @jwt_required()
 def delete_material(material_id):
     """Delete material."""
@@ -643,21 +718,33 @@ def delete_material(material_id):
 
 # ==================== SCHEDULES ====================
 
+SCHEDULE_LIST = ListSpec(Schedule, {
+    'subject': ('eq', 'in', 'prefix'),
+    'grade_level': ('eq', 'in'),
+    'section': ('eq', 'in'),
+    'day_of_week': ('eq', 'in'),
+    'start_time': ('range',),
+    'room': ('eq', 'in'),
+    'teacher_id': ('eq', 'in'),
+    'effective_from': ('range',),
+    'effective_until': ('range',),
+}, default_sort='-created_at')
+
 @admin_bp.route('/schedules', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 def get_all_schedules():
-    """Get all schedules (admin view)."""
+    """Get all schedules (admin view), filtered and sorted per SCHEDULE_LIST."""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     
-    pagination = Schedule.query.order_by(Schedule.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    plan = requested_plan(SCHEDULE_PLAN)
+    pagination = plan.paginate(SCHEDULE_LIST.apply(plan.select(), request.args), page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'schedules': [s.to_dict() for s in pagination.items],
+            'schedules': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page
@@ -665,10 +752,11 @@ def get_all_schedules():
     }), 200
 
 @admin_bp.route('/schedules', methods=['POST'])
+@query_budget(6)
 @jwt_required()
 def create_schedule():
     """Create new schedule."""
-    current_user_id = get_jwt_identity()
+    current_user_id = current_admin.id
     data = request.get_json()
     
     required = ['title', 'subject', 'grade_level', 'day_of_week', 'start_time', 'end_time', 'effective_from']
@@ -716,69 +804,55 @@ def create_schedule():
     }), 201
 
 @admin_bp.route('/schedules/<int:schedule_id>', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 def get_schedule_admin(schedule_id):
     """Get single schedule (admin view)."""
-    schedule = Schedule.query.get(schedule_id)
-    if not schedule:
-        return jsonify({'success': False, 'message': 'Schedule not found'}), 404
-    
-    return jsonify({'success': True, 'data': schedule.to_dict()}), 200
+    return versioned_detail(SCHEDULE_PLAN, Schedule, schedule_id, 'Schedule')
 
-@admin_bp.route('/schedules/<int:schedule_id>', methods=['PUT'])
+@admin_bp.route('/schedules/<int:schedule_id>', methods=['PUT', 'PATCH'])
+@query_budget(4)
 @jwt_required()
 def update_schedule(schedule_id):
-    """Update schedule."""
-    schedule = Schedule.query.get(schedule_id)
-    if not schedule:
-        return jsonify({'success': False, 'message': 'Schedule not found'}), 404
-    
-    data = request.get_json()
+    """Update schedule (send If-Match with the ETag to avoid lost updates)."""
+    data = request.get_json() or {}
     
     updatable_fields = [
         'title', 'subject', 'grade_level', 'section', 'day_of_week',
         'room', 'teacher_id', 'description', 'is_recurring'
     ]
-    
-    for field in updatable_fields:
-        if field in data:
-            setattr(schedule, field, data[field])
+    values = {field: data[field] for field in updatable_fields if field in data}
     
     # Parse times
     if 'start_time' in data:
         try:
-            schedule.start_time = datetime.strptime(data['start_time'], '%H:%M').time()
+            values['start_time'] = datetime.strptime(data['start_time'], '%H:%M').time()
         except ValueError:
             return jsonify({'success': False, 'message': 'Invalid start time format'}), 400
     
     if 'end_time' in data:
         try:
-            schedule.end_time = datetime.strptime(data['end_time'], '%H:%M').time()
+            values['end_time'] = datetime.strptime(data['end_time'], '%H:%M').time()
         except ValueError:
             return jsonify({'success': False, 'message': 'Invalid end time format'}), 400
     
     # Parse dates
     if 'effective_from' in data:
         try:
-            schedule.effective_from = datetime.strptime(data['effective_from'], '%Y-%m-%d').date()
+            values['effective_from'] = datetime.strptime(data['effective_from'], '%Y-%m-%d').date()
         except ValueError:
             return jsonify({'success': False, 'message': 'Invalid effective_from date format'}), 400
     
     if 'effective_until' in data:
         try:
-            schedule.effective_until = datetime.strptime(data['effective_until'], '%Y-%m-%d').date() if data['effective_until'] else None
+            values['effective_until'] = datetime.strptime(data['effective_until'], '%Y-%m-%d').date() if data['effective_until'] else None
         except ValueError:
             return jsonify({'success': False, 'message': 'Invalid effective_until date format'}), 400
     
-    db.session.commit()
-    
-    return jsonify({
-        'success': True,
-        'message': 'Schedule updated successfully',
-        'data': schedule.to_dict()
-    }), 200
+    return versioned_update(SCHEDULE_PLAN, Schedule, schedule_id, values, 'Schedule')
 
 @admin_bp.route('/schedules/<int:schedule_id>', methods=['DELETE'])
+@query_budget(5)
 @jwt_required()
 def delete_schedule(schedule_id):
     """Delete schedule."""
@@ -789,4 +863,204 @@ def delete_schedule(schedule_id):
     db.session.delete(schedule)
     db.session.commit()
     
-    return jsonify({'success': True, 'message': 'Schedule deleted successfully'}), 200
\ No newline at end of file
+    return jsonify({'success': True, 'message': 'Schedule deleted successfully'}), 200
+
+# ==================== BULK EDITS ====================
+
+# Unique columns (email) are left out: one value cannot be set on many rows
+BULK_EDITS = {
+    'students': {
+        'model': Student,
+        'filterable': ('status', 'grade_level', 'section'),
+        'updatable': tuple(field for field in STUDENT_UPDATABLE_FIELDS if field != 'email'),
+        'converters': {},
+    },
+    'teachers': {
+        'model': Teacher,
+        'filterable': ('department', 'is_active'),
+        'updatable': tuple(field for field in TEACHER_UPDATABLE_FIELDS if field != 'email') + ('subjects',),
+        'converters': {'subjects': _subjects_text},
+    },
+    'materials': {
+        'model': Material,
+        'filterable': ('subject', 'grade_level', 'material_type', 'is_public', 'uploaded_by'),
+        'updatable': MATERIAL_UPDATABLE_FIELDS,
+        'converters': {},
+    },
+}
+
+@admin_bp.route('/<any(students, teachers, materials):resource>/bulk', methods=['PATCH'])
+@query_budget(5)
+@jwt_required()
+def bulk_update_resource(resource):
+    """Update many students, teachers or materials with one statement."""
+    edit = BULK_EDITS[resource]
+    data = request.get_json() or {}
+    
+    try:
+        conditions = bulk_conditions(edit['model'], data, edit['filterable'])
+        values = bulk_values(data, edit['updatable'], edit['converters'])
+    except BulkRequestError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    try:
+        updated = bulk_update(edit['model'], conditions, values)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'Update conflicts with existing data'}), 409
+    
+    return jsonify({
+        'success': True,
+        'message': f'{updated} {resource} updated',
+        'data': {'updated': updated}
+    }), 200
+
+@admin_bp.route('/<any(students, teachers, materials):resource>/bulk', methods=['DELETE'])
+@query_budget(5)
+@jwt_required()
+def bulk_delete_resource(resource):
+    """Delete many students, teachers or materials with one statement."""
+    edit = BULK_EDITS[resource]
+    data = request.get_json() or {}
+    
+    try:
+        conditions = bulk_conditions(edit['model'], data, edit['filterable'])
+    except BulkRequestError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    if edit['model'] is Teacher:
+        # Same as deleting one teacher: their classes stay, unassigned
+        bulk_update(Schedule, [Schedule.teacher_id.in_(select(Teacher.id).where(*conditions))], {'teacher_id': None})
+    deleted = bulk_delete(edit['model'], conditions)
+    db.session.commit()
+    
+    return jsonify({
+        'success': True,
+        'message': f'{deleted} {resource} deleted',
+        'data': {'deleted': deleted}
+    }), 200
+
+# ==================== ACADEMIC YEAR ====================
+
+@admin_bp.route('/rollover', methods=['POST'])
+@query_budget(11)
+@jwt_required()
+def rollover_academic_year():
+    """Promote students to the next grade and end the current schedules."""
+    data = request.get_json() or {}
+    grade_map = data.get('grade_map', DEFAULT_GRADE_MAP)
+    
+    is_valid, error = validate_grade_map(grade_map)
+    if not is_valid:
+        return jsonify({'success': False, 'message': error}), 400
+    
+    try:
+        effective_date = datetime.strptime(data['effective_date'], '%Y-%m-%d').date() if data.get('effective_date') else date.today()
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': 'Invalid effective_date format. Use YYYY-MM-DD'}), 400
+    
+    if data.get('dry_run'):
+        return jsonify({
+            'success': True,
+            'data': {
+                'grade_map': grade_map,
+                'effective_date': effective_date.isoformat(),
+                'preview': preview_rollover(grade_map, effective_date)
+            }
+        }), 200
+    
+    rollover = run_rollover(grade_map, effective_date, current_admin.id, data.get('expire_schedules', True))
+    db.session.commit()
+    
+    return jsonify({
+        'success': True,
+        'message': 'Academic year rolled over',
+        'data': rollover.to_dict()
+    }), 201
+
+@admin_bp.route('/rollovers', methods=['GET'])
+@query_budget(4)
+@jwt_required()
+def get_rollovers():
+    """Get past rollovers, newest first."""
+    rollovers = Rollover.query.order_by(Rollover.id.desc()).limit(50).all()
+    return jsonify({
+        'success': True,
+        'data': [rollover.to_dict() for rollover in rollovers]
+    }), 200
+
+@admin_bp.route('/rollovers/<int:rollover_id>/undo', methods=['POST'])
+@query_budget(12)
+@jwt_required()
+def undo_academic_year_rollover(rollover_id):
+    """Undo the most recent rollover from its snapshot."""
+    rollover = db.session.get(Rollover, rollover_id)
+    if not rollover:
+        return jsonify({'success': False, 'message': 'Rollover not found'}), 404
+    
+    if rollover.undone_at:
+        return jsonify({'success': False, 'message': 'Rollover has already been undone'}), 400
+    
+    latest = Rollover.query.filter(Rollover.undone_at.is_(None)).order_by(Rollover.id.desc()).first()
+    if latest.id != rollover.id:
+        return jsonify({'success': False, 'message': 'Only the most recent rollover can be undone'}), 400
+    
+    try:
+        undo_rollover(rollover)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'Archived students clash with students added since the rollover'}), 409
+    
+    return jsonify({
+        'success': True,
+        'message': 'Rollover undone',
+        'data': rollover.to_dict()
+    }), 200
+
+# ==================== SLOW QUERIES ====================
+
+SLOW_QUERY_SORTS = ('total_ms', 'max_ms', 'mean_ms', 'count')
+
+@admin_bp.route('/slow-queries', methods=['GET'])
+@query_budget(4)
+@jwt_required()
+def get_slow_queries():
+    """Get the slowest statement shapes from the slow-query log."""
+    limit = request.args.get('limit', 20, type=int)
+    sort = request.args.get('sort', 'total_ms')
+    
+    if sort not in SLOW_QUERY_SORTS:
+        return jsonify({'success': False, 'message': f"sort must be one of: {', '.join(SLOW_QUERY_SORTS)}"}), 400
+    
+    return jsonify({
+        'success': True,
+        'data': {
+            'threshold_ms': current_app.config['SLOW_QUERY_THRESHOLD_MS'],
+            'queries': slow_query_log.worst(max(min(limit, 100), 1), sort)
+        }
+    }), 200
+
+# ==================== PROFILES ====================
+
+@admin_bp.route('/profiles', methods=['GET'])
+@query_budget(4)
+@jwt_required()
+def get_profiles():
+    """Get summaries of saved request profiles, newest first."""
+    return jsonify({
+        'success': True,
+        'data': request_profiler.summaries()
+    }), 200
+
+@admin_bp.route('/profiles/<profile_id>', methods=['GET'])
+@query_budget(4)
+@jwt_required()
+def download_profile(profile_id):
+    """Download a saved profile in pstats format."""
+    path = request_profiler.path_for(profile_id)
+    if not path:
+        return jsonify({'success': False, 'message': 'Profile not found'}), 404
+    
+    return send_file(path, mimetype='application/octet-stream', as_attachment=True, download_name=f'{profile_id}.prof')
\ No newline at end of file
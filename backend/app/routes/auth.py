@@ -2,23 +2,32 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import (
     create_access_token, create_refresh_token,
-    jwt_required, get_jwt_identity, get_jwt
+    jwt_required, get_jwt
 )
 from datetime import datetime
 
 from app.extensions import db, jwt
 from app.models.user import User
+from app.utils.auth import current_admin, load_admin
+from app.utils.revocation import revocation_store
+from app.utils.query_budget import query_budget
 
 auth_bp = Blueprint('auth', __name__)
 
-# JWT token blacklist (for logout)
-blacklist = set()
-
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
-    return jwt_payload['jti'] in blacklist
+    return revocation_store.is_revoked(jwt_payload['jti'])
+
+@jwt.user_lookup_loader
+def load_current_admin(jwt_header, jwt_payload):
+    return load_admin(jwt_payload['sub'])
+
+@jwt.user_lookup_error_loader
+def current_admin_not_found(jwt_header, jwt_payload):
+    return jsonify({'success': False, 'message': 'User not found or inactive'}), 401
 
 @auth_bp.route('/login', methods=['POST'])
+@query_budget(5)
 def login():
     """User login endpoint."""
     data = request.get_json()
@@ -43,8 +52,14 @@ def login():
     if not user.is_active:
         return jsonify({'success': False, 'message': 'Account is deactivated'}), 403
     
-    # Update last login
-    user.last_login = datetime.utcnow()
+    # Upgrade hashes made with older parameters while we have the password
+    if user.password_needs_rehash():
+        user.set_password(password)
+    
+    # Update last login (bookkeeping, so cached admin lookups stay valid)
+    User.query.filter_by(id=user.id).execution_options(bump_stamps=False).update(
+        {User.last_login: datetime.utcnow()}, synchronize_session='evaluate'
+    )
     db.session.commit()
     
     # Create tokens (convert id to string)
@@ -62,16 +77,11 @@ def login():
     }), 200
 
 @auth_bp.route('/refresh', methods=['POST'])
+@query_budget(4)
 @jwt_required(refresh=True)
 def refresh():
     """Refresh access token."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(int(current_user_id))
-    
-    if not user or not user.is_active:
-        return jsonify({'success': False, 'message': 'User not found or inactive'}), 401
-    
-    access_token = create_access_token(identity=str(current_user_id))
+    access_token = create_access_token(identity=str(current_admin.id))
     
     return jsonify({
         'success': True,
@@ -81,11 +91,11 @@ def refresh():
     }), 200
 
 @auth_bp.route('/logout', methods=['POST'])
+@query_budget(5)
 @jwt_required()
 def logout():
     """Logout user (revoke token)."""
-    jti = get_jwt()['jti']
-    blacklist.add(jti)
+    revocation_store.revoke(get_jwt())
     
     return jsonify({
         'success': True,
@@ -93,29 +103,21 @@ def logout():
     }), 200
 
 @auth_bp.route('/me', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 def get_current_user():
     """Get current authenticated user."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    
-    if not user:
-        return jsonify({'success': False, 'message': 'User not found'}), 404
-    
     return jsonify({
         'success': True,
-        'data': user.to_dict()
+        'data': current_admin.to_dict()
     }), 200
 
 @auth_bp.route('/change-password', methods=['POST'])
+@query_budget(5)
 @jwt_required()
 def change_password():
     """Change user password."""
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    
-    if not user:
-        return jsonify({'success': False, 'message': 'User not found'}), 404
+    user = current_admin
     
     data = request.get_json()
     current_password = data.get('current_password')
@@ -0,0 +1,134 @@
+"""Batch API route: several API calls in one HTTP round trip."""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from flask import Blueprint, current_app, g, request, jsonify
+
+from app.extensions import db
+from app.serializers import RawJSON
+
+batch_bp = Blueprint('batch', __name__)
+
+ALLOWED_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE'}
+
+# Request headers each sub-request inherits from the batch request
+FORWARDED_HEADERS = ('Authorization', 'Cookie', 'Accept-Language', 'User-Agent')
+
+def _validate(item):
+    """Return an error message for a malformed sub-request, or None."""
+    if not isinstance(item, dict):
+        return 'Each request must be an object'
+    if str(item.get('method', 'GET')).upper() not in ALLOWED_METHODS:
+        return f"Unsupported method: {item.get('method')}"
+    path = item.get('path')
+    if not isinstance(path, str) or not path.startswith('/api/'):
+        return 'path must start with /api/'
+    if path.split('?')[0].rstrip('/') == request.path.rstrip('/'):
+        return 'Batches cannot be nested'
+    if not isinstance(item.get('query', {}), dict):
+        return 'query must be an object'
+    return None
+
+@contextmanager
+def _isolated_g():
+    # Sub-requests share the batch's app context (and so its DB session),
+    # but per-request state such as the JWT or replica choice must not leak
+    saved = dict(g.__dict__)
+    g.__dict__.clear()
+    try:
+        yield
+    finally:
+        g.__dict__.clear()
+        g.__dict__.update(saved)
+
+def _dispatch(app, item, headers, environ_base):
+    """Run one sub-request through the full Flask pipeline."""
+    method = str(item.get('method', 'GET')).upper()
+    ctx = app.test_request_context(
+        item['path'],
+        method=method,
+        query_string=item.get('query') or None,
+        json=item.get('body') if method != 'GET' else None,
+        headers=headers,
+        environ_base=environ_base
+    )
+    with ctx, _isolated_g():
+        try:
+            response = app.full_dispatch_request()
+        except Exception as error:
+            app.log_exception(error)
+            db.session.rollback()
+            response = jsonify({'success': False, 'message': 'Internal server error'})
+            response.status_code = 500
+    
+    result = {'status': response.status_code}
+    if 'id' in item:
+        result['id'] = item['id']
+    if response.direct_passthrough:
+        # File downloads (send_file) cannot be read back; fetch them directly
+        response.close()
+        result['status'] = 400
+        result['body'] = {'success': False, 'message': 'File downloads cannot be batched; request this path directly'}
+        return result, []
+    if response.is_json:
+        result['body'] = RawJSON(response.get_data(as_text=True).strip())
+    else:
+        result['body'] = response.get_data(as_text=True)
+    return result, response.headers.getlist('Set-Cookie')
+
+def _dispatch_isolated(app, item, headers, environ_base):
+    with app.app_context():
+        return _dispatch(app, item, headers, environ_base)
+
+@batch_bp.route('', methods=['POST'])
+def run_batch():
+    """Run several API requests and return all their responses."""
+    data = request.get_json(silent=True)
+    items = data.get('requests') if isinstance(data, dict) else data
+    
+    if not isinstance(items, list) or not items:
+        return jsonify({'success': False, 'message': 'Provide a non-empty list of requests'}), 400
+    
+    max_requests = current_app.config['BATCH_MAX_REQUESTS']
+    if len(items) > max_requests:
+        return jsonify({'success': False, 'message': f'At most {max_requests} requests per batch'}), 400
+    
+    for index, item in enumerate(items):
+        error = _validate(item)
+        if error:
+            return jsonify({'success': False, 'message': f'Request {index}: {error}'}), 400
+    
+    app = current_app._get_current_object()
+    headers = [(name, request.headers[name]) for name in FORWARDED_HEADERS if name in request.headers]
+    environ_base = {'REMOTE_ADDR': request.remote_addr}
+    parallelism = current_app.config['BATCH_PARALLELISM']
+    
+    results = [None] * len(items)
+    cookies = []
+    index = 0
+    wrote = False
+    while index < len(items):
+        # Runs of GETs before the first write go out in parallel, each in its
+        # own app context; everything else runs in order in this context
+        end = index
+        while not wrote and end < len(items) and str(items[end].get('method', 'GET')).upper() == 'GET':
+            end += 1
+        
+        if parallelism > 1 and end - index > 1:
+            with ThreadPoolExecutor(max_workers=min(parallelism, end - index)) as executor:
+                outcomes = list(executor.map(
+                    lambda item: _dispatch_isolated(app, item, headers, environ_base), items[index:end]
+                ))
+        else:
+            end = max(end, index + 1)
+            outcomes = [_dispatch(app, item, headers, environ_base) for item in items[index:end]]
+            wrote = wrote or any(str(item.get('method', 'GET')).upper() != 'GET' for item in items[index:end])
+        
+        for offset, (result, set_cookies) in enumerate(outcomes):
+            results[index + offset] = result
+            cookies.extend(set_cookies)
+        index = end
+    
+    response = jsonify({'success': True, 'data': results})
+    for cookie in cookies:
+        response.headers.add('Set-Cookie', cookie)
+    return response, 200
\ No newline at end of file
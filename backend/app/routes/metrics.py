@@ -0,0 +1,37 @@
+"""Operational metrics routes."""
+import hmac
+from flask import Blueprint, request, jsonify, current_app
+
+from app.utils.pool_metrics import pool_snapshot
+from app.utils.request_metrics import render_prometheus
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.before_request
+def check_metrics_token():
+    """Require the bearer token; without one configured, fail closed unless anonymous access is allowed."""
+    token = current_app.config.get('METRICS_TOKEN')
+    if not token:
+        if current_app.config.get('METRICS_ALLOW_ANONYMOUS', False):
+            return None
+        return jsonify({'success': False, 'message': 'Metrics require METRICS_TOKEN to be set'}), 403
+    
+    supplied = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+    if not hmac.compare_digest(supplied, token):
+        return jsonify({'success': False, 'message': 'Invalid metrics token'}), 401
+
+@metrics_bp.route('', methods=['GET'])
+def get_prometheus_metrics():
+    """Get request, SQL and pool metrics for all workers (Prometheus text format)."""
+    if not current_app.config['METRICS_ENABLED']:
+        return jsonify({'success': False, 'message': 'Metrics are disabled'}), 404
+    
+    return current_app.response_class(render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+@metrics_bp.route('/pool', methods=['GET'])
+def get_pool_metrics():
+    """Get connection pool gauges and counters for this worker."""
+    return jsonify({
+        'success': True,
+        'data': pool_snapshot()
+    }), 200
\ No newline at end of file
@@ -1,19 +1,35 @@
 """Public API routes (no authentication required)."""
 from flask import Blueprint, request, jsonify
-from datetime import datetime
+from datetime import date, datetime
 
 from app.extensions import db
 from app.models.teacher import Teacher
 from app.models.material import Material
 from app.models.schedule import Schedule
 from app.models.student_registration import StudentRegistration
+from app.models.archived_student_registration import ArchivedStudentRegistration
 from app.utils.validators import validate_email, validate_phone, validate_required
+from app.replica import primary_reads
+from app.utils.response_cache import cached_response
+from app.utils.home_snapshot import home_snapshot
+from app.utils.query_budget import query_budget
+from app.serializers import TEACHER_PLAN, MATERIAL_PLAN, SCHEDULE_PLAN, requested_plan
 
 public_bp = Blueprint('public', __name__)
 
+# ==================== HOME ====================
+
+@public_bp.route('/home', methods=['GET'])
+@query_budget(0)
+def get_home():
+    """Get the pre-rendered landing page payload."""
+    return home_snapshot.response()
+
 # ==================== TEACHERS (PUBLIC VIEW) ====================
 
 @public_bp.route('/teachers', methods=['GET'])
+@query_budget(4)
+@cached_response('teachers')
 def get_teachers():
     """Get all active teachers (public view)."""
     page = request.args.get('page', 1, type=int)
@@ -21,14 +37,15 @@ def get_teachers():
     department = request.args.get('department')
     search = request.args.get('search')
     
-    query = Teacher.query.filter_by(is_active=True)
+    plan = requested_plan(TEACHER_PLAN)
+    query = plan.select().where(Teacher.is_active == True)
     
     if department:
-        query = query.filter_by(department=department)
+        query = query.where(Teacher.department == department)
     
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             db.or_(
                 Teacher.first_name.ilike(search_filter),
                 Teacher.last_name.ilike(search_filter),
@@ -36,14 +53,12 @@ def get_teachers():
             )
         )
     
-    pagination = query.order_by(Teacher.last_name).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    pagination = plan.paginate(query.order_by(Teacher.last_name), page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'teachers': [t.to_dict() for t in pagination.items],
+            'teachers': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page,
@@ -52,19 +67,24 @@ def get_teachers():
     }), 200
 
 @public_bp.route('/teachers/<int:teacher_id>', methods=['GET'])
+@query_budget(3)
+@cached_response('teachers')
 def get_teacher(teacher_id):
     """Get single teacher details."""
-    teacher = Teacher.query.filter_by(id=teacher_id, is_active=True).first()
+    plan = requested_plan(TEACHER_PLAN)
+    teacher = plan.first(plan.select().where(Teacher.id == teacher_id, Teacher.is_active == True))
     
     if not teacher:
         return jsonify({'success': False, 'message': 'Teacher not found'}), 404
     
     return jsonify({
         'success': True,
-        'data': teacher.to_dict()
+        'data': teacher
     }), 200
 
 @public_bp.route('/teachers/departments', methods=['GET'])
+@query_budget(3)
+@cached_response('teachers')
 def get_departments():
     """Get all unique departments."""
     departments = db.session.query(Teacher.department).filter_by(is_active=True).distinct().all()
@@ -77,6 +97,8 @@ def get_departments():
 # ==================== MATERIALS (PUBLIC VIEW) ====================
 
 @public_bp.route('/materials', methods=['GET'])
+@query_budget(4)
+@cached_response('materials')
 def get_materials():
     """Get all public materials."""
     page = request.args.get('page', 1, type=int)
@@ -86,20 +108,21 @@ def get_materials():
     material_type = request.args.get('type')
     search = request.args.get('search')
     
-    query = Material.query.filter_by(is_public=True)
+    plan = requested_plan(MATERIAL_PLAN)
+    query = plan.select().where(Material.is_public == True)
     
     if subject:
-        query = query.filter_by(subject=subject)
+        query = query.where(Material.subject == subject)
     
     if grade_level:
-        query = query.filter_by(grade_level=grade_level)
+        query = query.where(Material.grade_level == grade_level)
     
     if material_type:
-        query = query.filter_by(material_type=material_type)
+        query = query.where(Material.material_type == material_type)
     
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             db.or_(
                 Material.title.ilike(search_filter),
                 Material.description.ilike(search_filter),
@@ -107,14 +130,12 @@ def get_materials():
             )
         )
     
-    pagination = query.order_by(Material.created_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    pagination = plan.paginate(query.order_by(Material.created_at.desc()), page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'materials': [m.to_dict() for m in pagination.items],
+            'materials': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page,
@@ -123,23 +144,28 @@ def get_materials():
     }), 200
 
 @public_bp.route('/materials/<int:material_id>', methods=['GET'])
+@query_budget(4)
 def get_material(material_id):
     """Get single material details."""
-    material = Material.query.filter_by(id=material_id, is_public=True).first()
-    
-    if not material:
-        return jsonify({'success': False, 'message': 'Material not found'}), 404
+    plan = requested_plan(MATERIAL_PLAN)
     
-    # Increment view count
-    material.view_count += 1
+    # Increment view count (a counter, so cached listings are not invalidated
+    # and the visitor is not pinned to the primary)
+    material = Material.query.filter_by(id=material_id, is_public=True).execution_options(bump_stamps=False, sticky_primary=False)
+    viewed = material.update({Material.view_count: Material.view_count + 1}, synchronize_session=False)
     db.session.commit()
     
+    if not viewed:
+        return jsonify({'success': False, 'message': 'Material not found'}), 404
+    
     return jsonify({
         'success': True,
-        'data': material.to_dict()
+        'data': plan.first(plan.select().where(Material.id == material_id))
     }), 200
 
 @public_bp.route('/materials/filters', methods=['GET'])
+@query_budget(5)
+@cached_response('materials')
 def get_material_filters():
     """Get available filter options for materials."""
     subjects = db.session.query(Material.subject).filter_by(is_public=True).distinct().all()
@@ -158,26 +184,29 @@ def get_material_filters():
 # ==================== SCHEDULES (PUBLIC VIEW) ====================
 
 @public_bp.route('/schedules', methods=['GET'])
+@query_budget(4)
+@cached_response('schedules', 'teachers')
 def get_schedules():
-    """Get all public schedules."""
+    """Get all public schedules currently in effect."""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
     grade_level = request.args.get('grade_level')
     section = request.args.get('section')
     day = request.args.get('day')
     
-    query = Schedule.query
+    plan = requested_plan(SCHEDULE_PLAN)
+    query = plan.select().where(Schedule.in_effect(date.today()))
     
     if grade_level:
-        query = query.filter_by(grade_level=grade_level)
+        query = query.where(Schedule.grade_level == grade_level)
     
     if section:
-        query = query.filter_by(section=section)
+        query = query.where(Schedule.section == section)
     
     if day:
-        query = query.filter_by(day_of_week=day)
+        query = query.where(Schedule.day_of_week == day)
     
-    pagination = query.order_by(
+    query = query.order_by(
         db.case(
             (Schedule.day_of_week == 'Monday', 1),
             (Schedule.day_of_week == 'Tuesday', 2),
@@ -188,12 +217,13 @@ def get_schedules():
             (Schedule.day_of_week == 'Sunday', 7),
         ),
         Schedule.start_time
-    ).paginate(page=page, per_page=per_page, error_out=False)
+    )
+    pagination = plan.paginate(query, page, per_page)
     
     return jsonify({
         'success': True,
         'data': {
-            'schedules': [s.to_dict() for s in pagination.items],
+            'schedules': pagination.items,
             'total': pagination.total,
             'pages': pagination.pages,
             'current_page': page,
@@ -202,10 +232,13 @@ def get_schedules():
     }), 200
 
 @public_bp.route('/schedules/filters', methods=['GET'])
+@query_budget(4)
+@cached_response('schedules')
 def get_schedule_filters():
     """Get available filter options for schedules."""
-    grade_levels = db.session.query(Schedule.grade_level).distinct().all()
-    sections = db.session.query(Schedule.section).distinct().all()
+    current = Schedule.in_effect(date.today())
+    grade_levels = db.session.query(Schedule.grade_level).filter(current).distinct().all()
+    sections = db.session.query(Schedule.section).filter(current).distinct().all()
     
     return jsonify({
         'success': True,
@@ -219,6 +252,7 @@ def get_schedule_filters():
 # ==================== STUDENT REGISTRATION ====================
 
 @public_bp.route('/register', methods=['POST'])
+@query_budget(4)
 def register_student():
     """Submit student registration form."""
     data = request.get_json()
@@ -300,6 +334,8 @@ def register_student():
     }), 201
 
 @public_bp.route('/register/check', methods=['GET'])
+@query_budget(2)
+@primary_reads
 def check_registration_status():
     """Check registration status by email."""
     email = request.args.get('email')
@@ -310,6 +346,11 @@ def check_registration_status():
     registration = StudentRegistration.query.filter_by(email=email).order_by(
         StudentRegistration.created_at.desc()
     ).first()
+    if not registration:
+        # Reviewed registrations move to the archive after a while
+        registration = ArchivedStudentRegistration.query.filter_by(email=email).order_by(
+            ArchivedStudentRegistration.created_at.desc()
+        ).first()
     
     if not registration:
         return jsonify({'success': False, 'message': 'No registration found'}), 404
@@ -0,0 +1,13 @@
+"""Response serialization: compiled field plans and the JSON provider."""
+from app.serializers.plan import Field, FieldPlan, Page
+from app.serializers.plans import (
+    USER_PLAN, REGISTRATION_PLAN, STUDENT_PLAN, TEACHER_PLAN, MATERIAL_PLAN, SCHEDULE_PLAN
+)
+from app.serializers.fields import FieldSelectionError, requested_plan
+from app.serializers.json import FastJSONProvider
+from app.serializers.sql_json import RawJSON
+
+__all__ = [
+    'Field', 'FieldPlan', 'Page', 'FastJSONProvider', 'FieldSelectionError', 'requested_plan', 'RawJSON',
+    'USER_PLAN', 'REGISTRATION_PLAN', 'STUDENT_PLAN', 'TEACHER_PLAN', 'MATERIAL_PLAN', 'SCHEDULE_PLAN'
+]
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""Value converters shared by the field plans (mirroring Model.to_dict)."""
+
+def isoformat(value):
+    return value.isoformat() if value else None
+
+def hhmm(value):
+    return value.strftime('%H:%M') if value else None
+
+def csv_list(value):
+    return value.split(',') if value else []
+
+def full_name(first_name, last_name):
+    return f"{first_name} {last_name}"
+
+def optional_full_name(first_name, last_name):
+    return f"{first_name} {last_name}" if first_name is not None else None
\ No newline at end of file
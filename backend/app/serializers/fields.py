@@ -0,0 +1,66 @@
+"""``?fields=`` sparse fieldsets, bounded by per-blueprint whitelists."""
+from flask import request
+
+from app.serializers.plans import (
+    USER_PLAN, REGISTRATION_PLAN, STUDENT_PLAN, TEACHER_PLAN, MATERIAL_PLAN, SCHEDULE_PLAN
+)
+
+class FieldSelectionError(ValueError):
+    """Raised when ``?fields=`` names a field the endpoint cannot return."""
+
+# Every field a blueprint may ever emit for a model. Plans can grow new
+# fields freely; they only reach the public API once listed here.
+FIELD_WHITELISTS = {
+    'public': {
+        TEACHER_PLAN: (
+            'id', 'teacher_id', 'first_name', 'last_name', 'full_name', 'email', 'phone',
+            'department', 'subjects', 'subjects_text', 'qualification', 'experience_years',
+            'joining_date', 'address', 'bio', 'profile_image', 'is_active', 'created_at'
+        ),
+        MATERIAL_PLAN: (
+            'id', 'title', 'description', 'subject', 'grade_level', 'material_type',
+            'file_url', 'external_link', 'file_size', 'file_format', 'author', 'publisher',
+            'is_public', 'download_count', 'view_count', 'uploaded_by', 'created_at', 'updated_at'
+        ),
+        SCHEDULE_PLAN: (
+            'id', 'title', 'subject', 'grade_level', 'section', 'day_of_week', 'start_time',
+            'end_time', 'room', 'teacher_id', 'teacher_name', 'description', 'is_recurring',
+            'effective_from', 'effective_until', 'created_by', 'created_at'
+        ),
+    },
+    'admin': {
+        USER_PLAN: USER_PLAN.keys,
+        REGISTRATION_PLAN: REGISTRATION_PLAN.keys,
+        STUDENT_PLAN: STUDENT_PLAN.keys,
+        TEACHER_PLAN: TEACHER_PLAN.keys,
+        MATERIAL_PLAN: MATERIAL_PLAN.keys,
+        SCHEDULE_PLAN: SCHEDULE_PLAN.keys,
+    },
+}
+
+def parse_fields(value):
+    """Split a ``fields`` parameter into unique, non-empty names."""
+    if not value:
+        return []
+    names = (name.strip() for name in value.split(','))
+    return list(dict.fromkeys(name for name in names if name))
+
+def requested_plan(plan, blueprint=None):
+    """Return the plan narrowed to the request's ``?fields=`` selection.
+    
+    Without ``fields`` the whole whitelist is returned. Plans that a
+    blueprint has no whitelist for cannot be served from it at all.
+    """
+    blueprint = blueprint or request.blueprint
+    allowed = FIELD_WHITELISTS[blueprint][plan]
+    
+    fields = parse_fields(request.args.get('fields'))
+    if not fields:
+        return plan.subset(allowed)
+    
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise FieldSelectionError(
+            f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    return plan.subset(fields)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""Flask JSON provider that encodes with orjson when it is installed."""
+import re
+import secrets
+import time
+from flask.json.provider import DefaultJSONProvider
+
+from app.serializers.sql_json import RawJSON
+from app.utils.request_metrics import record_json_encode
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+def _escape_char(match):
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return '\\u%04x\\u%04x' % (0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return '\\u%04x' % code
+
+def escape_non_ascii(text):
+    """Escape non-ASCII characters as ``\\uXXXX``, as ``json.dumps`` does by default."""
+    return text if text.isascii() else _NON_ASCII.sub(_escape_char, text)
+
+class _RawSplicer:
+    """``default`` hook that swaps RawJSON values for placeholders, then back."""
+    
+    def __init__(self, default):
+        self.default = default
+        self.raw = []
+        self.nonce = secrets.token_hex(8)
+    
+    def __call__(self, obj):
+        if isinstance(obj, RawJSON):
+            self.raw.append(obj.text)
+            return f'{self.nonce}:{len(self.raw) - 1}'
+        return self.default(obj)
+    
+    def splice(self, text):
+        for n, raw in enumerate(self.raw):
+            text = text.replace(f'"{self.nonce}:{n}"', raw, 1)
+        return text
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's provider with the same output keys.
+
+    Datetimes, dataclasses and other non-native types are still routed
+    through Flask's ``default`` so they serialize exactly as before.
+    Pretty-printed (debug) responses keep using the stdlib encoder.
+    :class:`RawJSON` values (arrays encoded by the database) are written
+    out verbatim by either encoder. With ``ensure_ascii`` on (Flask's
+    default) non-ASCII text is escaped after encoding, so orjson, the
+    stdlib fallback and database-built arrays all produce the same bytes.
+    """
+    
+    def _orjson_options(self):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+    
+    def dumps(self, obj, **kwargs):
+        started = time.perf_counter()
+        splicer = _RawSplicer(kwargs.pop('default', self.default))
+        if orjson is None or kwargs:
+            text = super().dumps(obj, default=splicer, **kwargs)
+        else:
+            text = orjson.dumps(obj, default=splicer, option=self._orjson_options()).decode()
+        if splicer.raw:
+            text = splicer.splice(text)
+        if kwargs.get('ensure_ascii', self.ensure_ascii):
+            text = escape_non_ascii(text)
+        record_json_encode(time.perf_counter() - started)
+        return text
+    
+    def response(self, *args, **kwargs):
+        if orjson is None or self._pretty():
+            return super().response(*args, **kwargs)
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        started = time.perf_counter()
+        splicer = _RawSplicer(self.default)
+        body = orjson.dumps(obj, default=splicer, option=self._orjson_options())
+        if splicer.raw:
+            body = splicer.splice(body.decode()).encode()
+        if self.ensure_ascii and not body.isascii():
+            body = escape_non_ascii(body.decode()).encode()
+        record_json_encode(time.perf_counter() - started)
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+    
+    def _pretty(self):
+        return self.compact is False or (self.compact is None and self._app.debug)
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""Compiled field plans that turn Core rows into response dicts."""
+from math import ceil
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from app.extensions import db
+from app.serializers.sql_json import check_json_assembly, json_rows
+
+class Field:
+    """One output key, built from one or more columns."""
+    
+    def __init__(self, key, *columns, convert=None):
+        self.key = key
+        self.columns = columns
+        self.convert = convert
+
+class Page:
+    """A page of hydrated rows with Flask-SQLAlchemy's pagination numbers."""
+    
+    def __init__(self, items, total, page, per_page):
+        self.items = items
+        self.total = total
+        self.page = page
+        self.per_page = per_page
+    
+    @property
+    def pages(self):
+        if not self.total:
+            return 0
+        return ceil(self.total / self.per_page)
+
+def _column_key(column):
+    # Column attributes overload ==, so they cannot be dict keys directly
+    return (getattr(column, 'class_', None), column.key)
+
+class FieldPlan:
+    """Selects exactly the columns a response needs and hydrates rows.
+
+    The plan is compiled once into a generated ``hydrate(row)`` function,
+    so serializing a row is a single dict display with no attribute
+    lookups, lazy loads or per-field branching in Python code.
+    """
+    
+    def __init__(self, model, fields, joins=(), json_assembly=False):
+        self.model = model
+        self.fields = list(fields)
+        self.joins = tuple(joins)
+        # Registered for paginate_json; checked here rather than per request
+        self.json_assembly = json_assembly
+        if json_assembly:
+            check_json_assembly(self)
+        self.keys = [field.key for field in self.fields]
+        self.columns = []
+        self.hydrate = self._compile()
+        self._subsets = {}
+    
+    def _compile(self):
+        positions = {}
+        namespace = {}
+        entries = []
+        for n, field in enumerate(self.fields):
+            args = []
+            for column in field.columns:
+                key = _column_key(column)
+                if key not in positions:
+                    positions[key] = len(self.columns)
+                    self.columns.append(column)
+                args.append(f'row[{positions[key]}]')
+            
+            value = ', '.join(args)
+            if field.convert is not None:
+                namespace[f'convert_{n}'] = field.convert
+                value = f'convert_{n}({value})'
+            entries.append(f'{field.key!r}: {value}')
+        
+        source = 'def hydrate(row):\n    return {' + ', '.join(entries) + '}\n'
+        exec(compile(source, f'<field plan {self.model.__name__}>', 'exec'), namespace)
+        return namespace['hydrate']
+    
+    def subset(self, keys):
+        """Return a plan for just ``keys`` (kept in the plan's own order).
+        
+        Joins are dropped when none of the remaining fields read from them,
+        so a sparse request also selects (and joins) less.
+        """
+        wanted = frozenset(keys)
+        if wanted.issuperset(self.keys):
+            return self
+        
+        plan = self._subsets.get(wanted)
+        if plan is None:
+            fields = [field for field in self.fields if field.key in wanted]
+            used = {getattr(column, 'class_', None) for field in fields for column in field.columns}
+            joins = [join for join in self.joins if join[0] in used]
+            plan = FieldPlan(self.model, fields, joins, self.json_assembly)
+            if len(self._subsets) >= 256:
+                self._subsets.clear()
+            self._subsets[wanted] = plan
+        return plan
+    
+    def select(self):
+        """Return a SELECT of the plan's columns (plus outer joins)."""
+        stmt = select(*self.columns).select_from(self.model)
+        for target, onclause in self.joins:
+            stmt = stmt.outerjoin(target, onclause)
+        return stmt
+    
+    def returning(self):
+        """The plan's columns for an ``UPDATE ... RETURNING`` on its model.
+        
+        RETURNING cannot join, so columns from joined tables become
+        scalar subqueries correlated to the updated row. SQLite renders
+        RETURNING columns unqualified, so the subqueries name the updated
+        table's columns explicitly.
+        """
+        table = self.model.__table__
+        
+        def qualify(element):
+            if getattr(element, 'table', None) is not None and element.table.key == table.key:
+                return literal_column(f'{table.name}.{element.name}', type_=element.type)
+        
+        columns = []
+        for column in self.columns:
+            target = getattr(column, 'class_', None)
+            join = next((join for join in self.joins if join[0] is target), None)
+            if join is None:
+                columns.append(column)
+            else:
+                onclause = replacement_traverse(join[1], {}, qualify)
+                columns.append(select(column).where(onclause).scalar_subquery())
+        return columns
+    
+    def all(self, stmt):
+        """Execute a statement built from :meth:`select` and hydrate every row."""
+        hydrate = self.hydrate
+        return [hydrate(row) for row in db.session.execute(stmt)]
+    
+    def first(self, stmt):
+        """Hydrate the first row of a statement, or return None."""
+        row = db.session.execute(stmt.limit(1)).first()
+        return self.hydrate(row) if row is not None else None
+    
+    def paginate(self, stmt, page, per_page):
+        """Paginate like ``Query.paginate(error_out=False)`` but return dicts."""
+        page = page if page and page >= 1 else 1
+        per_page = per_page if per_page and per_page >= 1 else 20
+        
+        items = self.all(stmt.limit(per_page).offset((page - 1) * per_page))
+        if page == 1 and len(items) < per_page:
+            total = len(items)
+        else:
+            count = select(func.count()).select_from(stmt.order_by(None).subquery())
+            total = db.session.execute(count).scalar()
+        return Page(items, total, page, per_page)
+    
+    def paginate_json(self, stmt, page, per_page):
+        """Like :meth:`paginate`, but the database encodes the items.
+        
+        ``items`` is a :class:`RawJSON` array that the JSON provider
+        writes into the response without decoding it. Plans not registered
+        with ``json_assembly=True`` are paginated in Python instead.
+        """
+        if not self.json_assembly:
+            return self.paginate(stmt, page, per_page)
+        
+        page = page if page and page >= 1 else 1
+        per_page = per_page if per_page and per_page >= 1 else 20
+        
+        items = json_rows(self, stmt.limit(per_page).offset((page - 1) * per_page))
+        count = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return Page(items, db.session.execute(count).scalar(), page, per_page)
\ No newline at end of file
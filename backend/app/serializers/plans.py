@@ -0,0 +1,137 @@
+"""Field plans for each model, matching the keys of Model.to_dict()."""
+from app.models.user import User
+from app.models.student_registration import StudentRegistration
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.models.material import Material
+from app.models.schedule import Schedule
+from app.serializers.converters import csv_list, full_name, hhmm, isoformat, optional_full_name
+from app.serializers.plan import Field, FieldPlan
+
+USER_PLAN = FieldPlan(User, [
+    Field('id', User.id),
+    Field('username', User.username),
+    Field('email', User.email),
+    Field('full_name', User.full_name),
+    Field('is_active', User.is_active),
+    Field('is_superadmin', User.is_superadmin),
+    Field('last_login', User.last_login, convert=isoformat),
+    Field('created_at', User.created_at, convert=isoformat),
+])
+
+REGISTRATION_PLAN = FieldPlan(StudentRegistration, [
+    Field('id', StudentRegistration.id),
+    Field('first_name', StudentRegistration.first_name),
+    Field('last_name', StudentRegistration.last_name),
+    Field('full_name', StudentRegistration.first_name, StudentRegistration.last_name, convert=full_name),
+    Field('email', StudentRegistration.email),
+    Field('phone', StudentRegistration.phone),
+    Field('date_of_birth', StudentRegistration.date_of_birth, convert=isoformat),
+    Field('gender', StudentRegistration.gender),
+    Field('address', StudentRegistration.address),
+    Field('parent_name', StudentRegistration.parent_name),
+    Field('parent_phone', StudentRegistration.parent_phone),
+    Field('parent_email', StudentRegistration.parent_email),
+    Field('previous_school', StudentRegistration.previous_school),
+    Field('grade_applying', StudentRegistration.grade_applying),
+    Field('emergency_contact', StudentRegistration.emergency_contact),
+    Field('emergency_phone', StudentRegistration.emergency_phone),
+    Field('medical_notes', StudentRegistration.medical_notes),
+    Field('status', StudentRegistration.status),
+    Field('admin_notes', StudentRegistration.admin_notes),
+    Field('reviewed_by', StudentRegistration.reviewed_by),
+    Field('reviewed_at', StudentRegistration.reviewed_at, convert=isoformat),
+    Field('created_at', StudentRegistration.created_at, convert=isoformat),
+], json_assembly=True)
+
+STUDENT_PLAN = FieldPlan(Student, [
+    Field('id', Student.id),
+    Field('student_id', Student.student_id),
+    Field('first_name', Student.first_name),
+    Field('last_name', Student.last_name),
+    Field('full_name', Student.first_name, Student.last_name, convert=full_name),
+    Field('email', Student.email),
+    Field('phone', Student.phone),
+    Field('date_of_birth', Student.date_of_birth, convert=isoformat),
+    Field('gender', Student.gender),
+    Field('address', Student.address),
+    Field('enrollment_date', Student.enrollment_date, convert=isoformat),
+    Field('grade_level', Student.grade_level),
+    Field('section', Student.section),
+    Field('parent_name', Student.parent_name),
+    Field('parent_phone', Student.parent_phone),
+    Field('parent_email', Student.parent_email),
+    Field('emergency_contact', Student.emergency_contact),
+    Field('emergency_phone', Student.emergency_phone),
+    Field('medical_notes', Student.medical_notes),
+    Field('status', Student.status),
+    Field('registration_id', Student.registration_id),
+    Field('created_at', Student.created_at, convert=isoformat),
+    Field('version', Student.version),
+], json_assembly=True)
+
+TEACHER_PLAN = FieldPlan(Teacher, [
+    Field('id', Teacher.id),
+    Field('teacher_id', Teacher.teacher_id),
+    Field('first_name', Teacher.first_name),
+    Field('last_name', Teacher.last_name),
+    Field('full_name', Teacher.first_name, Teacher.last_name, convert=full_name),
+    Field('email', Teacher.email),
+    Field('phone', Teacher.phone),
+    Field('department', Teacher.department),
+    Field('subjects', Teacher.subjects, convert=csv_list),
+    Field('subjects_text', Teacher.subjects),
+    Field('qualification', Teacher.qualification),
+    Field('experience_years', Teacher.experience_years),
+    Field('joining_date', Teacher.joining_date, convert=isoformat),
+    Field('address', Teacher.address),
+    Field('bio', Teacher.bio),
+    Field('profile_image', Teacher.profile_image),
+    Field('is_active', Teacher.is_active),
+    Field('created_at', Teacher.created_at, convert=isoformat),
+    Field('version', Teacher.version),
+])
+
+MATERIAL_PLAN = FieldPlan(Material, [
+    Field('id', Material.id),
+    Field('title', Material.title),
+    Field('description', Material.description),
+    Field('subject', Material.subject),
+    Field('grade_level', Material.grade_level),
+    Field('material_type', Material.material_type),
+    Field('file_url', Material.file_url),
+    Field('external_link', Material.external_link),
+    Field('file_size', Material.file_size),
+    Field('file_format', Material.file_format),
+    Field('author', Material.author),
+    Field('publisher', Material.publisher),
+    Field('is_public', Material.is_public),
+    Field('download_count', Material.download_count),
+    Field('view_count', Material.view_count),
+    Field('uploaded_by', Material.uploaded_by),
+    Field('created_at', Material.created_at, convert=isoformat),
+    Field('updated_at', Material.updated_at, convert=isoformat),
+    Field('version', Material.version),
+], json_assembly=True)
+
+# The teacher's name comes from an outer join instead of a lazy load per row
+SCHEDULE_PLAN = FieldPlan(Schedule, [
+    Field('id', Schedule.id),
+    Field('title', Schedule.title),
+    Field('subject', Schedule.subject),
+    Field('grade_level', Schedule.grade_level),
+    Field('section', Schedule.section),
+    Field('day_of_week', Schedule.day_of_week),
+    Field('start_time', Schedule.start_time, convert=hhmm),
+    Field('end_time', Schedule.end_time, convert=hhmm),
+    Field('room', Schedule.room),
+    Field('teacher_id', Schedule.teacher_id),
+    Field('teacher_name', Teacher.first_name, Teacher.last_name, convert=optional_full_name),
+    Field('description', Schedule.description),
+    Field('is_recurring', Schedule.is_recurring),
+    Field('effective_from', Schedule.effective_from, convert=isoformat),
+    Field('effective_until', Schedule.effective_until, convert=isoformat),
+    Field('created_by', Schedule.created_by),
+    Field('created_at', Schedule.created_at, convert=isoformat),
+    Field('version', Schedule.version),
+], joins=[(Teacher, Schedule.teacher_id == Teacher.id)])
\ No newline at end of file
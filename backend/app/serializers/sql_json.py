@@ -0,0 +1,140 @@
+"""Have the database assemble a plan's rows into a JSON array.
+
+PostgreSQL builds the array with ``json_agg(json_build_object(...))`` and
+SQLite with ``json_group_array(json_object(...))``. Each field's Python
+converter is mirrored by an SQL expression, so the objects have exactly
+the keys and values :meth:`FieldPlan.hydrate` would produce.
+"""
+from sqlalchemy import Boolean, DateTime, literal, literal_column, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import Text
+
+from app.extensions import db
+from app.serializers.converters import full_name, isoformat
+
+class RawJSON:
+    """Already-encoded JSON embedded verbatim by the JSON provider."""
+    
+    __slots__ = ('text',)
+    
+    def __init__(self, text):
+        self.text = text
+
+# ==================== SQL CONSTRUCTS ====================
+
+class json_object(FunctionElement):
+    inherit_cache = True
+    type = Text()
+
+@compiles(json_object)
+def _json_object_default(element, compiler, **kw):
+    return f'json_object({compiler.process(element.clauses, **kw)})'
+
+@compiles(json_object, 'postgresql')
+def _json_object_postgresql(element, compiler, **kw):
+    return f'json_build_object({compiler.process(element.clauses, **kw)})'
+
+class json_array_agg(FunctionElement):
+    """Aggregate JSON objects into an array as text ('[]' when empty)."""
+    inherit_cache = True
+    type = Text()
+
+@compiles(json_array_agg)
+def _json_array_agg_default(element, compiler, **kw):
+    # The subtype is lost across the subquery, so re-parse with json()
+    return f'json_group_array(json({compiler.process(element.clauses, **kw)}))'
+
+@compiles(json_array_agg, 'postgresql')
+def _json_array_agg_postgresql(element, compiler, **kw):
+    return f"CAST(COALESCE(json_agg({compiler.process(element.clauses, **kw)}), '[]') AS TEXT)"
+
+class json_bool(FunctionElement):
+    """A boolean column as a JSON true/false/null."""
+    inherit_cache = True
+
+@compiles(json_bool)
+def _json_bool_default(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"json(CASE WHEN {column} IS NULL THEN 'null' WHEN {column} THEN 'true' ELSE 'false' END)"
+
+@compiles(json_bool, 'postgresql')
+def _json_bool_postgresql(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+class iso_format(FunctionElement):
+    """Same text as ``value.isoformat()`` for a Date or DateTime column."""
+    inherit_cache = True
+    type = Text()
+
+@compiles(iso_format)
+def _iso_format_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    if not isinstance(list(element.clauses)[0].type, DateTime):
+        return column
+    # SQLAlchemy stores 'YYYY-MM-DD HH:MM:SS.ffffff'; isoformat() drops zero microseconds
+    return (
+        f"CASE WHEN substr({column}, 21) IN ('', '000000') "
+        f"THEN replace(substr({column}, 1, 19), ' ', 'T') "
+        f"ELSE replace({column}, ' ', 'T') END"
+    )
+
+@compiles(iso_format, 'postgresql')
+def _iso_format_postgresql(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    if not isinstance(list(element.clauses)[0].type, DateTime):
+        return f"to_char({column}, 'YYYY-MM-DD')"
+    return (
+        f"CASE WHEN to_char({column}, 'US') = '000000' "
+        f"THEN to_char({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS') "
+        f"ELSE to_char({column}, 'YYYY-MM-DD\"T\"HH24:MI:SS.US') END"
+    )
+
+# ==================== PLAN COMPILATION ====================
+
+SQL_CONVERTERS = {
+    isoformat: iso_format,
+    full_name: lambda first_name, last_name: first_name + literal(' ') + last_name,
+}
+
+def check_json_assembly(plan):
+    """Raise ValueError unless every field of ``plan`` has an SQL equivalent.
+    
+    Called when a plan is registered for database-side assembly, so an
+    unsupported converter fails at import instead of on a request.
+    """
+    unsupported = [
+        field.key for field in plan.fields
+        if field.convert is not None and field.convert not in SQL_CONVERTERS
+    ]
+    if unsupported:
+        raise ValueError(
+            f"{plan.model.__name__} plan cannot be assembled by the database: "
+            f"no SQL equivalent for field(s) {', '.join(unsupported)}"
+        )
+
+def _field_expression(field):
+    if field.convert is None:
+        (column,) = field.columns
+        return json_bool(column) if isinstance(column.type, Boolean) else column
+    return SQL_CONVERTERS[field.convert](*field.columns)
+
+def row_object(plan):
+    """Return the JSON object expression for one row of ``plan``.
+    
+    Keys are emitted sorted, matching the JSON provider's ``sort_keys``.
+    """
+    args = []
+    for field in sorted(plan.fields, key=lambda field: field.key):
+        # Keys are plan identifiers, inlined so the statement caches cleanly
+        args.extend((literal_column(f"'{field.key}'"), _field_expression(field)))
+    return json_object(*args)
+
+def json_rows(plan, stmt):
+    """Execute ``stmt`` (built from ``plan.select()``) as one JSON array.
+    
+    ``plan`` must have passed :func:`check_json_assembly`.
+    """
+    rows = stmt.with_only_columns(row_object(plan).label('obj')).subquery()
+    # Aggregates read an ordered subquery in its order on both backends
+    return RawJSON(db.session.execute(select(json_array_agg(rows.c.obj))).scalar())
\ No newline at end of file
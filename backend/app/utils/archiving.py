@@ -0,0 +1,140 @@
+"""Hot/cold archiving of finished students and reviewed registrations.
+
+Graduated and transferred students and approved or rejected registrations
+never change again, but they stay in the tables every admin list and
+search reads. Once older than ``ARCHIVE_RETENTION_DAYS`` they move to
+``archived_students`` and ``archived_student_registrations``:
+``ARCHIVE_BATCH_SIZE`` rows at a time, one short transaction per batch,
+with ``ARCHIVE_BATCH_PAUSE`` seconds between batches so row locks are
+held briefly and other writers get in between.
+
+Archived rows keep their primary key, so admin endpoints can still reach
+them with ``?include_archived=1`` (see :func:`union_archived`).
+"""
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import Column, Table, and_, delete, func, insert, literal, select, union_all
+from sqlalchemy.sql.util import ClauseAdapter
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from app.extensions import db
+from app.models.archived_student import ArchivedStudent
+from app.models.archived_student_registration import ArchivedStudentRegistration
+from app.models.student import Student
+from app.models.student_registration import StudentRegistration
+
+# Statuses after which a row is finished with
+ARCHIVED_STUDENT_STATUSES = ('graduated', 'transferred')
+ARCHIVED_REGISTRATION_STATUSES = ('approved', 'rejected')
+
+class ArchivePolicy:
+    """Which rows of a hot table move to its archive, and when."""
+    
+    def __init__(self, name, model, archive_model, finished, age):
+        self.name = name
+        self.model = model
+        self.archive_model = archive_model
+        self.finished = finished
+        self.age = age
+        self.columns = [column.name for column in model.__table__.columns]
+    
+    def eligible(self, cutoff):
+        return and_(self.finished(), self.age() < cutoff)
+
+ARCHIVE_POLICIES = {
+    policy.name: policy for policy in (
+        ArchivePolicy(
+            'students', Student, ArchivedStudent,
+            finished=lambda: Student.status.in_(ARCHIVED_STUDENT_STATUSES),
+            age=lambda: Student.updated_at,
+        ),
+        ArchivePolicy(
+            'registrations', StudentRegistration, ArchivedStudentRegistration,
+            # Registrations still referenced by a hot student stay (foreign key)
+            finished=lambda: and_(
+                StudentRegistration.status.in_(ARCHIVED_REGISTRATION_STATUSES),
+                ~select(Student.id).where(Student.registration_id == StudentRegistration.id).exists()
+            ),
+            age=lambda: func.coalesce(StudentRegistration.reviewed_at, StudentRegistration.created_at),
+        ),
+    )
+}
+
+ARCHIVES = {policy.model: policy.archive_model for policy in ARCHIVE_POLICIES.values()}
+
+def archive_batch(policy, cutoff, batch_size):
+    """Move up to ``batch_size`` eligible rows and commit; return how many moved."""
+    model = policy.model
+    ids = db.session.execute(
+        select(model.id).where(policy.eligible(cutoff)).order_by(model.id).limit(batch_size)
+    ).scalars().all()
+    if not ids:
+        return 0
+    
+    db.session.execute(insert(policy.archive_model).from_select(
+        policy.columns + ['archived_at'],
+        select(*[model.__table__.c[name] for name in policy.columns], literal(datetime.utcnow(), db.DateTime))
+        .where(model.id.in_(ids))
+    ))
+    db.session.execute(delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False))
+    db.session.commit()
+    return len(ids)
+
+def archive(names=None, retention_days=None, batch_size=None, pause=None, max_batches=None, dry_run=False):
+    """Archive every eligible row of the named tables (default: all).
+    
+    Returns ``{name: rows}``; with ``dry_run`` the rows that would move.
+    """
+    config = current_app.config
+    retention_days = config['ARCHIVE_RETENTION_DAYS'] if retention_days is None else retention_days
+    batch_size = batch_size or config['ARCHIVE_BATCH_SIZE']
+    pause = config['ARCHIVE_BATCH_PAUSE'] if pause is None else pause
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    
+    moved = {}
+    for name in names or ARCHIVE_POLICIES:
+        policy = ARCHIVE_POLICIES[name]
+        if dry_run:
+            moved[name] = db.session.execute(
+                select(func.count()).select_from(policy.model).where(policy.eligible(cutoff))
+            ).scalar()
+            continue
+        
+        moved[name] = batches = 0
+        while max_batches is None or batches < max_batches:
+            count = archive_batch(policy, cutoff, batch_size)
+            moved[name] += count
+            batches += 1
+            if count < batch_size:
+                break
+            time.sleep(pause)
+    return moved
+
+# ==================== READING ====================
+
+def _on_archive(stmt, model):
+    """The same statement with ``model``'s table swapped for its archive."""
+    hot = model.__table__
+    cold = ARCHIVES[model].__table__
+    
+    # ORM statements hold annotated copies of the table and its columns
+    def swap(element, **kw):
+        if isinstance(element, Table) and element.key == hot.key:
+            return cold
+        if isinstance(element, Column) and isinstance(element.table, Table) and element.table.key == hot.key:
+            return cold.c[element.name]
+        return None
+    
+    return replacement_traverse(stmt, {}, swap)
+
+def union_archived(stmt, model, *order_by):
+    """``stmt`` UNION ALL the same query over the archive, ordered by ``order_by``.
+    
+    ``stmt`` must select (and filter on) ``model``'s columns only; the
+    result selects the same columns in the same order, so field plans
+    hydrate its rows unchanged.
+    """
+    rows = union_all(stmt, _on_archive(stmt, model)).subquery()
+    adapter = ClauseAdapter(rows)
+    return select(*rows.c).order_by(*[adapter.traverse(clause) for clause in order_by])
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Authenticated admin lookup backed by a per-worker cache."""
+from flask_jwt_extended import current_user as current_admin
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.extensions import db
+from app.models.user import User
+from app.replica import reading_primary
+from app.utils.cache import TTLCache
+
+# Detached copies of active users keyed by JWT identity. Any commit that
+# touches the users table bumps its stamp and clears every worker's copy.
+user_cache = TTLCache('USER_CACHE_TTL_SECONDS', [User.__tablename__])
+
+def _detached_copy(user):
+    copy = User(**{
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+    })
+    make_transient_to_detached(copy)
+    return copy
+
+def load_admin(identity):
+    """Return the active user for a JWT identity, or None."""
+    cached = user_cache.get(identity)
+    if cached is not None:
+        return db.session.merge(cached, load=False)
+    
+    with reading_primary():
+        user = db.session.get(User, int(identity))
+    if not user or not user.is_active:
+        return None
+    
+    user_cache.set(identity, _detached_copy(user))
+    return user
+
+__all__ = ['current_admin', 'load_admin', 'user_cache']
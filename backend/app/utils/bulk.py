@@ -0,0 +1,84 @@
+"""Bulk edits: one ``UPDATE`` or ``DELETE`` for many rows.
+
+A bulk request names its rows either by ``ids`` or by a ``filter`` of
+whitelisted columns (a scalar matches with ``=``, a list with ``IN``) and,
+for updates, the new values under ``set``. Statements go through the ORM
+session, so the commit bumps the same table stamps (and fires the same
+``on_tables_changed`` listeners) as a single-row edit.
+"""
+from sqlalchemy import delete, update
+
+from app.extensions import db
+
+# Largest ``ids`` list accepted in one request
+MAX_BULK_IDS = 1000
+
+_SCALARS = (str, int, float, bool, type(None))
+
+class BulkRequestError(ValueError):
+    """Raised when a bulk request body is malformed or not allowed."""
+
+def _check_value(field, value):
+    if isinstance(value, list):
+        if not value or not all(isinstance(item, _SCALARS) for item in value):
+            raise BulkRequestError(f'Filter on {field} must be a value or a non-empty list of values')
+    elif not isinstance(value, _SCALARS):
+        raise BulkRequestError(f'Filter on {field} must be a value or a non-empty list of values')
+
+def bulk_conditions(model, data, filterable):
+    """WHERE conditions for the rows a bulk request targets."""
+    ids = data.get('ids')
+    filters = data.get('filter') or {}
+    if ids is None and not filters:
+        raise BulkRequestError('Provide ids or a filter')
+    if not isinstance(filters, dict):
+        raise BulkRequestError('filter must be an object')
+    
+    conditions = []
+    if ids is not None:
+        if not isinstance(ids, list) or not ids or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            raise BulkRequestError('ids must be a non-empty list of integers')
+        if len(ids) > MAX_BULK_IDS:
+            raise BulkRequestError(f'At most {MAX_BULK_IDS} ids per request')
+        conditions.append(model.id.in_(ids))
+    
+    unknown = [field for field in filters if field not in filterable]
+    if unknown:
+        raise BulkRequestError(f"Cannot filter on: {', '.join(unknown)}. Allowed: {', '.join(filterable)}")
+    for field, value in filters.items():
+        _check_value(field, value)
+        column = getattr(model, field)
+        conditions.append(column.in_(value) if isinstance(value, list) else column == value)
+    return conditions
+
+def bulk_values(data, updatable, converters=None):
+    """Column values for a bulk update, limited to ``updatable``."""
+    values = data.get('set')
+    if not isinstance(values, dict) or not values:
+        raise BulkRequestError('set must be a non-empty object of fields to update')
+    
+    unknown = [field for field in values if field not in updatable]
+    if unknown:
+        raise BulkRequestError(f"Cannot bulk update: {', '.join(unknown)}. Allowed: {', '.join(updatable)}")
+    
+    converters = converters or {}
+    return {
+        field: converters[field](value) if field in converters else value
+        for field, value in values.items()
+    }
+
+def bulk_update(model, conditions, values):
+    """Run one UPDATE and return the number of rows it changed."""
+    if 'version' in model.__table__.columns:
+        values = {**values, 'version': model.version + 1}
+    result = db.session.execute(
+        update(model).where(*conditions).values(**values).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+def bulk_delete(model, conditions):
+    """Run one DELETE and return the number of rows it removed."""
+    result = db.session.execute(
+        delete(model).where(*conditions).execution_options(synchronize_session=False)
+    )
+    return result.rowcount
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""Cross-worker cache coordination utilities."""
+import os
+import threading
+import time
+from flask import current_app, has_app_context
+from sqlalchemy import event
+from flask_sqlalchemy.session import Session
+
+class VersionStamp:
+    """Cheap change marker shared by every worker on the host.
+
+    The stamp is the nanosecond mtime of a small file, so reading it is a
+    single ``stat`` call and bumping it is a single ``utime`` call.
+    """
+
+    def __init__(self, directory, name):
+        self.path = os.path.join(directory, f'{name}.stamp')
+
+    def read(self):
+        """Return the current stamp value (0 if never bumped)."""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def bump(self):
+        """Advance the stamp so other workers notice the change."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'a'):
+            pass
+        now = time.time_ns()
+        os.utime(self.path, ns=(now, now))
+        return now
+
+_stamps = {}
+
+def get_stamp(name):
+    """Return the shared version stamp with the given name."""
+    directory = current_app.config['SHARED_STATE_DIR']
+    key = (directory, name)
+    stamp = _stamps.get(key)
+    if stamp is None:
+        stamp = _stamps[key] = VersionStamp(directory, name)
+    return stamp
+
+class TTLCache:
+    """Small per-worker cache whose entries expire after ``ttl`` seconds.
+
+    The whole cache is dropped as soon as any of the named version stamps
+    moves, so a write in one worker invalidates every other worker's copy
+    on its next lookup.
+    """
+
+    def __init__(self, ttl_config_key, stamp_names, maxsize=1024):
+        self.ttl_config_key = ttl_config_key
+        self.stamp_names = tuple(stamp_names)
+        self.maxsize = maxsize
+        self._data = {}
+        self._stamps_seen = None
+        self._lock = threading.Lock()
+
+    def _check_stamps(self):
+        stamps = tuple(get_stamp(name).read() for name in self.stamp_names)
+        if stamps != self._stamps_seen:
+            with self._lock:
+                self._data.clear()
+                self._stamps_seen = stamps
+
+    def get(self, key):
+        """Return the cached value or None if missing or expired."""
+        self._check_stamps()
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value):
+        """Store a value for the configured TTL."""
+        ttl = current_app.config[self.ttl_config_key]
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                self._data.clear()
+            self._data[key] = (value, time.monotonic() + ttl)
+
+    def clear(self):
+        """Drop every entry held by this worker."""
+        with self._lock:
+            self._data.clear()
+
+# ==================== CHANGE TRACKING ====================
+
+_change_listeners = []
+
+def on_tables_changed(listener):
+    """Register ``listener(tables)`` to run after a commit changes tables."""
+    _change_listeners.append(listener)
+    return listener
+
+def bump_tables(*table_names):
+    """Bump the version stamp of each table, invalidating dependent caches."""
+    for name in set(table_names):
+        get_stamp(name).bump()
+
+@event.listens_for(Session, 'after_flush')
+def _collect_flushed_tables(session, flush_context):
+    changed = session.info.setdefault('changed_tables', set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, '__tablename__', None)
+        if table:
+            changed.add(table)
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_executed_tables(orm_execute_state):
+    # Counter updates (e.g. view counts) opt out so they don't flush caches
+    if not orm_execute_state.execution_options.get('bump_stamps', True):
+        return
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        if table is not None and hasattr(table, 'name'):
+            orm_execute_state.session.info.setdefault('changed_tables', set()).add(table.name)
+
+@event.listens_for(Session, 'after_commit')
+def _bump_committed_tables(session):
+    changed = session.info.pop('changed_tables', None)
+    if changed and has_app_context():
+        bump_tables(*changed)
+        for listener in _change_listeners:
+            listener(frozenset(changed))
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_rolled_back_tables(session):
+    session.info.pop('changed_tables', None)
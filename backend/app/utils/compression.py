@@ -0,0 +1,69 @@
+"""gzip/brotli response compression with Accept-Encoding negotiation."""
+import gzip
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'text/html', 'text/plain', 'text/css', 'text/csv')
+
+def available_encodings():
+    """Configured encodings in preference order, minus any not installed."""
+    names = [name.strip() for name in current_app.config['COMPRESS_ALGORITHMS'].split(',')]
+    return [name for name in names if name == 'gzip' or (name == 'br' and brotli is not None)]
+
+def compress(data, encoding):
+    """Compress ``data`` with the given content coding."""
+    config = current_app.config
+    if encoding == 'br':
+        return brotli.compress(data, quality=config['COMPRESS_BROTLI_QUALITY'])
+    # mtime=0 keeps output deterministic, so equal bodies compress identically
+    return gzip.compress(data, compresslevel=config['COMPRESS_GZIP_LEVEL'], mtime=0)
+
+def choose_encoding(encodings):
+    """Pick the client's preferred coding among ``encodings`` (or None)."""
+    return request.accept_encodings.best_match(encodings) if encodings else None
+
+def is_compressible(response):
+    return (
+        200 <= response.status_code < 300 and response.status_code != 204
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and 'Content-Encoding' not in response.headers
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+    )
+
+class Compressor:
+    """Compresses eligible responses in an ``after_request`` hook.
+    
+    Bodies smaller than ``COMPRESS_MIN_SIZE`` are sent as-is, since the
+    framing overhead outweighs the savings. Responses that already carry
+    a Content-Encoding (e.g. precompressed cache hits) are left alone.
+    """
+    
+    def init_app(self, app):
+        app.config.setdefault('COMPRESS_ALGORITHMS', 'br,gzip')
+        app.config.setdefault('COMPRESS_MIN_SIZE', 500)
+        app.config.setdefault('COMPRESS_GZIP_LEVEL', 6)
+        app.config.setdefault('COMPRESS_BROTLI_QUALITY', 4)
+        app.after_request(self.after_request)
+    
+    def after_request(self, response):
+        if request.method == 'HEAD' or not is_compressible(response):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        if response.content_length is not None and response.content_length < current_app.config['COMPRESS_MIN_SIZE']:
+            return response
+        
+        encoding = choose_encoding(available_encodings())
+        if encoding is None:
+            return response
+        
+        response.set_data(compress(response.get_data(), encoding))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+compressor = Compressor()
\ No newline at end of file
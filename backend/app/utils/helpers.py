@@ -5,19 +5,22 @@ from app.extensions import db
 def generate_student_id():
     """Generate a unique student ID."""
     from app.models.student import Student
+    from app.models.archived_student import ArchivedStudent
     
     year = datetime.now().year
     prefix = f"STD{year}"
     
-    # Get the last student ID with this prefix
-    last_student = Student.query.filter(
-        Student.student_id.like(f"{prefix}%")
-    ).order_by(Student.student_id.desc()).first()
+    # Get the last student ID with this prefix, archived students included
+    last_ids = [
+        db.session.query(db.func.max(model.student_id)).filter(model.student_id.like(f"{prefix}%")).scalar()
+        for model in (Student, ArchivedStudent)
+    ]
+    last_id = max(filter(None, last_ids), default=None)
     
-    if last_student:
+    if last_id:
         # Extract the number and increment
         try:
-            last_num = int(last_student.student_id.replace(prefix, ""))
+            last_num = int(last_id.replace(prefix, ""))
             new_num = last_num + 1
         except ValueError:
             new_num = 1
@@ -0,0 +1,154 @@
+"""Pre-rendered public homepage payload shared by every worker."""
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime
+from flask import current_app, jsonify
+from sqlalchemy import func, select
+
+from app.extensions import db
+from app.models.teacher import Teacher
+from app.models.material import Material
+from app.models.schedule import Schedule
+from app.serializers import TEACHER_PLAN, MATERIAL_PLAN, SCHEDULE_PLAN
+from app.serializers.fields import FIELD_WHITELISTS
+from app.utils.cache import get_stamp, on_tables_changed
+from app.utils.jobs import DebouncedJob, write_atomic
+from app.utils.response_cache import CachedResponse
+
+SOURCE_TABLES = ('teachers', 'materials', 'schedules')
+
+def build_home_payload():
+    """Query everything the landing page shows."""
+    config = current_app.config
+    today = date.today()
+    public = FIELD_WHITELISTS['public']
+    
+    teachers = TEACHER_PLAN.subset(public[TEACHER_PLAN])
+    materials = MATERIAL_PLAN.subset(public[MATERIAL_PLAN])
+    schedules = SCHEDULE_PLAN.subset(public[SCHEDULE_PLAN])
+    
+    count = lambda stmt: db.session.execute(stmt).scalar()
+    return {
+        'featured_teachers': teachers.all(
+            teachers.select()
+            .where(Teacher.is_active == True)
+            .order_by(Teacher.profile_image.is_(None), Teacher.experience_years.desc(), Teacher.last_name)
+            .limit(config['HOME_FEATURED_TEACHERS'])
+        ),
+        'latest_materials': materials.all(
+            materials.select()
+            .where(Material.is_public == True)
+            .order_by(Material.created_at.desc())
+            .limit(config['HOME_LATEST_MATERIALS'])
+        ),
+        'todays_classes': schedules.all(
+            schedules.select()
+            .where(Schedule.day_of_week == today.strftime('%A'), Schedule.in_effect(today))
+            .order_by(Schedule.start_time)
+        ),
+        'counts': {
+            'teachers': count(select(func.count()).select_from(Teacher).where(Teacher.is_active == True)),
+            'departments': count(select(func.count(Teacher.department.distinct())).where(Teacher.is_active == True)),
+            'materials': count(select(func.count()).select_from(Material).where(Material.is_public == True)),
+            'schedules': count(select(func.count()).select_from(Schedule)),
+        },
+        'day': today.isoformat(),
+        'generated_at': datetime.utcnow().isoformat()
+    }
+
+class HomeSnapshot:
+    """The homepage payload, rendered off the request path.
+    
+    The payload lives in a JSON file under ``SHARED_STATE_DIR``, one per
+    database. A worker that commits a change to a source table rebuilds it
+    in a background thread; every worker reloads its in-memory,
+    precompressed copy when the file changes. Requests only ``stat`` the
+    file, never query: until the first render lands they get a 503.
+    """
+    
+    def __init__(self):
+        self._job = DebouncedJob('home snapshot', self.rebuild, 'HOME_REBUILD_DELAY_SECONDS')
+        self._loaded_mtime = None
+        self._meta = None
+        self._entry = None
+    
+    def init_app(self, app):
+        app.config.setdefault('HOME_FEATURED_TEACHERS', 6)
+        app.config.setdefault('HOME_LATEST_MATERIALS', 6)
+        app.config.setdefault('HOME_REBUILD_DELAY_SECONDS', 1.0)
+    
+    def database(self):
+        """Identity of the database the snapshot is rendered from."""
+        uri = current_app.config['SQLALCHEMY_DATABASE_URI']
+        return hashlib.sha256(uri.encode()).hexdigest()[:16]
+    
+    def path(self):
+        return os.path.join(current_app.config['SHARED_STATE_DIR'], f'home-{self.database()}.json')
+    
+    def rebuild(self):
+        """Render the payload now and atomically replace the shared file."""
+        stamps = {name: get_stamp(name).read() for name in SOURCE_TABLES}
+        snapshot = {'database': self.database(), 'stamps': stamps, 'payload': build_home_payload()}
+        
+        write_atomic(self.path(), json.dumps(snapshot, separators=(',', ':')))
+    
+    def schedule_rebuild(self):
+        """Rebuild shortly in a background thread, coalescing bursts of commits."""
+        self._job.schedule()
+    
+    def warm(self):
+        """Schedule a render if there is no snapshot yet (e.g. after fork)."""
+        if not os.path.exists(self.path()):
+            self.schedule_rebuild()
+    
+    def response(self):
+        """Serve the current snapshot, scheduling a rebuild if it is stale."""
+        path = self.path()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        
+        if mtime is not None and mtime != self._loaded_mtime:
+            self._load(path, mtime)
+        if mtime is None or self._meta['database'] != self.database():
+            # Cold start: render in the background, never in the request
+            self.schedule_rebuild()
+            return jsonify({'success': False, 'message': 'Homepage is being prepared, please retry shortly'}), 503, {'Retry-After': '1'}
+        if self._is_stale():
+            self.schedule_rebuild()
+        return self._entry.respond('HIT')
+    
+    def _load(self, path, mtime):
+        with open(path) as f:
+            snapshot = json.load(f)
+        response = jsonify({'success': True, 'data': snapshot['payload']})
+        self._meta = {
+            'database': snapshot.get('database'),
+            'stamps': snapshot['stamps'],
+            'day': snapshot['payload']['day'],
+        }
+        self._entry = CachedResponse(response)
+        self._loaded_mtime = mtime
+    
+    def _is_stale(self):
+        if self._meta['day'] != date.today().isoformat():
+            return True
+        # Normally the committing worker rebuilds; only step in when a change
+        # (e.g. from a CLI process) has gone unrendered for a while
+        grace_ns = int(current_app.config['HOME_REBUILD_DELAY_SECONDS'] * 5e9) + 5_000_000_000
+        now = time.time_ns()
+        for name in SOURCE_TABLES:
+            stamp = get_stamp(name).read()
+            if stamp > self._meta['stamps'][name] and now - stamp > grace_ns:
+                return True
+        return False
+
+home_snapshot = HomeSnapshot()
+
+@on_tables_changed
+def _rebuild_after_commit(tables):
+    if not tables.isdisjoint(SOURCE_TABLES):
+        home_snapshot.schedule_rebuild()
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""Index advisor: EXPLAIN the app's query shapes and report index problems.
+
+Shapes come from two places: the hot queries the API runs (built here from
+the same filters and orderings the routes use) and every statement in the
+slow-query log. Each is run through EXPLAIN on the current database and
+the plan is checked for full table scans and sorts the indexes do not
+cover. Indexes that no plan uses are reported as unused; on PostgreSQL
+``pg_stat_user_indexes`` scan counts are included as well.
+"""
+import re
+from sqlalchemy import func, inspect, select, text
+
+from app.extensions import db
+from app.models.material import Material
+from app.models.schedule import Schedule
+from app.models.student import Student
+from app.models.student_registration import StudentRegistration
+from app.models.teacher import Teacher
+from app.utils.slow_queries import slow_query_log
+
+_SQLITE_SCAN = re.compile(r'^SCAN (\w+)\b(?! USING)')
+_SQLITE_INDEX = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+_POSTGRES_SCAN = re.compile(r'Seq Scan on (\w+)')
+_POSTGRES_INDEX = re.compile(r'(?:Index Scan|Index Only Scan|Bitmap Index Scan) (?:Backward )?(?:using|on) (\w+)')
+_POSTGRES_PLACEHOLDER = re.compile(r'%\(\w+\)s')
+
+def hot_query_shapes():
+    """``(name, statement)`` for the queries the API runs most."""
+    return [
+        ('admin students by status and grade', select(Student).where(Student.status == 'active', Student.grade_level == 'Grade 1').order_by(Student.last_name).limit(20)),
+        ('admin students', select(Student).order_by(Student.last_name).limit(20)),
+        ('dashboard active students', select(func.count()).select_from(Student).where(Student.status == 'active')),
+        ('public teachers', select(Teacher).where(Teacher.is_active == True).order_by(Teacher.last_name).limit(12)),
+        ('public teachers by department', select(Teacher).where(Teacher.is_active == True, Teacher.department == 'Science').order_by(Teacher.last_name).limit(12)),
+        ('admin teachers', select(Teacher).order_by(Teacher.last_name).limit(20)),
+        ('admin teachers by department', select(Teacher).where(Teacher.department == 'Science').order_by(Teacher.last_name).limit(20)),
+        ('public departments', select(Teacher.department).where(Teacher.is_active == True).distinct()),
+        ('public materials', select(Material).where(Material.is_public == True).order_by(Material.created_at.desc()).limit(12)),
+        ('public materials by subject and grade', select(Material).where(Material.is_public == True, Material.subject == 'Physics', Material.grade_level == 'Grade 7').order_by(Material.created_at.desc()).limit(12)),
+        ('public material subjects', select(Material.subject).where(Material.is_public == True).distinct()),
+        ('admin materials', select(Material).order_by(Material.created_at.desc()).limit(20)),
+        ('admin registrations by status', select(StudentRegistration).where(StudentRegistration.status == 'pending').order_by(StudentRegistration.created_at.desc()).limit(20)),
+        ('dashboard pending registrations', select(func.count()).select_from(StudentRegistration).where(StudentRegistration.status == 'pending')),
+        ('public schedules by grade, section and day', select(Schedule).where(Schedule.grade_level == 'Grade 1', Schedule.section == 'A', Schedule.day_of_week == 'Monday').order_by(Schedule.start_time)),
+        ('admin schedules', select(Schedule).order_by(Schedule.created_at.desc()).limit(20)),
+        ('teacher schedules', select(Schedule).where(Schedule.teacher_id == 1)),
+    ]
+
+# ==================== PLANS ====================
+
+def _explain_sql(conn, sql, parameters=None):
+    """Plan lines for a SQL string on the current dialect."""
+    if conn.dialect.name == 'sqlite':
+        rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}', parameters or ()).all()
+        return [row[-1] for row in rows]
+    if conn.dialect.name == 'postgresql':
+        if parameters is None:
+            rows = conn.exec_driver_sql(f'EXPLAIN {sql}').all()
+        else:
+            # Logged statements have no values; GENERIC_PLAN (PostgreSQL 16+) plans them as-is
+            numbers = {}
+            numbered = _POSTGRES_PLACEHOLDER.sub(
+                lambda match: f'${numbers.setdefault(match.group(), len(numbers) + 1)}', sql
+            )
+            # Sent without parameters, so escaped percent signs are unescaped
+            rows = conn.exec_driver_sql(f"EXPLAIN (GENERIC_PLAN) {numbered.replace('%%', '%')}").all()
+        return [row[0] for row in rows]
+    raise NotImplementedError(f'EXPLAIN is not supported on {conn.dialect.name}')
+
+def _literal_sql(statement, dialect):
+    return str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+def _problems(dialect, plan):
+    """Full scans and uncovered sorts in a plan."""
+    problems = []
+    for line in plan:
+        line = line.strip().lstrip('->').strip()
+        if dialect == 'sqlite':
+            match = _SQLITE_SCAN.match(line)
+            if match:
+                problems.append(f'full scan of {match.group(1)}')
+            elif line.startswith('USE TEMP B-TREE FOR ORDER BY'):
+                problems.append('sort not covered by an index')
+        elif dialect == 'postgresql':
+            match = _POSTGRES_SCAN.search(line)
+            if match:
+                problems.append(f'full scan of {match.group(1)}')
+            elif line.startswith('Sort ') or line.startswith('Incremental Sort'):
+                problems.append('sort not covered by an index')
+    return problems
+
+def _indexes_used(dialect, plan):
+    pattern = _SQLITE_INDEX if dialect == 'sqlite' else _POSTGRES_INDEX
+    return {match.group(1) for line in plan for match in pattern.finditer(line)}
+
+def _secondary_indexes():
+    """Non-unique indexes on the app's tables, as ``{name: table}``."""
+    inspector = inspect(db.engine)
+    indexes = {}
+    for table in db.metadata.tables:
+        if not inspector.has_table(table):
+            continue
+        for index in inspector.get_indexes(table):
+            if not index.get('unique'):
+                indexes[index['name']] = table
+    return indexes
+
+def _postgres_scan_counts(conn):
+    rows = conn.execute(text('SELECT indexrelname, idx_scan FROM pg_stat_user_indexes')).all()
+    return {name: scans for name, scans in rows}
+
+def advise(include_log=True):
+    """EXPLAIN every shape and summarize missing and unused indexes."""
+    shapes = []
+    used = set()
+    with db.engine.connect() as conn:
+        dialect = conn.dialect.name
+        candidates = [('hot', name, _literal_sql(statement, conn.dialect), None) for name, statement in hot_query_shapes()]
+        if include_log:
+            for entry in slow_query_log.worst(limit=50):
+                sql = entry.get('sql')
+                if not sql or not sql.lower().startswith(('select', 'with')):
+                    continue
+                shape = entry['parameters']
+                parameters = dict.fromkeys(shape) if isinstance(shape, dict) else (None,) * len(shape or ())
+                candidates.append(('slow log', ', '.join(entry['endpoints']) or 'background', sql, parameters))
+        
+        for source, name, sql, parameters in candidates:
+            try:
+                plan = _explain_sql(conn, sql, parameters)
+            except Exception as error:
+                conn.rollback()
+                shapes.append({'source': source, 'name': name, 'sql': sql, 'error': str(error).splitlines()[0]})
+                continue
+            used |= _indexes_used(dialect, plan)
+            shapes.append({
+                'source': source,
+                'name': name,
+                'sql': sql,
+                'plan': plan,
+                'problems': _problems(dialect, plan),
+            })
+        
+        scans = _postgres_scan_counts(conn) if dialect == 'postgresql' else {}
+        conn.rollback()
+    
+    unused = [
+        {'index': name, 'table': table, 'scans': scans.get(name)}
+        for name, table in sorted(_secondary_indexes().items())
+        if name not in used and not scans.get(name)
+    ]
+    return {
+        'dialect': dialect,
+        'shapes': shapes,
+        'missing': [shape for shape in shapes if shape.get('problems')],
+        'unused': unused,
+    }
\ No newline at end of file
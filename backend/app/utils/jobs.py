@@ -0,0 +1,53 @@
+"""Small helpers for work done off the request path."""
+import os
+import tempfile
+import threading
+from flask import current_app
+
+def write_atomic(path, data):
+    """Write ``data`` (str or bytes) so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+class DebouncedJob:
+    """Runs ``func()`` in a background thread shortly after it is scheduled.
+    
+    Calls to :meth:`schedule` made while a run is pending coalesce into
+    that run, so a burst of commits triggers one rebuild. A call made
+    while a run is in progress queues exactly one more.
+    """
+    
+    def __init__(self, name, func, delay_config_key):
+        self.name = name
+        self.func = func
+        self.delay_config_key = delay_config_key
+        self._lock = threading.Lock()
+        self._pending = False
+    
+    def schedule(self):
+        with self._lock:
+            if self._pending:
+                return
+            self._pending = True
+        
+        app = current_app._get_current_object()
+        timer = threading.Timer(app.config[self.delay_config_key], self._run, args=(app,))
+        timer.daemon = True
+        timer.start()
+    
+    def _run(self, app):
+        with self._lock:
+            self._pending = False
+        try:
+            with app.app_context():
+                self.func()
+        except Exception:
+            app.logger.exception('Background job %s failed', self.name)
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""Declarative filtering and sorting for admin list endpoints.
+
+Each list endpoint declares a :class:`ListSpec`: the columns it may be
+filtered on, with which operators, and its default sort. The spec is
+compiled once into a table of query parameters, so a request is parsed
+with dictionary lookups into SQLAlchemy expressions:
+
+* ``?department=Science``: equality
+* ``?department__in=Science,Arts``: any of a comma-separated list
+* ``?experience_years__gte=5&experience_years__lt=10``: ranges
+* ``?last_name__prefix=Sa``: prefix match
+* ``?sort=department,-last_name``: ascending, or descending with ``-``
+
+Sorting is only allowed where an index can deliver the order: the sort
+columns must be the leading columns of a (non-partial) index on the
+table, after any leading columns the request filters on with equality.
+So no admin query can turn into a full-table sort.
+"""
+from datetime import date, datetime, time
+
+from app.extensions import db
+
+# Query parameters owned by pagination, ?fields= and friends
+RESERVED_PARAMS = frozenset({'page', 'per_page', 'fields', 'sort', 'profile', 'include_archived'})
+
+OPERATORS = ('eq', 'in', 'range', 'prefix')
+
+_RANGE_OPERATORS = {
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+}
+
+class ListQueryError(ValueError):
+    """Raised when list query parameters are unknown or invalid."""
+
+def _parse_bool(value):
+    if value.lower() in ('1', 'true'):
+        return True
+    if value.lower() in ('0', 'false'):
+        return False
+    raise ValueError(value)
+
+def _converter(column):
+    """Parse a query-string value into the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return str
+    if python_type is bool:
+        return _parse_bool
+    if python_type in (datetime, date, time):
+        return python_type.fromisoformat
+    if python_type in (int, float):
+        return python_type
+    return str
+
+def index_orders(table):
+    """Column-name tuples whose order some full index (or key) provides."""
+    orders = set()
+    for constraint in table.constraints:
+        if isinstance(constraint, (db.PrimaryKeyConstraint, db.UniqueConstraint)) and constraint.columns:
+            orders.add(tuple(column.name for column in constraint.columns))
+    for index in table.indexes:
+        # A partial index only holds some rows, so it cannot order them all
+        if any(options.get('where') is not None for options in index.dialect_options.values()):
+            continue
+        orders.add(tuple(column.name for column in index.columns))
+    return orders
+
+class ListSpec:
+    """Filters and index-backed sorts an admin list endpoint accepts."""
+    
+    def __init__(self, model, filters, default_sort):
+        self.model = model
+        self.orders = index_orders(model.__table__)
+        self._params = {}
+        for field, operators in filters.items():
+            column = getattr(model, field)
+            convert = _converter(column)
+            for operator in operators:
+                if operator not in OPERATORS:
+                    raise ValueError(f'Unknown list operator {operator!r} for {field}')
+                if operator == 'eq':
+                    self._params[field] = (field, 'eq', column, convert)
+                elif operator == 'in':
+                    self._params[f'{field}__in'] = (field, 'in', column, convert)
+                elif operator == 'prefix':
+                    self._params[f'{field}__prefix'] = (field, 'prefix', column, str)
+                else:
+                    for name in _RANGE_OPERATORS:
+                        self._params[f'{field}__{name}'] = (field, name, column, convert)
+        self._sorts = {}
+        # Fail at import time rather than on the first request
+        self.default_sort = default_sort
+        self.order_by(default_sort, frozenset())
+    
+    @property
+    def params(self):
+        return sorted(self._params)
+    
+    def conditions(self, args):
+        """WHERE conditions for the request's filters, plus the columns matched with ``=``."""
+        conditions = []
+        equal = set()
+        for param, raw in args.items(multi=True):
+            if param in RESERVED_PARAMS:
+                continue
+            entry = self._params.get(param)
+            if entry is None:
+                raise ListQueryError(f"Unknown filter: {param}. Allowed: {', '.join(self.params)}")
+            field, operator, column, convert = entry
+            try:
+                if operator == 'in':
+                    values = [convert(value) for value in raw.split(',') if value]
+                    if not values:
+                        raise ValueError(raw)
+                    conditions.append(column.in_(values))
+                elif operator == 'prefix':
+                    conditions.append(column.startswith(raw, autoescape=True))
+                elif operator == 'eq':
+                    conditions.append(column == convert(raw))
+                    equal.add(field)
+                else:
+                    conditions.append(_RANGE_OPERATORS[operator](column, convert(raw)))
+            except ValueError:
+                raise ListQueryError(f'Invalid value for {param}: {raw}') from None
+        return conditions, frozenset(equal)
+    
+    def order_by(self, sort, equal):
+        """ORDER BY clauses for a ``sort`` parameter, if an index provides that order."""
+        key = (sort, equal)
+        clauses = self._sorts.get(key)
+        if clauses is not None:
+            return clauses
+        
+        terms = [term.strip() for term in sort.split(',') if term.strip()]
+        if not terms:
+            raise ListQueryError('sort must name at least one column')
+        fields = [term.lstrip('-') for term in terms]
+        unknown = [field for field in fields if field not in self.model.__table__.columns]
+        if unknown:
+            raise ListQueryError(f"Unknown sort column: {', '.join(unknown)}")
+        # An index is read forwards or backwards, never both at once
+        if len({term.startswith('-') for term in terms if term.lstrip('-') not in equal}) > 1:
+            raise ListQueryError('Sort columns must all be ascending or all descending')
+        if not self._indexed(fields, equal):
+            raise ListQueryError(
+                f"No index can sort by {', '.join(fields)}. Sortable: {', '.join(self.sortable(equal))}"
+            )
+        
+        clauses = tuple(
+            getattr(self.model, field).desc() if term.startswith('-') else getattr(self.model, field).asc()
+            for term, field in zip(terms, fields)
+        )
+        if len(self._sorts) >= 256:
+            self._sorts.clear()
+        self._sorts[key] = clauses
+        return clauses
+    
+    def _indexed(self, fields, equal):
+        wanted = [field for field in fields if field not in equal]
+        for order in self.orders:
+            remaining = list(order)
+            while remaining and remaining[0] in equal:
+                remaining.pop(0)
+            if remaining[:len(wanted)] == wanted:
+                return True
+        return False
+    
+    def sortable(self, equal=frozenset()):
+        """Columns a request with these equality filters could sort by first."""
+        columns = set()
+        for order in self.orders:
+            remaining = list(order)
+            while remaining and remaining[0] in equal:
+                remaining.pop(0)
+            if remaining:
+                columns.add(remaining[0])
+        return sorted(columns)
+    
+    def apply(self, stmt, args):
+        """Add the request's filters and sort (or the default sort) to ``stmt``."""
+        conditions, equal = self.conditions(args)
+        return stmt.where(*conditions).order_by(*self.order_by(args.get('sort') or self.default_sort, equal))
\ No newline at end of file
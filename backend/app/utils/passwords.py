@@ -0,0 +1,109 @@
+"""Password hashing offloaded to a bounded worker pool."""
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from flask import current_app
+from werkzeug.security import generate_password_hash, check_password_hash
+
+class HashingBusyError(Exception):
+    """Raised when the hashing queue is full or a hash times out; the request should back off."""
+
+def _gevent_patched():
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('threading')
+
+class PasswordHasher:
+    """Runs Werkzeug hashing in a bounded pool with a queue-depth limit.
+
+    ``PASSWORD_HASH_WORKERS`` hashes run at once and at most
+    ``PASSWORD_HASH_QUEUE_DEPTH`` more may wait; anything beyond that is
+    rejected immediately instead of piling up on the request threads.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._slots = None
+        self._prefixes = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        app.config.setdefault('PASSWORD_HASH_METHOD', 'scrypt')
+        app.config.setdefault('PASSWORD_HASH_SALT_LENGTH', 16)
+        app.config.setdefault('PASSWORD_HASH_EXECUTOR', 'thread')
+        app.config.setdefault('PASSWORD_HASH_WORKERS', 2)
+        app.config.setdefault('PASSWORD_HASH_QUEUE_DEPTH', 8)
+        app.config.setdefault('PASSWORD_HASH_TIMEOUT', 10)
+        self.shutdown()
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    config = current_app.config
+                    workers = config['PASSWORD_HASH_WORKERS']
+                    if config['PASSWORD_HASH_EXECUTOR'] == 'process':
+                        self._executor = ProcessPoolExecutor(max_workers=workers)
+                    elif _gevent_patched():
+                        # Patched threads are greenlets; hash on real
+                        # threads so the hub keeps serving requests.
+                        from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+                        self._executor = NativeThreadPoolExecutor(max_workers=workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=workers, thread_name_prefix='password-hash'
+                        )
+                    self._slots = threading.BoundedSemaphore(
+                        workers + config['PASSWORD_HASH_QUEUE_DEPTH']
+                    )
+        return self._executor
+
+    def _run(self, fn, *args):
+        executor = self._get_executor()
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            raise HashingBusyError('Too many password operations in progress')
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=current_app.config['PASSWORD_HASH_TIMEOUT'])
+        except FutureTimeoutError:
+            raise HashingBusyError('Password operation timed out') from None
+
+    def hash(self, password):
+        """Hash a password with the configured method."""
+        config = current_app.config
+        return self._run(
+            generate_password_hash, password,
+            config['PASSWORD_HASH_METHOD'], config['PASSWORD_HASH_SALT_LENGTH']
+        )
+
+    def verify(self, pwhash, password):
+        """Check a password against a stored hash."""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """Return True if the hash was made with a different method or cost."""
+        method = current_app.config['PASSWORD_HASH_METHOD']
+        prefix = self._prefixes.get(method)
+        if prefix is None:
+            # Werkzeug expands bare method names with its default cost
+            # parameters, so derive the canonical prefix once per method.
+            prefix = generate_password_hash('', method, 1).split('$', 1)[0]
+            self._prefixes[method] = prefix
+        return pwhash.split('$', 1)[0] != prefix
+
+    def shutdown(self):
+        """Stop the worker pool (used after fork and on exit)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+            self._slots = None
+
+password_hasher = PasswordHasher()
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""Connection pool instrumentation."""
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool, QueuePool
+
+# Upper bounds (seconds) of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+class PoolStats:
+    """Per-worker counters for one engine's pool."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * len(WAIT_BUCKETS)
+    
+    def record_wait(self, seconds):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_sum += seconds
+            if seconds > self.wait_max:
+                self.wait_max = seconds
+            for i, bound in enumerate(WAIT_BUCKETS):
+                if seconds <= bound:
+                    self.wait_buckets[i] += 1
+                    break
+    
+    def increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+    
+    stats = None
+    
+    def _do_get(self):
+        if self.stats is None:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.increment('timeouts')
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - started)
+    
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+_engines = {}
+_stats = {}
+
+POOL_SIZING_OPTIONS = ('pool_size', 'max_overflow', 'pool_timeout', 'pool_use_lifo')
+
+def configure_engine_options(app):
+    """Pick the pool class and drop options the chosen pool does not accept.
+
+    Must run before ``db.init_app`` creates the engines.
+    """
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    
+    if url.get_backend_name() == 'sqlite':
+        # Flask-SQLAlchemy picks the right pool for SQLite itself
+        for key in POOL_SIZING_OPTIONS:
+            options.pop(key, None)
+    elif app.config.get('DB_POOL_CLASS') == 'null':
+        for key in POOL_SIZING_OPTIONS:
+            options.pop(key, None)
+        options.setdefault('poolclass', NullPool)
+    else:
+        options.setdefault('poolclass', InstrumentedQueuePool)
+    
+    if url.get_backend_name() == 'postgresql' and app.config.get('DB_CONNECT_TIMEOUT'):
+        connect_args = dict(options.get('connect_args') or {})
+        connect_args.setdefault('connect_timeout', app.config['DB_CONNECT_TIMEOUT'])
+        options['connect_args'] = connect_args
+    
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+def instrument_engine(name, engine):
+    """Attach pool event listeners to an engine and remember it for reporting."""
+    if _engines.get(name) is engine:
+        return
+    stats = _stats[name] = PoolStats()
+    _engines[name] = engine
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.stats = stats
+    
+    @event.listens_for(engine, 'checkout')
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.increment('checkouts')
+    
+    @event.listens_for(engine, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        stats.increment('checkins')
+    
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        stats.increment('connects')
+    
+    @event.listens_for(engine, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment('invalidations')
+
+def reset_pool_stats():
+    """Zero the counters (after fork, so workers do not inherit the parent's)."""
+    for stats in _stats.values():
+        stats.__init__()
+
+def pool_snapshot():
+    """Return current pool gauges and counters for every instrumented engine."""
+    snapshot = {}
+    for name, engine in _engines.items():
+        pool = engine.pool
+        stats = _stats[name]
+        gauges = {'pool_class': type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            gauges.update({
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': max(pool.overflow(), 0),
+                'max_overflow': pool._max_overflow,
+                'timeout': pool.timeout(),
+            })
+        snapshot[name] = {
+            **gauges,
+            'checkouts_total': stats.checkouts,
+            'checkins_total': stats.checkins,
+            'connects_total': stats.connects,
+            'invalidations_total': stats.invalidations,
+            'timeouts_total': stats.timeouts,
+            'checkout_wait': {
+                'count': stats.wait_count,
+                'sum_seconds': round(stats.wait_sum, 6),
+                'max_seconds': round(stats.wait_max, 6),
+                'buckets': dict(zip([str(b) for b in WAIT_BUCKETS], stats.wait_buckets)),
+            },
+        }
+    return {'pid': os.getpid(), 'engines': snapshot}
\ No newline at end of file
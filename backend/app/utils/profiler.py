@@ -0,0 +1,157 @@
+"""On-demand cProfile capture for single requests.
+
+A request is profiled when it carries a valid signed ``X-Profile`` header
+(see :func:`make_profile_token` and ``flask profile-token``) or when an
+authenticated admin adds ``?profile=1``. The profile is saved as a pstats
+file in ``PROFILE_DIR`` next to a small JSON summary, and the response
+carries its ID in ``X-Profile-Id``. Untriggered requests pay for one
+header and one query-string lookup.
+"""
+import cProfile
+import glob
+import hashlib
+import hmac
+import json
+import marshal
+import os
+import re
+import secrets
+import threading
+import time
+from datetime import datetime
+from flask import current_app, g, request
+from flask_jwt_extended import verify_jwt_in_request
+
+from app.utils.jobs import write_atomic
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_PATTERN = re.compile(r'^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$')
+
+def _signature(secret, expires):
+    return hmac.new(secret.encode(), f'profile:{expires}'.encode(), hashlib.sha256).hexdigest()
+
+def make_profile_token(secret, seconds):
+    """Return a header value that enables profiling for ``seconds``."""
+    expires = int(time.time()) + int(seconds)
+    return f'{expires}.{_signature(secret, expires)}'
+
+def valid_profile_token(secret, token):
+    """True if ``token`` was signed with ``secret`` and has not expired."""
+    expires, _, signature = token.partition('.')
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(secret, int(expires)))
+
+class RequestProfiler:
+    """Profiles one request at a time per worker and stores the result."""
+    
+    def __init__(self):
+        # cProfile hooks the interpreter, so overlapping profiles are skipped
+        self._lock = threading.Lock()
+    
+    def init_app(self, app):
+        app.config.setdefault('PROFILE_ENABLED', True)
+        app.config.setdefault('PROFILE_SECRET', None)
+        app.config.setdefault('PROFILE_DIR', os.path.join(app.config['SHARED_STATE_DIR'], 'profiles'))
+        app.config.setdefault('PROFILE_KEEP', 50)
+        if not app.config['PROFILE_ENABLED']:
+            return
+        
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._abandon)
+    
+    def _requested(self):
+        token = request.headers.get(PROFILE_HEADER)
+        if token:
+            secret = current_app.config['PROFILE_SECRET'] or current_app.config['SECRET_KEY']
+            return valid_profile_token(secret, token)
+        if request.args.get('profile') == '1':
+            try:
+                return verify_jwt_in_request(optional=True) is not None
+            except Exception:
+                return False
+        return False
+    
+    def _start(self):
+        if not (request.headers.get(PROFILE_HEADER) or 'profile' in request.args):
+            return
+        if not self._requested() or not self._lock.acquire(blocking=False):
+            return
+        
+        profile = cProfile.Profile()
+        g._profile = profile
+        g._profile_started = time.perf_counter()
+        profile.enable()
+    
+    def _finish(self, response):
+        profile = g.pop('_profile', None)
+        if profile is None:
+            return response
+        
+        profile.disable()
+        self._lock.release()
+        duration = time.perf_counter() - g.pop('_profile_started')
+        profile_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{secrets.token_hex(4)}"
+        summary = {
+            'id': profile_id,
+            'created_at': datetime.utcnow().isoformat(),
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.endpoint,
+            'status': response.status_code,
+            'duration_ms': round(duration * 1000, 3),
+            'sql_count': g.get('_sql_count', 0),
+        }
+        try:
+            self._save(profile, summary)
+        except OSError:
+            current_app.logger.exception('Failed to save request profile')
+            return response
+        
+        response.headers['X-Profile-Id'] = profile_id
+        return response
+    
+    def _abandon(self, error):
+        # The request failed before after_request ran
+        profile = g.pop('_profile', None)
+        if profile is not None:
+            profile.disable()
+            self._lock.release()
+    
+    def _save(self, profile, summary):
+        directory = current_app.config['PROFILE_DIR']
+        profile.create_stats()
+        # Same format as Profile.dump_stats, so pstats and snakeviz read it
+        write_atomic(os.path.join(directory, f"{summary['id']}.prof"), marshal.dumps(profile.stats))
+        write_atomic(os.path.join(directory, f"{summary['id']}.json"), json.dumps(summary))
+        self._prune(directory, current_app.config['PROFILE_KEEP'])
+    
+    def _prune(self, directory, keep):
+        summaries = sorted(glob.glob(os.path.join(directory, '*.json')), reverse=True)
+        for path in summaries[keep:]:
+            for name in (path, path[:-len('.json')] + '.prof'):
+                try:
+                    os.remove(name)
+                except FileNotFoundError:
+                    pass
+    
+    def summaries(self):
+        """Saved profile summaries, newest first."""
+        result = []
+        for path in sorted(glob.glob(os.path.join(current_app.config['PROFILE_DIR'], '*.json')), reverse=True):
+            try:
+                with open(path) as f:
+                    result.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return result
+    
+    def path_for(self, profile_id):
+        """The pstats file for a profile ID, or None if it is unknown."""
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = os.path.join(current_app.config['PROFILE_DIR'], f'{profile_id}.prof')
+        return path if os.path.exists(path) else None
+
+request_profiler = RequestProfiler()
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Per-request query budgets and N+1 detection.
+
+Views declare the most SQL statements they may run with ``@query_budget``.
+The statement count comes from the request metrics listener, so checking
+budgets costs nothing extra. With ``QUERY_TRACKING`` on (development and
+testing) every statement is also recorded in normalized form with its call
+site, and a statement one call site repeats ``QUERY_REPEAT_THRESHOLD``
+times in one request is reported as an N+1 pattern.
+
+``QUERY_BUDGET_MODE`` decides what happens to a violation: ``raise`` fails
+the request (so the test suite fails), ``log`` writes a warning and ``off``
+skips the checks.
+"""
+import os
+import re
+import sys
+from collections import Counter
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Application frames shown per recorded statement, innermost first
+CALL_SITE_DEPTH = 3
+
+_WHITESPACE = re.compile(r'\s+')
+_PLACEHOLDER = r'(?:\?|%s|%\(\w+\)s|:\w+)'
+_PLACEHOLDER_LIST = re.compile(rf'\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)')
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+class QueryBudgetExceeded(Exception):
+    """Raised in ``raise`` mode when a request breaks its query budget."""
+
+def query_budget(max_queries):
+    """Declare the most SQL statements a view may run per request."""
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+def normalize_sql(statement):
+    """Collapse a statement to its shape: literals and IN lists become ``?``."""
+    statement = _WHITESPACE.sub(' ', statement).strip()
+    statement = _LITERAL.sub('?', statement)
+    return _PLACEHOLDER_LIST.sub('(?)', statement)
+
+def _call_site():
+    sites = []
+    frame = sys._getframe(2)
+    while frame is not None and len(sites) < CALL_SITE_DEPTH:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_ROOT) and filename != __file__:
+            sites.append(f'{os.path.relpath(filename, os.path.dirname(APP_ROOT))}:{frame.f_lineno} in {frame.f_code.co_name}')
+        frame = frame.f_back
+    return ' <- '.join(sites) or 'unknown'
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        log = g.get('_query_log')
+        if log is not None:
+            log.append((normalize_sql(statement), _call_site()))
+
+# ==================== CHECKS ====================
+
+def find_repeated(log, threshold):
+    """Return ``(statement, call site, count)`` for statements one call site ran ``threshold`` times or more.
+    
+    Grouping by call site keeps unrelated lookups that happen to share a
+    statement (say, the current admin and the user being edited) apart.
+    """
+    return [(statement, site, count) for (statement, site), count in Counter(log).items() if count >= threshold]
+
+def _start_request():
+    g._query_log = []
+
+def _check_request(response):
+    config = current_app.config
+    log = g.pop('_query_log', None)
+    count = len(log) if log is not None else g.get('_sql_count', 0)
+    if log is not None:
+        response.headers['X-Query-Count'] = str(count)
+    if config['QUERY_BUDGET_MODE'] == 'off':
+        return response
+    
+    endpoint = request.endpoint or 'unmatched'
+    view = current_app.view_functions.get(request.endpoint)
+    budget = getattr(view, 'query_budget', None)
+    if budget is None:
+        budget = config['QUERY_BUDGET_DEFAULT'] or None
+    problems = []
+    if budget is not None and count > budget:
+        problems.append(f'{endpoint} ran {count} SQL statements (budget {budget})')
+    for statement, site, repeats in find_repeated(log or (), config['QUERY_REPEAT_THRESHOLD']):
+        problems.append(f'{endpoint} repeated a statement {repeats} times (possible N+1) at {site}: {statement}')
+    
+    if not problems:
+        return response
+    if config['QUERY_BUDGET_MODE'] == 'raise':
+        raise QueryBudgetExceeded('\n'.join(problems))
+    for problem in problems:
+        current_app.logger.warning(problem)
+    return response
+
+def init_app(app):
+    """Register the per-request checks (after the request metrics hooks)."""
+    app.config.setdefault('QUERY_TRACKING', False)
+    app.config.setdefault('QUERY_BUDGET_MODE', 'log')
+    app.config.setdefault('QUERY_BUDGET_DEFAULT', 0)
+    app.config.setdefault('QUERY_REPEAT_THRESHOLD', 3)
+    
+    if app.config['QUERY_TRACKING']:
+        app.before_request(_start_request)
+    # after_request hooks run in reverse, so this sees g._sql_count before
+    # the request metrics hook consumes it
+    app.after_request(_check_request)
\ No newline at end of file
@@ -0,0 +1,289 @@
+"""Per-endpoint request, SQL and JSON metrics aggregated across workers.
+
+Each worker accumulates plain counters in memory (a few dict updates per
+request) and a background thread flushes them to ``METRICS_DIR`` as one
+JSON file per process. A scrape merges every worker's file and renders
+the Prometheus text format.
+"""
+import glob
+import json
+import os
+import threading
+import time
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.jobs import write_atomic
+from app.utils.pool_metrics import WAIT_BUCKETS, pool_snapshot
+
+# Upper bounds of the histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+def _bucket_index(buckets, value):
+    for i, bound in enumerate(buckets):
+        if value <= bound:
+            return i
+    return len(buckets)
+
+def _new_endpoint_stats():
+    return {
+        'latency': [0] * (len(LATENCY_BUCKETS) + 1),
+        'latency_sum': 0.0,
+        'sql': [0] * (len(SQL_COUNT_BUCKETS) + 1),
+        'sql_sum': 0,
+        'sql_seconds': 0.0,
+        'json_seconds': 0.0,
+        'count': 0,
+    }
+
+# ==================== COLLECTION ====================
+
+class RequestMetrics:
+    """Collects per-request timings for this worker and flushes them to disk."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Forget everything recorded (e.g. state inherited across fork)."""
+        with self._lock:
+            self._requests = {}
+            self._endpoints = {}
+            self._dirty = False
+            self._pid = os.getpid()
+            self._flusher = None
+    
+    def init_app(self, app):
+        app.config.setdefault('METRICS_ENABLED', True)
+        app.config.setdefault('METRICS_FLUSH_SECONDS', 5)
+        app.config.setdefault('METRICS_DIR', os.path.join(app.config['SHARED_STATE_DIR'], 'metrics'))
+        if not app.config['METRICS_ENABLED']:
+            return
+        
+        app.before_request(_start_request)
+        app.after_request(self._finish_request)
+    
+    def _finish_request(self, response):
+        started = g.pop('_metrics_started', None)
+        if started is None:
+            return response
+        
+        self.observe(
+            request.blueprint or '',
+            request.endpoint or 'unmatched',
+            request.method,
+            response.status_code,
+            time.perf_counter() - started,
+            g.pop('_sql_count', 0),
+            g.pop('_sql_seconds', 0.0),
+            g.pop('_json_seconds', 0.0)
+        )
+        return response
+    
+    def observe(self, blueprint, endpoint, method, status, seconds, sql_count, sql_seconds, json_seconds):
+        """Record one finished request."""
+        request_key = (blueprint, endpoint, method, str(status))
+        endpoint_key = (blueprint, endpoint)
+        with self._lock:
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            stats = self._endpoints.get(endpoint_key)
+            if stats is None:
+                stats = self._endpoints[endpoint_key] = _new_endpoint_stats()
+            stats['latency'][_bucket_index(LATENCY_BUCKETS, seconds)] += 1
+            stats['latency_sum'] += seconds
+            stats['sql'][_bucket_index(SQL_COUNT_BUCKETS, sql_count)] += 1
+            stats['sql_sum'] += sql_count
+            stats['sql_seconds'] += sql_seconds
+            stats['json_seconds'] += json_seconds
+            stats['count'] += 1
+            self._dirty = True
+        
+        if self._flusher is None or self._pid != os.getpid():
+            self._start_flusher(current_app._get_current_object())
+    
+    def snapshot(self):
+        """This worker's data in the on-disk format."""
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'requests': [[*key, count] for key, count in self._requests.items()],
+                'endpoints': [[*key, dict(stats, latency=list(stats['latency']), sql=list(stats['sql']))]
+                              for key, stats in self._endpoints.items()],
+                'pool': pool_snapshot()['engines'],
+            }
+    
+    def flush(self, directory):
+        """Write this worker's file."""
+        self._dirty = False
+        path = os.path.join(directory, f'worker-{os.getpid()}.json')
+        write_atomic(path, json.dumps(self.snapshot(), separators=(',', ':')))
+    
+    def _start_flusher(self, app):
+        with self._lock:
+            if self._flusher is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._flusher = threading.Thread(target=self._flush_forever, args=(app,), daemon=True)
+        self._flusher.start()
+    
+    def _flush_forever(self, app):
+        interval = app.config['METRICS_FLUSH_SECONDS']
+        directory = app.config['METRICS_DIR']
+        while True:
+            time.sleep(interval)
+            if self._dirty:
+                try:
+                    self.flush(directory)
+                except OSError:
+                    app.logger.exception('Failed to flush request metrics')
+
+request_metrics = RequestMetrics()
+
+def _start_request():
+    g._metrics_started = time.perf_counter()
+
+def record_json_encode(seconds):
+    """Add JSON encoding time to the current request."""
+    if has_request_context():
+        g._json_seconds = g.get('_json_seconds', 0.0) + seconds
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    if has_request_context():
+        g._sql_count = g.get('_sql_count', 0) + 1
+        g._sql_seconds = g.get('_sql_seconds', 0.0) + elapsed
+
+# ==================== AGGREGATION ====================
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _add_lists(target, values):
+    for i, value in enumerate(values):
+        target[i] += value
+
+def merge_worker_files(directory):
+    """Sum every worker's file; pool gauges only count live workers."""
+    requests, endpoints, pools = {}, {}, {}
+    for path in glob.glob(os.path.join(directory, 'worker-*.json')):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        
+        for *key, count in data['requests']:
+            requests[tuple(key)] = requests.get(tuple(key), 0) + count
+        for blueprint, endpoint, stats in data['endpoints']:
+            merged = endpoints.setdefault((blueprint, endpoint), _new_endpoint_stats())
+            _add_lists(merged['latency'], stats['latency'])
+            _add_lists(merged['sql'], stats['sql'])
+            for name in ('latency_sum', 'sql_sum', 'sql_seconds', 'json_seconds', 'count'):
+                merged[name] += stats[name]
+        
+        alive = _pid_alive(data['pid'])
+        for engine, stats in data['pool'].items():
+            merged = pools.setdefault(engine, {'wait': [0] * (len(WAIT_BUCKETS) + 1), 'wait_sum': 0.0})
+            for name in ('checkouts_total', 'connects_total', 'invalidations_total', 'timeouts_total'):
+                merged[name] = merged.get(name, 0) + stats[name]
+            if alive:
+                for name in ('checked_out', 'overflow'):
+                    merged[name] = merged.get(name, 0) + stats.get(name, 0)
+            wait = stats['checkout_wait']
+            buckets = [wait['buckets'][str(bound)] for bound in WAIT_BUCKETS]
+            # Waits above the largest bucket only show up in the total count
+            _add_lists(merged['wait'], buckets + [wait['count'] - sum(buckets)])
+            merged['wait_sum'] += wait['sum_seconds']
+    return requests, endpoints, pools
+
+def clear_worker_files(directory):
+    """Remove files left by a previous server (call before forking workers)."""
+    for path in glob.glob(os.path.join(directory, 'worker-*.json')):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+# ==================== EXPOSITION ====================
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+def _histogram(lines, name, buckets, counts, total_sum, **labels):
+    cumulative = 0
+    for bound, count in zip(buckets, counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{_labels(**labels, le=bound)} {cumulative}')
+    cumulative += counts[len(buckets)]
+    lines.append(f'{name}_bucket{_labels(**labels, le="+Inf")} {cumulative}')
+    lines.append(f'{name}_sum{_labels(**labels)} {total_sum}')
+    lines.append(f'{name}_count{_labels(**labels)} {cumulative}')
+
+def _header(lines, name, kind, text):
+    lines.append(f'# HELP {name} {text}')
+    lines.append(f'# TYPE {name} {kind}')
+
+def render_prometheus():
+    """Flush this worker, merge all workers and render the text format."""
+    directory = current_app.config['METRICS_DIR']
+    request_metrics.flush(directory)
+    requests, endpoints, pools = merge_worker_files(directory)
+    lines = []
+    
+    _header(lines, 'http_requests_total', 'counter', 'Requests by endpoint, method and status.')
+    for (blueprint, endpoint, method, status), count in sorted(requests.items()):
+        lines.append(f'http_requests_total{_labels(blueprint=blueprint, endpoint=endpoint, method=method, status=status)} {count}')
+    
+    ordered = sorted(endpoints.items())
+    _header(lines, 'http_request_duration_seconds', 'histogram', 'Request latency.')
+    for (blueprint, endpoint), stats in ordered:
+        _histogram(lines, 'http_request_duration_seconds', LATENCY_BUCKETS, stats['latency'],
+                   stats['latency_sum'], blueprint=blueprint, endpoint=endpoint)
+    
+    _header(lines, 'http_request_sql_statements', 'histogram', 'SQL statements executed per request.')
+    for (blueprint, endpoint), stats in ordered:
+        _histogram(lines, 'http_request_sql_statements', SQL_COUNT_BUCKETS, stats['sql'],
+                   stats['sql_sum'], blueprint=blueprint, endpoint=endpoint)
+    
+    _header(lines, 'http_request_sql_seconds_total', 'counter', 'Time spent executing SQL.')
+    for (blueprint, endpoint), stats in ordered:
+        lines.append(f'http_request_sql_seconds_total{_labels(blueprint=blueprint, endpoint=endpoint)} {stats["sql_seconds"]}')
+    
+    _header(lines, 'http_response_json_encode_seconds_total', 'counter', 'Time spent encoding JSON responses.')
+    for (blueprint, endpoint), stats in ordered:
+        lines.append(f'http_response_json_encode_seconds_total{_labels(blueprint=blueprint, endpoint=endpoint)} {stats["json_seconds"]}')
+    
+    for name, kind, text in (
+        ('checkouts_total', 'counter', 'Connection checkouts.'),
+        ('connects_total', 'counter', 'New DBAPI connections.'),
+        ('invalidations_total', 'counter', 'Invalidated connections.'),
+        ('timeouts_total', 'counter', 'Checkouts that timed out waiting.'),
+        ('checked_out', 'gauge', 'Connections currently checked out (live workers).'),
+        ('overflow', 'gauge', 'Overflow connections open (live workers).'),
+    ):
+        _header(lines, f'db_pool_{name}', kind, text)
+        for engine, stats in sorted(pools.items()):
+            lines.append(f'db_pool_{name}{_labels(engine=engine)} {stats.get(name, 0)}')
+    
+    _header(lines, 'db_pool_checkout_wait_seconds', 'histogram', 'Time waiting for a pooled connection.')
+    for engine, stats in sorted(pools.items()):
+        _histogram(lines, 'db_pool_checkout_wait_seconds', WAIT_BUCKETS, stats['wait'], stats['wait_sum'], engine=engine)
+    
+    return '\n'.join(lines) + '\n'
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Per-worker cache of public GET responses with precompressed variants."""
+from functools import wraps
+from flask import current_app, request
+
+from app.utils.cache import TTLCache
+from app.utils.compression import available_encodings, choose_encoding, compress, is_compressible
+
+# Headers that belong to a single response rather than to the cached body
+UNCACHED_HEADERS = {'content-length', 'content-encoding', 'set-cookie', 'vary'}
+
+class CachedResponse:
+    """A response body stored once per content coding.
+    
+    Every enabled coding is produced when the entry is stored, so serving
+    a hit is a dict lookup with no serialization or compression work.
+    """
+    
+    __slots__ = ('status', 'headers', 'variants')
+    
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = [(k, v) for k, v in response.headers if k.lower() not in UNCACHED_HEADERS]
+        body = response.get_data()
+        self.variants = {None: body}
+        if len(body) >= current_app.config['COMPRESS_MIN_SIZE']:
+            for encoding in available_encodings():
+                self.variants[encoding] = compress(body, encoding)
+    
+    def respond(self, cache_state):
+        encodings = [encoding for encoding in self.variants if encoding]
+        encoding = choose_encoding(encodings)
+        response = current_app.response_class(self.variants[encoding], status=self.status, headers=self.headers)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        response.headers['X-Cache'] = cache_state
+        return response
+
+def cached_response(*table_names):
+    """Cache a public GET view until the TTL elapses or a table changes.
+    
+    ``table_names`` are the tables the view reads; a commit touching any
+    of them (in any worker) drops the view's entries.
+    """
+    def decorator(view):
+        cache = TTLCache('PUBLIC_CACHE_TTL_SECONDS', table_names, maxsize=256)
+        
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET' or not current_app.config['PUBLIC_CACHE_TTL_SECONDS']:
+                return view(*args, **kwargs)
+            
+            key = request.full_path
+            entry = cache.get(key)
+            if entry is not None:
+                return entry.respond('HIT')
+            
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.status_code != 200 or not is_compressible(response):
+                return response
+            
+            entry = CachedResponse(response)
+            cache.set(key, entry)
+            return entry.respond('MISS')
+        
+        return wrapper
+    return decorator
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""Shared JWT revocation store with a per-worker bloom filter."""
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+from app.models.revoked_token import RevokedToken
+from app.replica import reading_primary
+from app.utils.cache import get_stamp
+
+STAMP_NAME = 'revoked_tokens'
+
+class BloomFilter:
+    """Fixed-size bloom filter over string keys."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        capacity = max(int(capacity), 1)
+        self.capacity = capacity
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        """Add a key to the filter."""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+class RevocationStore:
+    """Revoked JTIs persisted in the database and mirrored into a bloom filter.
+
+    Each worker keeps its own filter. Lookups for tokens that were never
+    revoked are answered from the filter alone; only filter hits go to the
+    database. The filter is topped up incrementally whenever another worker
+    bumps the shared stamp or the refresh interval elapses, and rebuilt from
+    scratch periodically so expired entries drop out.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = None
+        self._stamp_seen = None
+        self._synced_at = None
+        self._checked_at = 0.0
+        self._rebuilt_at = 0.0
+        self._purged_at = 0.0
+
+    def init_app(self, app):
+        app.config.setdefault('REVOCATION_REFRESH_SECONDS', 5)
+        app.config.setdefault('REVOCATION_REBUILD_SECONDS', 3600)
+        app.config.setdefault('REVOCATION_BLOOM_CAPACITY', 100000)
+        app.config.setdefault('REVOCATION_BLOOM_ERROR_RATE', 0.001)
+
+    def revoke(self, jwt_payload):
+        """Persist a token's JTI until the token's own expiry."""
+        jti = jwt_payload['jti']
+        expires_at = datetime.utcfromtimestamp(jwt_payload['exp'])
+        token = RevokedToken(
+            jti=jti,
+            token_type=jwt_payload.get('type', 'access'),
+            user_identity=str(jwt_payload.get('sub')),
+            expires_at=expires_at
+        )
+        db.session.add(token)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent logout with the same token got there first
+            db.session.rollback()
+            return
+
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+        get_stamp(STAMP_NAME).bump()
+        self._maybe_purge()
+
+    def is_revoked(self, jti):
+        """Return True if the JTI has been revoked and has not yet expired."""
+        with reading_primary():
+            self._sync()
+            if jti not in self._filter:
+                return False
+
+            return db.session.query(
+                RevokedToken.query.filter(
+                    RevokedToken.jti == jti,
+                    RevokedToken.expires_at > datetime.utcnow()
+                ).exists()
+            ).scalar()
+
+    def purge_expired(self):
+        """Delete revocation rows whose tokens have expired anyway."""
+        deleted = RevokedToken.query.filter(
+            RevokedToken.expires_at <= datetime.utcnow()
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+
+    def _maybe_purge(self):
+        now = time.monotonic()
+        if now - self._purged_at < current_app.config['REVOCATION_REBUILD_SECONDS']:
+            return
+        self._purged_at = now
+        self.purge_expired()
+
+    def _sync(self):
+        config = current_app.config
+        now = time.monotonic()
+        stamp = get_stamp(STAMP_NAME).read()
+
+        if (self._filter is not None and stamp == self._stamp_seen
+                and now - self._checked_at < config['REVOCATION_REFRESH_SECONDS']):
+            return
+
+        with self._lock:
+            rebuild = (
+                self._filter is None
+                or now - self._rebuilt_at >= config['REVOCATION_REBUILD_SECONDS']
+                or self._filter.count >= self._filter.capacity
+            )
+            if rebuild:
+                self._rebuild(now)
+            else:
+                self._top_up()
+            self._stamp_seen = stamp
+            self._checked_at = now
+
+    def _rebuild(self, now):
+        config = current_app.config
+        synced_at = datetime.utcnow()
+        rows = db.session.query(RevokedToken.jti).filter(
+            RevokedToken.expires_at > synced_at
+        ).all()
+
+        bloom = BloomFilter(
+            max(config['REVOCATION_BLOOM_CAPACITY'], len(rows) * 2),
+            config['REVOCATION_BLOOM_ERROR_RATE']
+        )
+        for (jti,) in rows:
+            bloom.add(jti)
+
+        self._filter = bloom
+        self._synced_at = synced_at
+        self._rebuilt_at = now
+
+    def _top_up(self):
+        # Overlap the window so rows committed out of order by other
+        # workers are not missed. Keys already in the filter are skipped so
+        # the overlap does not inflate its count and force early rebuilds.
+        synced_at = datetime.utcnow()
+        since = self._synced_at - timedelta(seconds=30)
+        rows = db.session.query(RevokedToken.jti).filter(
+            RevokedToken.created_at >= since,
+            RevokedToken.expires_at > synced_at
+        ).all()
+
+        for (jti,) in rows:
+            if jti not in self._filter:
+                self._filter.add(jti)
+        self._synced_at = synced_at
+
+revocation_store = RevocationStore()
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""Set-based academic year rollover.
+
+A rollover promotes every active student along a grade-progression map,
+graduates the final grade, moves graduated and transferred students into
+``archived_students`` and ends the current schedules. Each step is a single
+statement over the whole table (``UPDATE ... CASE``, ``INSERT ... SELECT``)
+and every step runs in one transaction, so a year with thousands of
+students costs a handful of round trips.
+
+Before anything changes, the grade and status of every promoted student
+and the end date of every expired schedule are copied into snapshot
+tables; :func:`undo_rollover` restores from them.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import case, delete, func, insert, literal, or_, select, update
+
+from app.extensions import db
+from app.models.archived_student import ArchivedStudent
+from app.models.rollover import Rollover, RolloverSchedule, RolloverStudent
+from app.models.schedule import Schedule
+from app.models.student import Student
+from app.utils.archiving import ARCHIVED_STUDENT_STATUSES
+
+# Grade-map value that graduates a grade instead of promoting it
+GRADUATED = 'graduated'
+
+DEFAULT_GRADE_MAP = {
+    **{f'Grade {n}': f'Grade {n + 1}' for n in range(1, 12)},
+    'Grade 12': GRADUATED,
+}
+
+# Student columns copied to and from the archive table
+STUDENT_COLUMNS = [column.name for column in Student.__table__.columns]
+
+def validate_grade_map(grade_map):
+    """Validate a ``{current grade: next grade or 'graduated'}`` map."""
+    if not isinstance(grade_map, dict) or not grade_map:
+        return False, 'grade_map must be a non-empty object'
+    for old, new in grade_map.items():
+        if not isinstance(new, str) or not new.strip() or not old.strip():
+            return False, 'grade_map keys and values must be non-empty strings'
+        if len(new) > Student.grade_level.type.length:
+            return False, f'Grade level too long: {new}'
+    return True, None
+
+def _promoted():
+    return Student.status == 'active'
+
+def _expiring(effective_date):
+    return (
+        Schedule.effective_from < effective_date,
+        or_(Schedule.effective_until.is_(None), Schedule.effective_until >= effective_date),
+    )
+
+def preview_rollover(grade_map, effective_date):
+    """Counts of what a rollover would change, without changing anything."""
+    per_grade = dict(db.session.execute(
+        select(Student.grade_level, func.count()).where(_promoted()).group_by(Student.grade_level)
+    ).all())
+    already_leaving = db.session.execute(
+        select(func.count()).select_from(Student).where(Student.status.in_(ARCHIVED_STUDENT_STATUSES))
+    ).scalar()
+    schedules = db.session.execute(
+        select(func.count()).select_from(Schedule).where(*_expiring(effective_date))
+    ).scalar()
+    
+    grades = [
+        {'from': old, 'to': new, 'count': per_grade.get(old, 0)}
+        for old, new in grade_map.items()
+    ]
+    graduated = sum(grade['count'] for grade in grades if grade['to'] == GRADUATED)
+    return {
+        'grades': grades,
+        'unmapped': [
+            {'grade': grade, 'count': count}
+            for grade, count in sorted(per_grade.items()) if grade not in grade_map
+        ],
+        'promoted': sum(grade['count'] for grade in grades) - graduated,
+        'graduated': graduated,
+        'archived': already_leaving + graduated,
+        'schedules_expired': schedules,
+    }
+
+def run_rollover(grade_map, effective_date, performed_by=None, expire_schedules=True):
+    """Apply a rollover in the current transaction and return its record.
+    
+    The caller commits (or rolls back) the session.
+    """
+    now = datetime.utcnow()
+    rollover = Rollover(grade_map=grade_map, effective_date=effective_date, performed_by=performed_by, created_at=now)
+    db.session.add(rollover)
+    db.session.flush()
+    rollover_id = literal(rollover.id, db.Integer)
+    changed = (_promoted(), Student.grade_level.in_(list(grade_map)))
+    
+    db.session.execute(insert(RolloverStudent).from_select(
+        ['rollover_id', 'student_id', 'grade_level', 'status'],
+        select(rollover_id, Student.id, Student.grade_level, Student.status).where(*changed)
+    ))
+    
+    promotions = {old: new for old, new in grade_map.items() if new != GRADUATED}
+    graduating = [old for old, new in grade_map.items() if new == GRADUATED]
+    values = {'updated_at': now, 'version': Student.version + 1}
+    if promotions:
+        values['grade_level'] = case(promotions, value=Student.grade_level, else_=Student.grade_level)
+    if graduating:
+        values['status'] = case((Student.grade_level.in_(graduating), GRADUATED), else_=Student.status)
+    result = db.session.execute(
+        update(Student).where(*changed).values(**values).execution_options(synchronize_session=False)
+    )
+    counts = {'students_changed': result.rowcount}
+    
+    leaving = Student.status.in_(ARCHIVED_STUDENT_STATUSES)
+    result = db.session.execute(insert(ArchivedStudent).from_select(
+        STUDENT_COLUMNS + ['archived_at', 'rollover_id'],
+        select(*[Student.__table__.c[name] for name in STUDENT_COLUMNS], literal(now, db.DateTime), rollover_id).where(leaving)
+    ))
+    counts['archived'] = result.rowcount
+    db.session.execute(delete(Student).where(leaving).execution_options(synchronize_session=False))
+    
+    counts['schedules_expired'] = 0
+    if expire_schedules:
+        db.session.execute(insert(RolloverSchedule).from_select(
+            ['rollover_id', 'schedule_id', 'effective_until'],
+            select(rollover_id, Schedule.id, Schedule.effective_until).where(*_expiring(effective_date))
+        ))
+        result = db.session.execute(
+            update(Schedule).where(*_expiring(effective_date))
+            .values(effective_until=effective_date - timedelta(days=1), updated_at=now, version=Schedule.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        counts['schedules_expired'] = result.rowcount
+    
+    rollover.counts = counts
+    return rollover
+
+def undo_rollover(rollover):
+    """Restore what a rollover changed from its snapshot.
+    
+    Archived students go back to the hot table, then grades, statuses and
+    schedule end dates are reset with correlated ``UPDATE`` statements. The
+    caller commits; an ``IntegrityError`` means a restored student clashes
+    with one created since.
+    """
+    archived = ArchivedStudent.rollover_id == rollover.id
+    db.session.execute(insert(Student).from_select(
+        STUDENT_COLUMNS,
+        select(*[ArchivedStudent.__table__.c[name] for name in STUDENT_COLUMNS]).where(archived)
+    ))
+    db.session.execute(delete(ArchivedStudent).where(archived).execution_options(synchronize_session=False))
+    
+    snapshot = select(RolloverStudent).where(
+        RolloverStudent.rollover_id == rollover.id, RolloverStudent.student_id == Student.id
+    )
+    db.session.execute(
+        update(Student)
+        .where(Student.id.in_(select(RolloverStudent.student_id).where(RolloverStudent.rollover_id == rollover.id)))
+        .values(
+            grade_level=snapshot.with_only_columns(RolloverStudent.grade_level).scalar_subquery(),
+            status=snapshot.with_only_columns(RolloverStudent.status).scalar_subquery(),
+            updated_at=datetime.utcnow(),
+            version=Student.version + 1
+        )
+        .execution_options(synchronize_session=False)
+    )
+    
+    schedule_snapshot = select(RolloverSchedule.effective_until).where(
+        RolloverSchedule.rollover_id == rollover.id, RolloverSchedule.schedule_id == Schedule.id
+    )
+    db.session.execute(
+        update(Schedule)
+        .where(Schedule.id.in_(select(RolloverSchedule.schedule_id).where(RolloverSchedule.rollover_id == rollover.id)))
+        .values(
+            effective_until=schedule_snapshot.scalar_subquery(),
+            updated_at=datetime.utcnow(),
+            version=Schedule.version + 1
+        )
+        .execution_options(synchronize_session=False)
+    )
+    
+    db.session.execute(delete(RolloverStudent).where(RolloverStudent.rollover_id == rollover.id))
+    db.session.execute(delete(RolloverSchedule).where(RolloverSchedule.rollover_id == rollover.id))
+    rollover.undone_at = datetime.utcnow()
+    return rollover
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Database seeding utilities."""
 import os
+from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models.user import User
 
@@ -21,7 +22,13 @@ def seed_admin_user():
         admin.set_password(admin_password)
         
         db.session.add(admin)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another process seeded concurrently
+            db.session.rollback()
+            print("Admin user already exists, skipping seed.")
+            return
         
         print(f"Default admin user created: admin / {admin_password}")
         print("IMPORTANT: Please change the default password after first login!")
@@ -0,0 +1,256 @@
+"""Slow-query log with optional EXPLAIN capture.
+
+Statements slower than ``SLOW_QUERY_THRESHOLD_MS`` are recorded with their
+normalized SQL, the statement as sent (placeholders, no values), the shape
+of their bound parameters, the endpoint that ran them and their duration.
+A background thread appends the records as JSON lines to ``SLOW_QUERY_LOG_FILE``, rotating it by size under
+a file lock so every worker can share it.
+
+With ``SLOW_QUERY_EXPLAIN`` on, SELECTs also get a plan, at most once per
+statement shape every ``SLOW_QUERY_EXPLAIN_INTERVAL`` seconds. SQLite's
+``EXPLAIN QUERY PLAN`` only compiles the statement, so it runs inline on
+the same connection. PostgreSQL's ``EXPLAIN (ANALYZE, BUFFERS)`` runs the
+query again, so it happens in the background on a separate connection
+inside a transaction that is rolled back.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from flask import current_app, has_app_context, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.utils.query_budget import normalize_sql
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts rotate without a lock
+    fcntl = None
+
+# Records waiting for the writer thread; more than this are dropped
+QUEUE_SIZE = 1000
+
+EXPLAINABLE = ('select', 'with')
+
+def parameter_shape(parameters):
+    """Describe bound parameters by type and length without their values."""
+    if isinstance(parameters, dict):
+        return {key: _value_shape(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(value) for value in parameters]
+    return _value_shape(parameters)
+
+def _value_shape(value):
+    if value is None:
+        return 'null'
+    if isinstance(value, (str, bytes)):
+        return f'{type(value).__name__}({len(value)})'
+    if isinstance(value, (list, tuple)):
+        return f'{type(value).__name__}[{len(value)}]'
+    return type(value).__name__
+
+def _sqlite_plan(cursor, statement, parameters):
+    rows = cursor.connection.execute(f'EXPLAIN QUERY PLAN {statement}', parameters).fetchall()
+    return '\n'.join(row[-1] for row in rows)
+
+def _postgresql_plan(engine, statement, parameters):
+    with engine.connect().execution_options(slow_query_log=False) as conn:
+        try:
+            rows = conn.exec_driver_sql(f'EXPLAIN (ANALYZE, BUFFERS) {statement}', parameters).all()
+        finally:
+            conn.rollback()
+    return '\n'.join(row[0] for row in rows)
+
+class SlowQueryLog:
+    """Records slow statements and appends them to a shared rotating file."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Drop the queue and writer thread (e.g. state inherited across fork)."""
+        with self._lock:
+            self._queue = queue.Queue(QUEUE_SIZE)
+            self._writer = None
+            self._pid = os.getpid()
+            self._explained = {}
+    
+    def init_app(self, app):
+        app.config.setdefault('SLOW_QUERY_THRESHOLD_MS', 200)
+        app.config.setdefault('SLOW_QUERY_EXPLAIN', False)
+        app.config.setdefault('SLOW_QUERY_EXPLAIN_INTERVAL', 300)
+        app.config.setdefault('SLOW_QUERY_LOG_FILE', os.path.join(app.config['SHARED_STATE_DIR'], 'slow_queries.log'))
+        app.config.setdefault('SLOW_QUERY_LOG_MAX_BYTES', 1024 * 1024)
+        app.config.setdefault('SLOW_QUERY_LOG_BACKUPS', 3)
+    
+    def record(self, conn, cursor, statement, parameters, seconds, executemany):
+        """Queue one slow statement (called from the cursor event)."""
+        app = current_app._get_current_object()
+        shape = normalize_sql(statement)
+        entry = {
+            'at': datetime.utcnow().isoformat(),
+            'duration_ms': round(seconds * 1000, 3),
+            'endpoint': request.endpoint if has_request_context() else None,
+            'dialect': conn.dialect.name,
+            'statement': shape,
+            'sql': ' '.join(statement.split()),
+            'parameters': parameter_shape(parameters[0] if executemany and parameters else parameters),
+            'plan': None,
+        }
+        
+        explain = (
+            app.config['SLOW_QUERY_EXPLAIN'] and not executemany
+            and statement.lstrip().lower().startswith(EXPLAINABLE)
+            and self._claim_explain(shape, app.config['SLOW_QUERY_EXPLAIN_INTERVAL'])
+        )
+        job = None
+        if explain and conn.dialect.name == 'sqlite':
+            try:
+                entry['plan'] = _sqlite_plan(cursor, statement, parameters)
+            except Exception as error:
+                entry['plan'] = f'EXPLAIN failed: {error}'
+        elif explain and conn.dialect.name == 'postgresql':
+            job = (conn.engine, statement, parameters)
+        
+        self._ensure_writer(app)
+        try:
+            self._queue.put_nowait((entry, job))
+        except queue.Full:
+            pass
+    
+    def _claim_explain(self, shape, interval):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._explained.get(shape, -interval) < interval:
+                return False
+            self._explained[shape] = now
+            return True
+    
+    def _ensure_writer(self, app):
+        if self._writer is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._writer is not None and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(QUEUE_SIZE)
+                self._pid = os.getpid()
+            self._writer = threading.Thread(target=self._write_forever, args=(app,), daemon=True)
+        self._writer.start()
+    
+    def _write_forever(self, app):
+        while True:
+            entry, job = self._queue.get()
+            try:
+                if job is not None:
+                    try:
+                        entry['plan'] = _postgresql_plan(*job)
+                    except Exception as error:
+                        entry['plan'] = f'EXPLAIN failed: {error}'
+                self.append(app.config, entry)
+            except OSError:
+                app.logger.exception('Failed to write slow query log')
+            finally:
+                self._queue.task_done()
+    
+    def flush(self):
+        """Block until every queued record has been written."""
+        self._queue.join()
+    
+    # ==================== FILE ====================
+    
+    def append(self, config, entry):
+        """Append one record, rotating the file first if it is full."""
+        path = config['SLOW_QUERY_LOG_FILE']
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with open(f'{path}.lock', 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if os.path.exists(path) and os.path.getsize(path) + len(line) > config['SLOW_QUERY_LOG_MAX_BYTES']:
+                    self._rotate(path, config['SLOW_QUERY_LOG_BACKUPS'])
+                with open(path, 'a') as f:
+                    f.write(line)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+    
+    def _rotate(self, path, backups):
+        if backups < 1:
+            os.remove(path)
+            return
+        for i in range(backups - 1, 0, -1):
+            if os.path.exists(f'{path}.{i}'):
+                os.replace(f'{path}.{i}', f'{path}.{i + 1}')
+        os.replace(path, f'{path}.1')
+    
+    def entries(self):
+        """Every record still on disk, oldest file first."""
+        config = current_app.config
+        path = config['SLOW_QUERY_LOG_FILE']
+        paths = [f'{path}.{i}' for i in range(config['SLOW_QUERY_LOG_BACKUPS'], 0, -1)] + [path]
+        for name in paths:
+            try:
+                with open(name) as f:
+                    for line in f:
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            except FileNotFoundError:
+                continue
+    
+    def worst(self, limit=20, sort='total_ms'):
+        """Aggregate records by statement shape, worst first."""
+        groups = {}
+        for entry in self.entries():
+            group = groups.get(entry['statement'])
+            if group is None:
+                group = groups[entry['statement']] = {
+                    'statement': entry['statement'],
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'endpoints': set(),
+                    'last_seen': None,
+                    'sql': None,
+                    'parameters': None,
+                    'plan': None,
+                }
+            group['count'] += 1
+            group['total_ms'] += entry['duration_ms']
+            group['max_ms'] = max(group['max_ms'], entry['duration_ms'])
+            if entry['endpoint']:
+                group['endpoints'].add(entry['endpoint'])
+            group['last_seen'] = entry['at']
+            group['sql'] = entry.get('sql')
+            group['parameters'] = entry['parameters']
+            if entry['plan']:
+                group['plan'] = entry['plan']
+        
+        for group in groups.values():
+            group['total_ms'] = round(group['total_ms'], 3)
+            group['mean_ms'] = round(group['total_ms'] / group['count'], 3)
+            group['endpoints'] = sorted(group['endpoints'])
+        return sorted(groups.values(), key=lambda group: group[sort], reverse=True)[:limit]
+
+slow_query_log = SlowQueryLog()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _check_duration(conn, cursor, statement, parameters, context, executemany):
+    # _query_started is set by the request metrics listener
+    started = getattr(context, '_query_started', None)
+    if started is None or not has_app_context():
+        return
+    threshold = current_app.config.get('SLOW_QUERY_THRESHOLD_MS')
+    seconds = time.perf_counter() - started
+    if not threshold or seconds * 1000 < threshold:
+        return
+    if not context.execution_options.get('slow_query_log', True):
+        return
+    slow_query_log.record(conn, cursor, statement, parameters, seconds, executemany)
\ No newline at end of file
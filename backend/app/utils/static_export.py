@@ -0,0 +1,198 @@
+"""Export public endpoints as static JSON files for a CDN or static host."""
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime
+from itertools import combinations
+from urllib.parse import urlencode
+from flask import current_app
+
+from app.extensions import db
+from app.models.teacher import Teacher
+from app.models.material import Material
+from app.models.schedule import Schedule
+from app.replica import STICKY_COOKIE
+from app.utils.cache import get_stamp, on_tables_changed
+from app.utils.jobs import DebouncedJob, write_atomic
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts export without a lock
+    fcntl = None
+
+MANIFEST = 'manifest.json'
+
+# ==================== TARGETS ====================
+
+def _filter_combinations(model, dimensions, *criteria):
+    """Every filter combination that matches at least one row.
+    
+    ``dimensions`` maps query parameter names to columns. The result
+    includes the empty combination (no filters).
+    """
+    names = list(dimensions)
+    rows = db.session.query(*dimensions.values()).filter(*criteria).distinct().all()
+    combos = {()}
+    for size in range(1, len(names) + 1):
+        for indexes in combinations(range(len(names)), size):
+            for row in rows:
+                if all(row[i] for i in indexes):
+                    combos.add(tuple((names[i], row[i]) for i in indexes))
+    return [dict(combo) for combo in sorted(combos)]
+
+def _teacher_targets():
+    yield '/api/public/teachers/departments', {}, False
+    departments = {'department': Teacher.department}
+    for params in _filter_combinations(Teacher, departments, Teacher.is_active == True):
+        yield '/api/public/teachers', params, True
+    for (teacher_id,) in db.session.query(Teacher.id).filter(Teacher.is_active == True):
+        yield f'/api/public/teachers/{teacher_id}', {}, False
+
+def _material_targets():
+    # Material detail pages are not exported: each view bumps a counter
+    yield '/api/public/materials/filters', {}, False
+    dimensions = {
+        'subject': Material.subject,
+        'grade_level': Material.grade_level,
+        'type': Material.material_type,
+    }
+    for params in _filter_combinations(Material, dimensions, Material.is_public == True):
+        yield '/api/public/materials', params, True
+
+def _schedule_targets():
+    yield '/api/public/schedules/filters', {}, False
+    dimensions = {
+        'grade_level': Schedule.grade_level,
+        'section': Schedule.section,
+        'day': Schedule.day_of_week,
+    }
+    for params in _filter_combinations(Schedule, dimensions, Schedule.in_effect(date.today())):
+        yield '/api/public/schedules', params, True
+
+# Each group is re-rendered when any of its tables changes
+EXPORT_GROUPS = {
+    'teachers': (('teachers',), _teacher_targets),
+    'materials': (('materials',), _material_targets),
+    'schedules': (('schedules', 'teachers'), _schedule_targets),
+}
+
+EXPORT_TABLES = sorted({table for tables, _ in EXPORT_GROUPS.values() for table in tables})
+
+def static_path(path, params):
+    """Relative file for a URL: ``/a/b`` -> ``a/b.json``, ``/a/b?x=1`` -> ``a/b/x=1.json``."""
+    base = path.strip('/')
+    if not params:
+        return f'{base}.json'
+    return f"{base}/{urlencode(sorted(params.items())).replace('/', '%2F')}.json"
+
+# ==================== EXPORTER ====================
+
+class StaticExporter:
+    """Renders public endpoints into ``STATIC_EXPORT_DIR``.
+    
+    Files hold exactly the API response body and are replaced atomically.
+    ``manifest.json`` records a version number, the table stamps the
+    export reflects, and every file's URL and hash. A later export only
+    re-renders groups whose tables changed since then, only rewrites
+    files whose content changed, and deletes files that no longer have
+    a matching filter combination.
+    """
+    
+    def __init__(self):
+        self._job = DebouncedJob('static export', self.export, 'STATIC_EXPORT_DELAY_SECONDS')
+    
+    def init_app(self, app):
+        app.config.setdefault('STATIC_EXPORT_DIR', None)
+        app.config.setdefault('STATIC_EXPORT_DELAY_SECONDS', 10)
+    
+    def export(self, output_dir=None, full=False):
+        """Bring the export directory up to date and return a summary."""
+        output_dir = output_dir or current_app.config['STATIC_EXPORT_DIR']
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, '.lock'), 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            return self._export(output_dir, full)
+    
+    def _export(self, output_dir, full):
+        manifest = self._read_manifest(output_dir)
+        # Read stamps first: a commit during the export triggers another one
+        stamps = {name: get_stamp(name).read() for name in EXPORT_TABLES}
+        changed = {name for name in EXPORT_TABLES if full or stamps[name] != manifest['stamps'].get(name)}
+        groups = [group for group, (tables, _) in EXPORT_GROUPS.items() if changed.intersection(tables)]
+        
+        summary = {'version': manifest['version'], 'groups': groups, 'written': 0, 'unchanged': 0, 'removed': 0}
+        if not groups:
+            return summary
+        
+        client = current_app.test_client()
+        # Read from the primary so a just-committed change is never missed
+        client.set_cookie(STICKY_COOKIE, str(time.time() + 3600))
+        
+        files = manifest['files']
+        for group in groups:
+            rendered = set()
+            for path, params, paged in EXPORT_GROUPS[group][1]():
+                for url, body in self._render(client, path, params, paged):
+                    relative = static_path(url[0], url[1])
+                    rendered.add(relative)
+                    digest = hashlib.sha256(body).hexdigest()
+                    entry = files.get(relative)
+                    if entry and entry['sha256'] == digest and os.path.exists(os.path.join(output_dir, relative)):
+                        summary['unchanged'] += 1
+                        continue
+                    write_atomic(os.path.join(output_dir, relative), body)
+                    files[relative] = {'url': _url(*url), 'group': group, 'sha256': digest}
+                    summary['written'] += 1
+            
+            for relative in [name for name, entry in files.items() if entry['group'] == group and name not in rendered]:
+                try:
+                    os.remove(os.path.join(output_dir, relative))
+                except FileNotFoundError:
+                    pass
+                del files[relative]
+                summary['removed'] += 1
+        
+        if summary['written'] or summary['removed'] or stamps != manifest['stamps']:
+            manifest['version'] += 1
+            manifest['stamps'] = stamps
+            manifest['generated_at'] = datetime.utcnow().isoformat()
+            write_atomic(os.path.join(output_dir, MANIFEST), json.dumps(manifest, indent=1, sort_keys=True))
+        summary['version'] = manifest['version']
+        return summary
+    
+    def _render(self, client, path, params, paged):
+        """Yield ((path, params), body) for the URL, following every page."""
+        page, pages = 1, 1
+        while page <= pages:
+            query = dict(params, page=page) if page > 1 else dict(params)
+            response = client.get(path, query_string=query)
+            if response.status_code != 200:
+                current_app.logger.warning('Static export skipped %s (%s)', _url(path, query), response.status_code)
+                return
+            yield (path, query), response.get_data()
+            if paged:
+                pages = response.get_json()['data']['pages']
+            page += 1
+    
+    def _read_manifest(self, output_dir):
+        try:
+            with open(os.path.join(output_dir, MANIFEST)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'version': 0, 'stamps': {}, 'files': {}}
+    
+    def schedule_export(self):
+        """Export in a background thread shortly after the current commit."""
+        self._job.schedule()
+
+def _url(path, params):
+    return f'{path}?{urlencode(sorted(params.items()))}' if params else path
+
+static_exporter = StaticExporter()
+
+@on_tables_changed
+def _export_after_commit(tables):
+    if current_app.config.get('STATIC_EXPORT_DIR') and not tables.isdisjoint(EXPORT_TABLES):
+        static_exporter.schedule_export()
\ No newline at end of file
@@ -1,11 +1,14 @@
 """Input validation utilities."""
 import re
+from flask import current_app
 from email_validator import validate_email as email_validator, EmailNotValidError
 
 def validate_email(email):
     """Validate email address."""
+    # The deliverability check is a DNS lookup that blocks the worker
+    check_deliverability = current_app.config.get('EMAIL_CHECK_DELIVERABILITY', True)
     try:
-        email_validator(email)
+        email_validator(email, check_deliverability=check_deliverability)
         return True, None
     except EmailNotValidError as e:
         return False, str(e)
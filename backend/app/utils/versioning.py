@@ -0,0 +1,56 @@
+"""Optimistic concurrency for single-row edits.
+
+Versioned models carry a ``version`` column (SQLAlchemy's
+``version_id_col``). Detail responses send it as the ``ETag``, and an edit
+made with ``If-Match`` only applies if the row still has that version:
+one ``UPDATE ... WHERE id = ? AND version = ? RETURNING ...`` statement
+that both checks and bumps it, so a stale edit changes nothing instead of
+overwriting someone else's.
+"""
+from sqlalchemy import select, update
+
+from app.extensions import db
+
+def etag(version):
+    return f'"{version}"'
+
+def expected_versions(if_match):
+    """Versions an ``If-Match`` header accepts; None means any version.
+    
+    An empty list means the header only holds tags no row can match.
+    """
+    if not if_match or if_match.star_tag:
+        return None
+    return [int(tag) for tag in if_match.as_set(include_weak=True) if tag.isdigit()]
+
+def first_with_version(plan, model, stmt):
+    """Hydrate the first row of ``stmt`` and return it with its version."""
+    row = db.session.execute(stmt.add_columns(model.version).limit(1)).first()
+    if row is None:
+        return None, None
+    return plan.hydrate(row), row[-1]
+
+def update_returning(plan, model, row_id, values, versions=None):
+    """Apply ``values`` to one row and return ``(data, version)``.
+    
+    Returns ``(None, None)`` when the row is missing or its version is not
+    in ``versions``. The caller commits.
+    """
+    conditions = [model.id == row_id]
+    if versions is not None:
+        conditions.append(model.version.in_(versions))
+    stmt = (
+        update(model)
+        .where(*conditions)
+        .values(**values, version=model.version + 1)
+        .returning(*plan.returning(), model.version)
+        .execution_options(synchronize_session=False)
+    )
+    row = db.session.execute(stmt).first()
+    if row is None:
+        return None, None
+    return plan.hydrate(row), row[-1]
+
+def current_version(model, row_id):
+    """The row's version, or None if it does not exist."""
+    return db.session.execute(select(model.version).where(model.id == row_id)).scalar()
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""Performance benchmarks for the School Information System API.
+
+Run individual benchmarks as modules from the ``backend`` directory, e.g.
+``python -m benchmarks.passwords``. Each prints a JSON report to stdout.
+"""
\ No newline at end of file
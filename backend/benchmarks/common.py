@@ -0,0 +1,113 @@
+"""Shared helpers for the benchmark scripts."""
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+def summarize_latencies(samples, elapsed):
+    """Throughput and latency percentiles (ms) for a list of seconds."""
+    ordered = sorted(samples)
+    return {
+        'requests': len(ordered),
+        'throughput_rps': round(len(ordered) / elapsed, 1) if elapsed else None,
+        'p50_ms': round(percentile(ordered, 50) * 1000, 2) if ordered else None,
+        'p95_ms': round(percentile(ordered, 95) * 1000, 2) if ordered else None,
+        'p99_ms': round(percentile(ordered, 99) * 1000, 2) if ordered else None,
+    }
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def init_database(database_url):
+    """Run `flask init-db` against a database URL."""
+    env = dict(os.environ, DATABASE_URL=database_url, FLASK_APP='run.py', DB_AUTO_INIT='false')
+    subprocess.run(
+        [sys.executable, '-m', 'flask', 'init-db'],
+        env=env, cwd=BACKEND_DIR, check=True, capture_output=True
+    )
+
+@contextlib.contextmanager
+def gunicorn_server(env_overrides, workers=2, startup_timeout=30):
+    """Start gunicorn with the repo config and yield its base URL."""
+    port = free_port()
+    env = dict(
+        os.environ,
+        PORT=str(port),
+        WEB_CONCURRENCY=str(workers),
+        FLASK_ENV='production',
+        **env_overrides
+    )
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+         '--access-logfile', '/dev/null', 'run:app'],
+        env=env, cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                urllib.request.urlopen(f'{base_url}/api/health', timeout=1).read()
+                break
+            except (urllib.error.URLError, ConnectionError):
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(process.stderr.read().decode()[-2000:])
+                time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def http_load(urls, concurrency, duration, headers=None, method='GET', body=None):
+    """Hit the URLs round-robin from ``concurrency`` threads for ``duration`` seconds.
+
+    ``body`` (bytes) is sent with every request. Returns (latencies, errors, elapsed).
+    """
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+    
+    def client(offset):
+        local, failed, i = [], 0, offset
+        while time.monotonic() < stop_at:
+            request = urllib.request.Request(urls[i % len(urls)], data=body, headers=headers or {}, method=method)
+            i += 1
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+                local.append(time.perf_counter() - started)
+            except (urllib.error.URLError, ConnectionError):
+                failed += 1
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+    
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0], time.perf_counter() - started
\ No newline at end of file
@@ -0,0 +1,246 @@
+"""Bulk synthetic dataset for benchmarks.
+
+``--scale`` is the number of students; the other tables are sized from it
+(1.2 registrations per student, one teacher per 20 students, one material
+per 5 students, ten weekly classes per teacher). Rows are generated
+deterministically from ``--seed`` and loaded with multi-row INSERTs in
+chunks, so 1M students load in minutes rather than hours.
+
+Usage::
+
+    python -m benchmarks.dataset --scale 10000
+    DATABASE_URL=postgresql://localhost/school_bench python -m benchmarks.dataset --scale 1000000
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, time as clock, timedelta
+from sqlalchemy import insert
+
+from app import create_app
+from app.extensions import db
+from app.models.material import Material
+from app.models.schedule import Schedule
+from app.models.student import Student
+from app.models.student_registration import StudentRegistration
+from app.models.teacher import Teacher
+from app.models.user import User
+from benchmarks.common import init_database
+
+CHUNK_SIZE = 5000
+
+FIRST_NAMES = [
+    'Ana', 'Budi', 'Carlos', 'Dewi', 'Elena', 'Fajar', 'Grace', 'Hiro', 'Intan', 'Joao',
+    'Kartika', 'Liam', 'Maria', 'Nadia', 'Omar', 'Putri', 'Rafael', 'Sari', 'Tomas', 'Wulan',
+]
+LAST_NAMES = [
+    'Soares', 'Pereira', 'Santos', 'Gusmao', 'Belo', 'Ximenes', 'Alves', 'Costa', 'Guterres',
+    'Lopes', 'Martins', 'Freitas', 'Amaral', 'Carvalho', 'Fernandes', 'Barreto', 'Sousa', 'Da Silva',
+]
+DEPARTMENTS = {
+    'Mathematics': ['Mathematics', 'Algebra', 'Geometry', 'Statistics'],
+    'Science': ['Physics', 'Chemistry', 'Biology'],
+    'Languages': ['English', 'Portuguese', 'Tetum', 'Indonesian'],
+    'Humanities': ['History', 'Geography', 'Civics'],
+    'Arts': ['Music', 'Art', 'Physical Education'],
+}
+GRADES = [f'Grade {n}' for n in range(1, 13)]
+SECTIONS = ['A', 'B', 'C', 'D']
+MATERIAL_TYPES = ['document', 'video', 'link', 'book', 'presentation']
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+TODAY = date(2024, 9, 2)
+
+def table_sizes(scale):
+    """Row counts per table for a number of students."""
+    return {
+        'students': scale,
+        'student_registrations': int(scale * 1.2),
+        'teachers': max(scale // 20, 10),
+        'materials': max(scale // 5, 20),
+        'schedules': max(scale // 20, 10) * 10,
+    }
+
+def _person(rng, i, domain):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        'first_name': first,
+        'last_name': last,
+        'email': f"{first.lower()}.{last.lower().replace(' ', '')}.{i}@{domain}",
+        'phone': f'+670 7{rng.randrange(1000000, 9999999)}',
+    }
+
+def _timestamp(rng, days_back):
+    return datetime.combine(TODAY, clock(8)) - timedelta(days=rng.randrange(days_back), seconds=rng.randrange(86400))
+
+def registration_rows(rng, count):
+    for i in range(1, count + 1):
+        created = _timestamp(rng, 730)
+        status = rng.choices(['approved', 'pending', 'rejected'], weights=[83, 12, 5])[0]
+        yield {
+            **_person(rng, i, 'family.example'),
+            'date_of_birth': date(2006, 1, 1) + timedelta(days=rng.randrange(4380)),
+            'gender': rng.choice(['Male', 'Female']),
+            'address': f'Rua {rng.choice(LAST_NAMES)} {rng.randrange(1, 300)}, Dili',
+            'parent_name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'parent_phone': f'+670 7{rng.randrange(1000000, 9999999)}',
+            'grade_applying': rng.choice(GRADES),
+            'emergency_contact': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'emergency_phone': f'+670 7{rng.randrange(1000000, 9999999)}',
+            'status': status,
+            'reviewed_by': 1 if status != 'pending' else None,
+            'reviewed_at': created + timedelta(days=rng.randrange(1, 14)) if status != 'pending' else None,
+            'created_at': created,
+            'updated_at': created,
+        }
+
+def student_rows(rng, count, registrations):
+    for i in range(1, count + 1):
+        enrolled = TODAY - timedelta(days=rng.randrange(1460))
+        yield {
+            **_person(rng, i, 'students.example'),
+            'student_id': f'STD{enrolled.year}{i:07d}',
+            'date_of_birth': date(2006, 1, 1) + timedelta(days=rng.randrange(4380)),
+            'gender': rng.choice(['Male', 'Female']),
+            'address': f'Rua {rng.choice(LAST_NAMES)} {rng.randrange(1, 300)}, Dili',
+            'enrollment_date': enrolled,
+            'grade_level': rng.choice(GRADES),
+            'section': rng.choice(SECTIONS),
+            'parent_name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'parent_phone': f'+670 7{rng.randrange(1000000, 9999999)}',
+            'emergency_contact': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'emergency_phone': f'+670 7{rng.randrange(1000000, 9999999)}',
+            'status': rng.choices(['active', 'inactive', 'graduated', 'transferred'], weights=[85, 5, 7, 3])[0],
+            'registration_id': i if i <= registrations else None,
+            'created_at': datetime.combine(enrolled, clock(9)),
+            'updated_at': datetime.combine(enrolled, clock(9)),
+        }
+
+def teacher_rows(rng, count):
+    for i in range(1, count + 1):
+        department = rng.choice(list(DEPARTMENTS))
+        joined = TODAY - timedelta(days=rng.randrange(7300))
+        yield {
+            **_person(rng, i, 'school.example'),
+            'teacher_id': f'TCH{joined.year}{i:05d}',
+            'department': department,
+            'subjects': ','.join(rng.sample(DEPARTMENTS[department], 2)),
+            'qualification': rng.choice(['B.Ed', 'M.Ed', 'B.Sc', 'M.Sc', 'PhD']),
+            'experience_years': TODAY.year - joined.year,
+            'joining_date': joined,
+            'bio': 'Teacher at the school since %d.' % joined.year,
+            'is_active': rng.random() < 0.95,
+            'created_at': datetime.combine(joined, clock(9)),
+            'updated_at': datetime.combine(joined, clock(9)),
+        }
+
+def material_rows(rng, count):
+    subjects = [subject for group in DEPARTMENTS.values() for subject in group]
+    for i in range(1, count + 1):
+        subject = rng.choice(subjects)
+        created = _timestamp(rng, 1095)
+        yield {
+            'title': f'{subject} notes {i}',
+            'description': f'Lesson material for {subject} ({i}).',
+            'subject': subject,
+            'grade_level': rng.choice(GRADES),
+            'material_type': rng.choice(MATERIAL_TYPES),
+            'external_link': f'https://materials.example/{i}',
+            'author': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            'is_public': rng.random() < 0.9,
+            'download_count': rng.randrange(500),
+            'view_count': rng.randrange(5000),
+            'uploaded_by': 1,
+            'created_at': created,
+            'updated_at': created,
+        }
+
+def schedule_rows(rng, count, teachers):
+    subjects = [subject for group in DEPARTMENTS.values() for subject in group]
+    for i in range(1, count + 1):
+        start = rng.randrange(7, 15)
+        yield {
+            'title': f'{rng.choice(subjects)} class',
+            'subject': rng.choice(subjects),
+            'grade_level': rng.choice(GRADES),
+            'section': rng.choice(SECTIONS),
+            'day_of_week': rng.choice(DAYS),
+            'start_time': clock(start),
+            'end_time': clock(start, 50),
+            'room': f'R{rng.randrange(1, 60):02d}',
+            'teacher_id': (i - 1) // 10 + 1 if (i - 1) // 10 < teachers else None,
+            'is_recurring': True,
+            'effective_from': date(TODAY.year, 7, 1),
+            'created_by': 1,
+            'created_at': datetime.combine(TODAY, clock(8)),
+            'updated_at': datetime.combine(TODAY, clock(8)),
+        }
+
+def _bulk_insert(model, rows):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            db.session.execute(insert(model), chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(model), chunk)
+
+def load(scale, seed=1):
+    """Insert a synthetic dataset into the current app's database.
+    
+    Expects an initialized, empty schema (apart from the seeded admin).
+    Returns seconds spent per table.
+    """
+    rng = random.Random(seed)
+    sizes = table_sizes(scale)
+    if db.session.get(User, 1) is None:
+        raise RuntimeError('Seed the admin user first (flask init-db)')
+    
+    timings = {}
+    for model, rows in (
+        (StudentRegistration, registration_rows(rng, sizes['student_registrations'])),
+        (Student, student_rows(rng, sizes['students'], sizes['student_registrations'])),
+        (Teacher, teacher_rows(rng, sizes['teachers'])),
+        (Material, material_rows(rng, sizes['materials'])),
+        (Schedule, schedule_rows(rng, sizes['schedules'], sizes['teachers'])),
+    ):
+        started = time.perf_counter()
+        _bulk_insert(model, rows)
+        db.session.commit()
+        timings[model.__tablename__] = round(time.perf_counter() - started, 2)
+    return timings
+
+def prepare_database(database_url, scale, seed=1):
+    """Create the schema at ``database_url`` and load a dataset into it."""
+    init_database(database_url)
+    app = create_app('production', {'SQLALCHEMY_DATABASE_URI': database_url, 'DB_AUTO_INIT': False})
+    with app.app_context():
+        return load(scale, seed)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1000, help='Number of students (1000 to 1000000).')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'dataset.db')}"
+    
+    started = time.perf_counter()
+    timings = prepare_database(database_url, args.scale, args.seed)
+    print(json.dumps({
+        'benchmark': 'dataset',
+        'database': database_url.split('://', 1)[0],
+        'database_url': database_url if database_url.startswith('sqlite') else None,
+        'scale': args.scale,
+        'rows': table_sizes(args.scale),
+        'seconds': timings,
+        'total_seconds': round(time.perf_counter() - started, 2),
+    }, indent=2))
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""Per-endpoint throughput and p50/p95/p99 on a synthetic dataset.
+
+Loads a dataset (see ``benchmarks.dataset``) and times every public, admin
+and auth endpoint twice: in-process through the Flask test client (one
+request at a time, so it isolates app and database cost) and over HTTP
+against a real gunicorn server (concurrent clients). The JSON report can
+be saved as a baseline and later runs compared against it; a p95 or
+throughput change beyond ``--tolerance`` is listed as a regression.
+
+Usage::
+
+    python -m benchmarks.endpoints --scale 10000 --save-baseline
+    python -m benchmarks.endpoints --scale 10000 --compare
+    DATABASE_URL=postgresql://localhost/school_bench python -m benchmarks.endpoints --scale 100000 --targets gunicorn
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import urllib.request
+
+from app import create_app
+from app.extensions import db
+from app.models.material import Material
+from app.models.student import Student
+from app.models.teacher import Teacher
+from benchmarks.common import gunicorn_server, http_load, summarize_latencies
+from benchmarks.dataset import prepare_database
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+ADMIN_LOGIN = {'username': 'admin', 'password': os.environ.get('ADMIN_PASSWORD', 'admin123')}
+
+# (group, name, method, path); paths may use ids discovered in the dataset
+ENDPOINTS = [
+    ('public', 'home', 'GET', '/api/public/home'),
+    ('public', 'teachers', 'GET', '/api/public/teachers'),
+    ('public', 'teachers_search', 'GET', '/api/public/teachers?search=sa'),
+    ('public', 'teacher', 'GET', '/api/public/teachers/{teacher_id}'),
+    ('public', 'departments', 'GET', '/api/public/teachers/departments'),
+    ('public', 'materials', 'GET', '/api/public/materials'),
+    ('public', 'materials_filtered', 'GET', '/api/public/materials?subject=Physics&grade_level=Grade%207'),
+    ('public', 'material', 'GET', '/api/public/materials/{material_id}'),
+    ('public', 'material_filters', 'GET', '/api/public/materials/filters'),
+    ('public', 'schedules', 'GET', '/api/public/schedules'),
+    ('public', 'schedules_day', 'GET', '/api/public/schedules?day=Monday'),
+    ('public', 'schedule_filters', 'GET', '/api/public/schedules/filters'),
+    ('admin', 'dashboard', 'GET', '/api/admin/dashboard/stats'),
+    ('admin', 'students', 'GET', '/api/admin/students'),
+    ('admin', 'students_search', 'GET', '/api/admin/students?search=soares'),
+    ('admin', 'students_last_page', 'GET', '/api/admin/students?page={last_student_page}'),
+    ('admin', 'student', 'GET', '/api/admin/students/{student_id}'),
+    ('admin', 'registrations', 'GET', '/api/admin/registrations?status=pending'),
+    ('admin', 'teachers', 'GET', '/api/admin/teachers'),
+    ('admin', 'materials', 'GET', '/api/admin/materials'),
+    ('admin', 'schedules', 'GET', '/api/admin/schedules'),
+    ('admin', 'users', 'GET', '/api/admin/users'),
+    ('auth', 'me', 'GET', '/api/auth/me'),
+    ('auth', 'refresh', 'POST', '/api/auth/refresh'),
+    ('auth', 'login', 'POST', '/api/auth/login'),
+]
+
+def discover_ids(app):
+    """Ids of rows the detail endpoints can fetch."""
+    with app.app_context():
+        students = db.session.query(db.func.count(Student.id)).scalar()
+        return {
+            'teacher_id': db.session.query(db.func.min(Teacher.id)).filter(Teacher.is_active == True).scalar(),
+            'material_id': db.session.query(db.func.min(Material.id)).filter(Material.is_public == True).scalar(),
+            'student_id': db.session.query(db.func.max(Student.id)).scalar(),
+            'last_student_page': max((students + 19) // 20, 1),
+        }
+
+def _request_options(group, name, tokens):
+    """Headers and JSON body for one endpoint."""
+    if name == 'login':
+        return {'Content-Type': 'application/json'}, json.dumps(ADMIN_LOGIN).encode()
+    if name == 'refresh':
+        return {'Authorization': f"Bearer {tokens['refresh_token']}"}, None
+    if group in ('admin', 'auth'):
+        return {'Authorization': f"Bearer {tokens['access_token']}"}, None
+    return {}, None
+
+# ==================== TARGETS ====================
+
+def run_test_client(database_url, ids, requests, overrides):
+    """Time each endpoint sequentially through the Flask test client."""
+    app = create_app('production', {'SQLALCHEMY_DATABASE_URI': database_url, 'DB_AUTO_INIT': False, **overrides})
+    client = app.test_client()
+    tokens = client.post('/api/auth/login', json=ADMIN_LOGIN).get_json()['data']
+    
+    results = []
+    for group, name, method, path in ENDPOINTS:
+        url = path.format(**ids)
+        headers, body = _request_options(group, name, tokens)
+        count = max(requests // 10, 3) if name == 'login' else requests
+        client.open(url, method=method, headers=headers, data=body)  # warm up
+        
+        samples, errors = [], 0
+        started = time.perf_counter()
+        for _ in range(count):
+            request_started = time.perf_counter()
+            response = client.open(url, method=method, headers=headers, data=body)
+            samples.append(time.perf_counter() - request_started)
+            if response.status_code >= 400:
+                errors += 1
+        elapsed = time.perf_counter() - started
+        results.append({'group': group, 'endpoint': name, 'errors': errors, **summarize_latencies(samples, elapsed)})
+    return results
+
+def _http_tokens(base_url):
+    request = urllib.request.Request(
+        f'{base_url}/api/auth/login',
+        data=json.dumps(ADMIN_LOGIN).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.load(response)['data']
+
+def run_gunicorn(database_url, ids, workers, concurrency, duration, overrides):
+    """Drive each endpoint over HTTP against a gunicorn server."""
+    env = {'DATABASE_URL': database_url, **{key: str(value) for key, value in overrides.items()}}
+    results = []
+    with gunicorn_server(env, workers=workers) as base_url:
+        tokens = _http_tokens(base_url)
+        for group, name, method, path in ENDPOINTS:
+            urls = [base_url + path.format(**ids)]
+            headers, body = _request_options(group, name, tokens)
+            http_load(urls, concurrency, min(duration, 1), headers, method, body)  # warm up
+            latencies, errors, elapsed = http_load(urls, concurrency, duration, headers, method, body)
+            results.append({'group': group, 'endpoint': name, 'errors': errors, **summarize_latencies(latencies, elapsed)})
+    return results
+
+# ==================== BASELINE ====================
+
+def baseline_path(database, scale):
+    return os.path.join(BASELINE_DIR, f'endpoints-{database}-{scale}.json')
+
+def compare(report, baseline, tolerance, min_delta_ms):
+    """Per-endpoint change against a baseline report, plus the regressions.
+    
+    Endpoints whose p95 moved by less than ``min_delta_ms`` are never
+    regressions; sub-millisecond timings are mostly noise.
+    """
+    previous = {
+        (target, row['group'], row['endpoint']): row
+        for target, rows in baseline['targets'].items()
+        for row in rows
+    }
+    changes, regressions = [], []
+    for target, rows in report['targets'].items():
+        for row in rows:
+            old = previous.get((target, row['group'], row['endpoint']))
+            if not old or not old.get('p95_ms') or not old.get('throughput_rps'):
+                continue
+            change = {
+                'target': target,
+                'group': row['group'],
+                'endpoint': row['endpoint'],
+                'p95_change_pct': round((row['p95_ms'] - old['p95_ms']) / old['p95_ms'] * 100, 1),
+                'throughput_change_pct': round((row['throughput_rps'] - old['throughput_rps']) / old['throughput_rps'] * 100, 1),
+            }
+            changes.append(change)
+            if abs(row['p95_ms'] - old['p95_ms']) < min_delta_ms:
+                continue
+            if change['p95_change_pct'] > tolerance or change['throughput_change_pct'] < -tolerance:
+                regressions.append(change)
+    return changes, regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1000, help='Number of students in the dataset.')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--targets', nargs='+', default=['client', 'gunicorn'], choices=['client', 'gunicorn'])
+    parser.add_argument('--requests', type=int, default=100, help='Requests per endpoint through the test client.')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=3, help='Seconds per endpoint against gunicorn.')
+    parser.add_argument('--no-response-cache', action='store_true', help='Set PUBLIC_CACHE_TTL_SECONDS=0.')
+    parser.add_argument('--baseline', help='Baseline file (default: benchmarks/baselines/endpoints-<db>-<scale>.json).')
+    parser.add_argument('--save-baseline', action='store_true', help='Write this report as the baseline.')
+    parser.add_argument('--compare', action='store_true', help='Compare with the baseline; exit 1 on regressions.')
+    parser.add_argument('--tolerance', type=float, default=15, help='Allowed p95/throughput change in percent.')
+    parser.add_argument('--min-delta-ms', type=float, default=1, help='Ignore p95 changes smaller than this.')
+    args = parser.parse_args()
+    
+    # An existing DATABASE_URL is used as-is (load it with benchmarks.dataset)
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'endpoints.db')}"
+        prepare_database(database_url, args.scale, args.seed)
+    database = database_url.split('://', 1)[0].split('+')[0]
+    
+    overrides = {'EMAIL_CHECK_DELIVERABILITY': False, 'QUERY_TRACKING': False}
+    if args.no_response_cache:
+        overrides['PUBLIC_CACHE_TTL_SECONDS'] = 0
+    ids = discover_ids(create_app('production', {'SQLALCHEMY_DATABASE_URI': database_url, 'DB_AUTO_INIT': False}))
+    
+    report = {
+        'benchmark': 'endpoints',
+        'database': database,
+        'scale': args.scale,
+        'response_cache': not args.no_response_cache,
+        'targets': {},
+    }
+    if 'client' in args.targets:
+        report['targets']['client'] = run_test_client(database_url, ids, args.requests, overrides)
+    if 'gunicorn' in args.targets:
+        report['workers'] = args.workers
+        report['concurrency'] = args.concurrency
+        report['targets']['gunicorn'] = run_gunicorn(
+            database_url, ids, args.workers, args.concurrency, args.duration,
+            {key: str(value).lower() if isinstance(value, bool) else value for key, value in overrides.items()}
+        )
+    
+    path = args.baseline or baseline_path(database, args.scale)
+    regressions = []
+    if args.compare:
+        with open(path) as f:
+            report['baseline'] = path
+            report['changes'], regressions = compare(report, json.load(f), args.tolerance, args.min_delta_ms)
+            report['regressions'] = regressions
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+    
+    print(json.dumps(report, indent=2))
+    if regressions:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
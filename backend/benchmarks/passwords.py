@@ -0,0 +1,76 @@
+"""Login throughput per worker for each password hashing setting.
+
+Usage::
+
+    python -m benchmarks.passwords --logins 50 --threads 1 4
+    python -m benchmarks.passwords --methods scrypt pbkdf2:sha256:600000
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+
+DEFAULT_METHODS = [
+    'scrypt:32768:8:1',
+    'scrypt:16384:8:1',
+    'pbkdf2:sha256:600000',
+    'pbkdf2:sha256:260000',
+]
+
+def run_setting(method, logins, threads, executor):
+    """Time ``logins`` logins for one hashing method and client concurrency."""
+    app = create_app('testing', {
+        'PASSWORD_HASH_METHOD': method,
+        'PASSWORD_HASH_EXECUTOR': executor,
+        'PASSWORD_HASH_QUEUE_DEPTH': threads * 2,
+    })
+    with app.app_context():
+        user = User(username='bench', email='bench@school.edu', full_name='Bench User')
+        user.set_password('bench-password')
+        db.session.add(user)
+        db.session.commit()
+    
+    client = app.test_client()
+    payload = {'username': 'bench', 'password': 'bench-password'}
+    
+    def login(_):
+        response = client.post('/api/auth/login', json=payload)
+        return response.status_code
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        statuses = list(pool.map(login, range(logins)))
+    elapsed = time.perf_counter() - started
+    
+    return {
+        'method': method,
+        'executor': executor,
+        'client_threads': threads,
+        'logins': logins,
+        'ok': statuses.count(200),
+        'busy': statuses.count(503),
+        'seconds': round(elapsed, 3),
+        'logins_per_second': round(logins / elapsed, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--methods', nargs='+', default=DEFAULT_METHODS)
+    parser.add_argument('--logins', type=int, default=30)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1])
+    parser.add_argument('--executor', choices=['thread', 'process'], default='thread')
+    args = parser.parse_args()
+    
+    results = [
+        run_setting(method, args.logins, threads, args.executor)
+        for method in args.methods
+        for threads in args.threads
+    ]
+    print(json.dumps({'benchmark': 'password_hashing', 'results': results}, indent=2))
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
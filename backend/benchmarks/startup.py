@@ -0,0 +1,70 @@
+"""Cold start time of create_app with and without startup DB work.
+
+Each sample runs in a fresh interpreter so module imports are included,
+matching what a gunicorn worker or ``flask`` CLI call pays.
+
+Usage::
+
+    python -m benchmarks.startup --runs 10
+    DATABASE_URL=postgresql://localhost/school_db python -m benchmarks.startup
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SNIPPET = """
+import time
+started = time.perf_counter()
+from app import create_app
+create_app('production')
+print(time.perf_counter() - started)
+"""
+
+def measure(database_url, auto_init, runs):
+    """Return startup samples in milliseconds for one mode."""
+    env = dict(os.environ, DATABASE_URL=database_url, DB_AUTO_INIT=str(auto_init).lower())
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', SNIPPET],
+            env=env, capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return samples
+
+def summarize(samples):
+    return {
+        'median_ms': round(statistics.median(samples), 1),
+        'min_ms': round(min(samples), 1),
+        'max_ms': round(max(samples), 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+    
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        path = os.path.join(tempfile.mkdtemp(), 'startup.db')
+        database_url = f'sqlite:///{path}'
+    
+    # Warm the schema once so both modes see an initialized database
+    measure(database_url, True, 1)
+    
+    report = {
+        'benchmark': 'startup',
+        'database': database_url.split('://', 1)[0],
+        'runs': args.runs,
+        'auto_init': summarize(measure(database_url, True, args.runs)),
+        'cli_init': summarize(measure(database_url, False, args.runs)),
+    }
+    print(json.dumps(report, indent=2))
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""Throughput and p99 latency of each gunicorn worker mode.
+
+Starts gunicorn once per mode against the same database and drives the
+public listing endpoints with concurrent clients. The gevent mode is
+skipped unless requirements-gevent.txt is installed.
+
+Usage::
+
+    python -m benchmarks.workers --duration 10 --concurrency 32
+    DATABASE_URL=postgresql://localhost/school_db python -m benchmarks.workers
+"""
+import argparse
+import importlib.util
+import json
+import os
+import tempfile
+
+from benchmarks.common import gunicorn_server, http_load, init_database, summarize_latencies
+
+MODES = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync'},
+    'gthread': {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_THREADS': '8'},
+    'gevent': {'GUNICORN_WORKER_CLASS': 'gevent', 'GUNICORN_WORKER_CONNECTIONS': '200'},
+}
+
+PATHS = [
+    '/api/public/teachers',
+    '/api/public/materials',
+    '/api/public/schedules',
+    '/api/public/materials/filters',
+]
+
+def run_mode(name, database_url, workers, concurrency, duration):
+    env = dict(MODES[name], DATABASE_URL=database_url)
+    with gunicorn_server(env, workers=workers) as base_url:
+        urls = [base_url + path for path in PATHS]
+        http_load(urls, concurrency, 1)  # warm up
+        latencies, errors, elapsed = http_load(urls, concurrency, duration)
+    return {'mode': name, 'errors': errors, **summarize_latencies(latencies, elapsed)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', nargs='+', default=list(MODES), choices=list(MODES))
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=5)
+    args = parser.parse_args()
+    
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'workers.db')}"
+    init_database(database_url)
+    
+    results = []
+    for name in args.modes:
+        if name == 'gevent' and importlib.util.find_spec('gevent') is None:
+            results.append({'mode': name, 'skipped': 'gevent is not installed'})
+            continue
+        results.append(run_mode(name, database_url, args.workers, args.concurrency, args.duration))
+    
+    print(json.dumps({
+        'benchmark': 'worker_modes',
+        'database': database_url.split('://', 1)[0],
+        'workers': args.workers,
+        'concurrency': args.concurrency,
+        'results': results,
+    }, indent=2))
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
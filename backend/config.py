@@ -1,4 +1,5 @@
 import os
+import tempfile
 from datetime import timedelta
 
 class Config:
@@ -9,26 +10,144 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'postgresql://localhost/school_db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool, per worker (sizing is ignored for SQLite). Keep
+    # WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) under the server's
+    # connection limit. Behind PgBouncer in transaction mode set
+    # DB_POOL_CLASS=null so PgBouncer does the pooling.
+    DB_POOL_CLASS = os.environ.get('DB_POOL_CLASS', 'queue')  # queue or null
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true',
+    }
+    DB_CONNECT_TIMEOUT = int(os.environ.get('DB_CONNECT_TIMEOUT', 10))
+    
+    # Optional read replica. Public GET endpoints read from it while its
+    # lag stays under REPLICA_MAX_LAG_SECONDS; writes always go to primary.
+    REPLICA_DATABASE_URL = os.environ.get('REPLICA_DATABASE_URL')
+    SQLALCHEMY_BINDS = {'replica': REPLICA_DATABASE_URL} if REPLICA_DATABASE_URL else {}
+    REPLICA_MAX_LAG_SECONDS = float(os.environ.get('REPLICA_MAX_LAG_SECONDS', 10))
+    REPLICA_LAG_CHECK_SECONDS = float(os.environ.get('REPLICA_LAG_CHECK_SECONDS', 5))
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+    
+    # Email validation does a DNS deliverability lookup unless disabled
+    EMAIL_CHECK_DELIVERABILITY = os.environ.get('EMAIL_CHECK_DELIVERABILITY', 'true').lower() == 'true'
+    
+    # Bearer token required by /api/metrics endpoints. Without one they are
+    # open unless METRICS_ALLOW_ANONYMOUS is off (the production default).
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+    METRICS_ALLOW_ANONYMOUS = os.environ.get('METRICS_ALLOW_ANONYMOUS', 'true').lower() == 'true'
+    
+    # Create tables and seed the admin user inside create_app (local use only)
+    DB_AUTO_INIT = os.environ.get('DB_AUTO_INIT', 'true').lower() == 'true'
+    
     # JWT configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     
+    # Password hashing (Werkzeug method string, e.g. scrypt:32768:8:1 or pbkdf2:sha256:600000)
+    PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+    PASSWORD_HASH_EXECUTOR = os.environ.get('PASSWORD_HASH_EXECUTOR', 'thread')  # thread or process
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_QUEUE_DEPTH = int(os.environ.get('PASSWORD_HASH_QUEUE_DEPTH', 8))
+    PASSWORD_HASH_TIMEOUT = int(os.environ.get('PASSWORD_HASH_TIMEOUT', 10))
+    
+    # Token revocation (shared table + per-worker bloom filter)
+    REVOCATION_REFRESH_SECONDS = int(os.environ.get('REVOCATION_REFRESH_SECONDS', 5))
+    REVOCATION_REBUILD_SECONDS = int(os.environ.get('REVOCATION_REBUILD_SECONDS', 3600))
+    REVOCATION_BLOOM_CAPACITY = int(os.environ.get('REVOCATION_BLOOM_CAPACITY', 100000))
+    
+    # Seconds an authenticated user row is cached per worker
+    USER_CACHE_TTL_SECONDS = int(os.environ.get('USER_CACHE_TTL_SECONDS', 10))
+    
+    # Let the database encode large admin lists as JSON (students, registrations, materials)
+    DB_JSON_ASSEMBLY = os.environ.get('DB_JSON_ASSEMBLY', 'false').lower() == 'true'
+    
+    # Response compression (br needs the optional brotli package)
+    COMPRESS_ALGORITHMS = os.environ.get('COMPRESS_ALGORITHMS', 'br,gzip')
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 500))
+    COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 4))
+    
+    # Seconds public GET responses are cached per worker (0 disables)
+    PUBLIC_CACHE_TTL_SECONDS = int(os.environ.get('PUBLIC_CACHE_TTL_SECONDS', 30))
+    
+    # Pre-rendered /api/public/home payload
+    HOME_FEATURED_TEACHERS = int(os.environ.get('HOME_FEATURED_TEACHERS', 6))
+    HOME_LATEST_MATERIALS = int(os.environ.get('HOME_LATEST_MATERIALS', 6))
+    HOME_REBUILD_DELAY_SECONDS = float(os.environ.get('HOME_REBUILD_DELAY_SECONDS', 1))
+    
+    # Static JSON export of public endpoints (re-rendered after commits when set)
+    STATIC_EXPORT_DIR = os.environ.get('STATIC_EXPORT_DIR')
+    STATIC_EXPORT_DELAY_SECONDS = float(os.environ.get('STATIC_EXPORT_DELAY_SECONDS', 10))
+    
+    # POST /api/batch limits; read-only runs use up to BATCH_PARALLELISM threads
+    BATCH_MAX_REQUESTS = int(os.environ.get('BATCH_MAX_REQUESTS', 20))
+    BATCH_PARALLELISM = int(os.environ.get('BATCH_PARALLELISM', 4))
+    
+    # Directory for cross-worker version stamps
+    SHARED_STATE_DIR = os.environ.get('SHARED_STATE_DIR') or os.path.join(tempfile.gettempdir(), 'school-system')
+    
+    # Prometheus request metrics: per-worker files merged on scrape
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_DIR = os.environ.get('METRICS_DIR') or os.path.join(SHARED_STATE_DIR, 'metrics')
+    METRICS_FLUSH_SECONDS = float(os.environ.get('METRICS_FLUSH_SECONDS', 5))
+    
+    # Per-request query budgets (@query_budget) and N+1 detection. Tracking
+    # records every statement with its call site, so it is off in production.
+    QUERY_TRACKING = os.environ.get('QUERY_TRACKING', 'false').lower() == 'true'
+    QUERY_BUDGET_MODE = os.environ.get('QUERY_BUDGET_MODE', 'log')  # raise, log or off
+    QUERY_BUDGET_DEFAULT = int(os.environ.get('QUERY_BUDGET_DEFAULT', 0))  # 0 means no limit
+    QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 3))
+    
+    # Slow-query log (JSON lines, shared by all workers; threshold 0 disables).
+    # EXPLAIN capture re-runs slow SELECTs with ANALYZE on PostgreSQL.
+    SLOW_QUERY_THRESHOLD_MS = float(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 200))
+    SLOW_QUERY_EXPLAIN = os.environ.get('SLOW_QUERY_EXPLAIN', 'false').lower() == 'true'
+    SLOW_QUERY_EXPLAIN_INTERVAL = int(os.environ.get('SLOW_QUERY_EXPLAIN_INTERVAL', 300))
+    SLOW_QUERY_LOG_FILE = os.environ.get('SLOW_QUERY_LOG_FILE') or os.path.join(SHARED_STATE_DIR, 'slow_queries.log')
+    SLOW_QUERY_LOG_MAX_BYTES = int(os.environ.get('SLOW_QUERY_LOG_MAX_BYTES', 1024 * 1024))
+    SLOW_QUERY_LOG_BACKUPS = int(os.environ.get('SLOW_QUERY_LOG_BACKUPS', 3))
+    
+    # On-demand request profiling (signed X-Profile header or admin ?profile=1)
+    PROFILE_ENABLED = os.environ.get('PROFILE_ENABLED', 'true').lower() == 'true'
+    PROFILE_SECRET = os.environ.get('PROFILE_SECRET')  # defaults to SECRET_KEY
+    PROFILE_DIR = os.environ.get('PROFILE_DIR') or os.path.join(SHARED_STATE_DIR, 'profiles')
+    PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP', 50))
+    
+    # Hot/cold archiving of finished students and reviewed registrations
+    # (flask archive). Batches commit separately, with a pause between them.
+    ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', 365))
+    ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', 500))
+    ARCHIVE_BATCH_PAUSE = float(os.environ.get('ARCHIVE_BATCH_PAUSE', 0.1))
+    
     # CORS configuration
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
 
 class DevelopmentConfig(Config):
     """Development configuration."""
     DEBUG = True
+    QUERY_TRACKING = os.environ.get('QUERY_TRACKING', 'true').lower() == 'true'
 
 class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
+    DB_AUTO_INIT = os.environ.get('DB_AUTO_INIT', 'false').lower() == 'true'
+    METRICS_ALLOW_ANONYMOUS = os.environ.get('METRICS_ALLOW_ANONYMOUS', 'false').lower() == 'true'
 
 class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_BINDS = {}
+    DB_AUTO_INIT = True
+    # Each testing app gets a fresh temporary state directory (see create_app)
+    SHARED_STATE_DIR = None
+    QUERY_TRACKING = True
+    QUERY_BUDGET_MODE = 'raise'
 
 config = {
     'development': DevelopmentConfig,
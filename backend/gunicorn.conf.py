@@ -6,11 +6,28 @@ bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
 backlog = 2048
 
 # Worker processes
+# sync:    one request per worker at a time (default)
+# gthread: GUNICORN_THREADS requests per worker on OS threads
+# gevent:  up to GUNICORN_WORKER_CONNECTIONS greenlets per worker
+#          (needs requirements-gevent.txt)
 workers = int(os.environ.get('WEB_CONCURRENCY', 4))
-worker_class = 'sync'
-worker_connections = 1000
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+threads = int(os.environ.get('GUNICORN_THREADS', 4 if worker_class == 'gthread' else 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
 timeout = 120
-keepalive = 2
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 2 if worker_class == 'sync' else 5))
+
+if worker_class == 'gevent':
+    # Patch before the app is preloaded so every lock, socket and
+    # psycopg2 connection the app creates is cooperative.
+    from gevent import monkey
+    monkey.patch_all()
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+# Load the app once in the master and fork workers from it. Schema
+# creation and seeding happen in `flask init-db`, not at import time.
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
 
 # Logging
 accesslog = '-'
@@ -30,4 +47,17 @@ tmp_upload_dir = None
 
 # SSL
 keyfile = None
-certfile = None
\ No newline at end of file
+certfile = None
+
+# Server hooks
+def on_starting(server):
+    """Drop per-worker metric files left behind by a previous server."""
+    from config import config
+    from app.utils.request_metrics import clear_worker_files
+    clear_worker_files(config[os.environ.get('FLASK_ENV', 'development')].METRICS_DIR)
+
+def post_fork(server, worker):
+    """Give each forked worker its own DB connections and hashing pool."""
+    if server.cfg.preload_app:
+        from app import reset_after_fork
+        reset_after_fork(worker.app.wsgi())
\ No newline at end of file
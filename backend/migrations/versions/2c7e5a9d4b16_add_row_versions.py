@@ -0,0 +1,49 @@
+"""add row versions
+
+Revision ID: 2c7e5a9d4b16
+Revises: 8d4a2f6b1e93
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c7e5a9d4b16'
+down_revision = '8d4a2f6b1e93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('archived_students', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), nullable=True))
+
+    with op.batch_alter_table('materials', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+    with op.batch_alter_table('schedules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+def downgrade():
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('schedules', schema=None) as batch_op:
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('materials', schema=None) as batch_op:
+        batch_op.drop_column('version')
+
+    with op.batch_alter_table('archived_students', schema=None) as batch_op:
+        batch_op.drop_column('version')
\ No newline at end of file
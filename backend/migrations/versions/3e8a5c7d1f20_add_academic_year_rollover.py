@@ -0,0 +1,90 @@
+"""add academic year rollover
+
+Revision ID: 3e8a5c7d1f20
+Revises: 9b2d6e4f8a10
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e8a5c7d1f20'
+down_revision = '9b2d6e4f8a10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('rollovers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('grade_map', sa.JSON(), nullable=False),
+    sa.Column('effective_date', sa.Date(), nullable=False),
+    sa.Column('counts', sa.JSON(), nullable=True),
+    sa.Column('performed_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('undone_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['performed_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('archived_students',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('student_id', sa.String(length=20), nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=False),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('date_of_birth', sa.Date(), nullable=False),
+    sa.Column('gender', sa.String(length=10), nullable=False),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('enrollment_date', sa.Date(), nullable=False),
+    sa.Column('grade_level', sa.String(length=20), nullable=False),
+    sa.Column('section', sa.String(length=10), nullable=True),
+    sa.Column('parent_name', sa.String(length=100), nullable=False),
+    sa.Column('parent_phone', sa.String(length=20), nullable=False),
+    sa.Column('parent_email', sa.String(length=120), nullable=True),
+    sa.Column('emergency_contact', sa.String(length=100), nullable=False),
+    sa.Column('emergency_phone', sa.String(length=20), nullable=False),
+    sa.Column('medical_notes', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('registration_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.Column('rollover_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['rollover_id'], ['rollovers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_students', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_archived_students_archived_at'), ['archived_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_archived_students_rollover_id'), ['rollover_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_archived_students_student_id'), ['student_id'], unique=True)
+
+    op.create_table('rollover_schedules',
+    sa.Column('rollover_id', sa.Integer(), nullable=False),
+    sa.Column('schedule_id', sa.Integer(), nullable=False),
+    sa.Column('effective_until', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['rollover_id'], ['rollovers.id'], ),
+    sa.PrimaryKeyConstraint('rollover_id', 'schedule_id')
+    )
+    op.create_table('rollover_students',
+    sa.Column('rollover_id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('grade_level', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.ForeignKeyConstraint(['rollover_id'], ['rollovers.id'], ),
+    sa.PrimaryKeyConstraint('rollover_id', 'student_id')
+    )
+
+
+def downgrade():
+    op.drop_table('rollover_students')
+    op.drop_table('rollover_schedules')
+    with op.batch_alter_table('archived_students', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_archived_students_student_id'))
+        batch_op.drop_index(batch_op.f('ix_archived_students_rollover_id'))
+        batch_op.drop_index(batch_op.f('ix_archived_students_archived_at'))
+
+    op.drop_table('archived_students')
+    op.drop_table('rollovers')
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""add archived student registrations
+
+Revision ID: 6f1b3d9e2c47
+Revises: 3e8a5c7d1f20
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6f1b3d9e2c47'
+down_revision = '3e8a5c7d1f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('archived_student_registrations',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=False),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('date_of_birth', sa.Date(), nullable=False),
+    sa.Column('gender', sa.String(length=10), nullable=False),
+    sa.Column('address', sa.Text(), nullable=False),
+    sa.Column('parent_name', sa.String(length=100), nullable=False),
+    sa.Column('parent_phone', sa.String(length=20), nullable=False),
+    sa.Column('parent_email', sa.String(length=120), nullable=True),
+    sa.Column('previous_school', sa.String(length=200), nullable=True),
+    sa.Column('grade_applying', sa.String(length=20), nullable=False),
+    sa.Column('emergency_contact', sa.String(length=100), nullable=False),
+    sa.Column('emergency_phone', sa.String(length=20), nullable=False),
+    sa.Column('medical_notes', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('admin_notes', sa.Text(), nullable=True),
+    sa.Column('reviewed_by', sa.Integer(), nullable=True),
+    sa.Column('reviewed_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('archived_student_registrations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_archived_student_registrations_archived_at'), ['archived_at'], unique=False)
+        batch_op.create_index(batch_op.f('ix_archived_student_registrations_email'), ['email'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('archived_student_registrations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_archived_student_registrations_email'))
+        batch_op.drop_index(batch_op.f('ix_archived_student_registrations_archived_at'))
+
+    op.drop_table('archived_student_registrations')
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""add admin teacher list indexes
+
+Revision ID: 8d4a2f6b1e93
+Revises: 6f1b3d9e2c47
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4a2f6b1e93'
+down_revision = '6f1b3d9e2c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.create_index('ix_teachers_department_last_name', ['department', 'last_name'], unique=False)
+        batch_op.create_index('ix_teachers_last_name', ['last_name'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_index('ix_teachers_last_name')
+        batch_op.drop_index('ix_teachers_department_last_name')
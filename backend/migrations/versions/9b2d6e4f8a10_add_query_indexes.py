@@ -0,0 +1,66 @@
+"""add indexes for the hot list queries
+
+Revision ID: 9b2d6e4f8a10
+Revises: 7c4e9f1a2b3d
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b2d6e4f8a10'
+down_revision = '7c4e9f1a2b3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('materials', schema=None) as batch_op:
+        batch_op.create_index('ix_materials_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_materials_public_created_at', ['created_at'], unique=False,
+                              postgresql_where=sa.text('is_public'), sqlite_where=sa.text('is_public = 1'))
+        batch_op.create_index('ix_materials_public_subject_grade_level', ['subject', 'grade_level', 'created_at'], unique=False,
+                              postgresql_where=sa.text('is_public'), sqlite_where=sa.text('is_public = 1'))
+
+    with op.batch_alter_table('schedules', schema=None) as batch_op:
+        batch_op.create_index('ix_schedules_created_at', ['created_at'], unique=False)
+        batch_op.create_index('ix_schedules_grade_level_section_day_of_week', ['grade_level', 'section', 'day_of_week', 'start_time'], unique=False)
+        batch_op.create_index('ix_schedules_teacher_id', ['teacher_id'], unique=False)
+
+    with op.batch_alter_table('student_registrations', schema=None) as batch_op:
+        batch_op.create_index('ix_student_registrations_status_created_at', ['status', 'created_at'], unique=False)
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.create_index('ix_students_last_name', ['last_name'], unique=False)
+        batch_op.create_index('ix_students_status_grade_level_last_name', ['status', 'grade_level', 'last_name'], unique=False)
+
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.create_index('ix_teachers_active_department_last_name', ['department', 'last_name'], unique=False,
+                              postgresql_where=sa.text('is_active'), sqlite_where=sa.text('is_active = 1'))
+        batch_op.create_index('ix_teachers_active_last_name', ['last_name'], unique=False,
+                              postgresql_where=sa.text('is_active'), sqlite_where=sa.text('is_active = 1'))
+
+
+def downgrade():
+    with op.batch_alter_table('teachers', schema=None) as batch_op:
+        batch_op.drop_index('ix_teachers_active_last_name')
+        batch_op.drop_index('ix_teachers_active_department_last_name')
+
+    with op.batch_alter_table('students', schema=None) as batch_op:
+        batch_op.drop_index('ix_students_status_grade_level_last_name')
+        batch_op.drop_index('ix_students_last_name')
+
+    with op.batch_alter_table('student_registrations', schema=None) as batch_op:
+        batch_op.drop_index('ix_student_registrations_status_created_at')
+
+    with op.batch_alter_table('schedules', schema=None) as batch_op:
+        batch_op.drop_index('ix_schedules_teacher_id')
+        batch_op.drop_index('ix_schedules_grade_level_section_day_of_week')
+        batch_op.drop_index('ix_schedules_created_at')
+
+    with op.batch_alter_table('materials', schema=None) as batch_op:
+        batch_op.drop_index('ix_materials_public_subject_grade_level')
+        batch_op.drop_index('ix_materials_public_created_at')
+        batch_op.drop_index('ix_materials_created_at')
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""Shared fixtures.
+
+Apps are built with the ``testing`` config, so query tracking is on and
+any endpoint that goes over its ``@query_budget`` fails with a 503.
+"""
+import pytest
+
+from app import create_app
+from app.utils.revocation import revocation_store
+from benchmarks.dataset import load
+
+@pytest.fixture
+def app():
+    # The revocation filter lives on a module-level store; start each app
+    # from an empty one so JTIs from another test's database do not leak in
+    revocation_store._filter = None
+    return create_app('testing', {'EMAIL_CHECK_DELIVERABILITY': False})
+
+@pytest.fixture
+def dataset_app(app):
+    with app.app_context():
+        load(200)
+    return app
+
+@pytest.fixture
+def client(dataset_app):
+    return dataset_app.test_client()
+
+@pytest.fixture
+def auth_headers(client):
+    response = client.post('/api/auth/login', json={'username': 'admin', 'password': 'admin123'})
+    assert response.status_code == 200
+    return {'Authorization': 'Bearer ' + response.get_json()['data']['access_token']}
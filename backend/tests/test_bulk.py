@@ -0,0 +1,67 @@
+import pytest
+
+from app.extensions import db
+from app.models import Material, Schedule, Student, Teacher
+
+def test_bulk_update_by_ids(client, auth_headers, dataset_app):
+    response = client.patch('/api/admin/students/bulk', json={'ids': [1, 2, 3], 'set': {'status': 'inactive'}},
+                            headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert response.get_json()['data'] == {'updated': 3}
+    with dataset_app.app_context():
+        assert {s.status for s in Student.query.filter(Student.id.in_([1, 2, 3]))} == {'inactive'}
+
+def test_bulk_update_by_filter(client, auth_headers, dataset_app):
+    with dataset_app.app_context():
+        expected = Student.query.filter(Student.grade_level == 'Grade 7', Student.section.in_(['A', 'B'])).count()
+    
+    response = client.patch('/api/admin/students/bulk', json={
+        'filter': {'grade_level': 'Grade 7', 'section': ['A', 'B']},
+        'set': {'section': 'C'}
+    }, headers=auth_headers)
+    
+    assert response.get_json()['data'] == {'updated': expected}
+    with dataset_app.app_context():
+        assert Student.query.filter(Student.grade_level == 'Grade 7', Student.section.in_(['A', 'B'])).count() == 0
+
+def test_bulk_teacher_update_hides_them_publicly(client, auth_headers):
+    assert client.get('/api/public/teachers?department=Science').get_json()['data']['total'] > 0
+    
+    response = client.patch('/api/admin/teachers/bulk', json={
+        'filter': {'department': 'Science'},
+        'set': {'is_active': False}
+    }, headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert client.get('/api/public/teachers?department=Science').get_json()['data']['total'] == 0
+
+def test_bulk_delete(client, auth_headers, dataset_app):
+    with dataset_app.app_context():
+        teachers = Teacher.query.filter_by(department='Science').count()
+        materials = Material.query.filter_by(grade_level='Grade 7').count()
+    
+    response = client.delete('/api/admin/teachers/bulk', json={'filter': {'department': 'Science'}}, headers=auth_headers)
+    assert response.get_json()['data'] == {'deleted': teachers}
+    response = client.delete('/api/admin/materials/bulk', json={'filter': {'grade_level': 'Grade 7'}}, headers=auth_headers)
+    assert response.get_json()['data'] == {'deleted': materials}
+    response = client.delete('/api/admin/students/bulk', json={'ids': [4, 5]}, headers=auth_headers)
+    assert response.get_json()['data'] == {'deleted': 2}
+    
+    with dataset_app.app_context():
+        assert Teacher.query.filter_by(department='Science').count() == 0
+        # Their schedules stay, unassigned
+        assert Schedule.query.filter(Schedule.teacher_id.is_(None)).count() == teachers * 10
+        assert db.session.get(Student, 4) is None
+
+@pytest.mark.parametrize('body', [
+    {'set': {'status': 'inactive'}},
+    {'ids': [1], 'set': {'email': 'x@y.z'}},
+    {'filter': {'email': 'x'}, 'set': {'status': 'inactive'}},
+    {'ids': 'abc', 'set': {'status': 'inactive'}},
+    {'filter': {'status': {'a': 1}}, 'set': {'status': 'inactive'}},
+])
+def test_invalid_bulk_requests_are_rejected(client, auth_headers, body):
+    response = client.patch('/api/admin/students/bulk', json=body, headers=auth_headers)
+    
+    assert response.status_code == 400
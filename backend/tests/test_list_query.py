@@ -0,0 +1,38 @@
+import pytest
+
+@pytest.mark.parametrize('url', [
+    '/api/admin/teachers?sort=last_name',
+    '/api/admin/teachers?department=Science&sort=-last_name',
+    '/api/admin/teachers?department__in=Science,Arts&sort=department,last_name',
+    '/api/admin/teachers?experience_years__gte=10&experience_years__lt=12&is_active=true',
+    '/api/admin/teachers?last_name__prefix=Sa',
+    '/api/admin/materials?created_at__gte=2024-01-01T00:00:00&sort=created_at',
+    '/api/admin/schedules?grade_level=Grade%201&section=A&sort=day_of_week,start_time',
+])
+def test_index_prefix_sorts_are_accepted(client, auth_headers, url):
+    assert client.get(url, headers=auth_headers).status_code == 200
+
+@pytest.mark.parametrize('url', [
+    '/api/admin/teachers?sort=bio',
+    '/api/admin/teachers?sort=nope',
+    '/api/admin/teachers?sort=department,-last_name',
+    '/api/admin/teachers?salary=1',
+    '/api/admin/teachers?experience_years=abc',
+    '/api/admin/teachers?is_active=maybe',
+    '/api/admin/materials?sort=title',
+    '/api/admin/schedules?sort=start_time',
+])
+def test_unindexed_sorts_and_unknown_filters_are_rejected(client, auth_headers, url):
+    response = client.get(url, headers=auth_headers)
+    
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+def test_filters_and_sort_are_applied(client, auth_headers):
+    response = client.get('/api/admin/teachers?department=Science&sort=-last_name&fields=last_name,department',
+                          headers=auth_headers)
+    teachers = response.get_json()['data']['teachers']
+    names = [teacher['last_name'] for teacher in teachers]
+    
+    assert names and names == sorted(names, reverse=True)
+    assert {teacher['department'] for teacher in teachers} == {'Science'}
@@ -0,0 +1,101 @@
+import pytest
+
+from app.extensions import db
+from app.models import Teacher
+from app.utils.home_snapshot import home_snapshot
+from app.utils.query_budget import QueryBudgetExceeded, find_repeated, normalize_sql, query_budget
+
+PUBLIC_ENDPOINTS = [
+    '/api/public/teachers',
+    '/api/public/teachers?department=Science&sort=-last_name',
+    '/api/public/teachers/1',
+    '/api/public/teachers/departments',
+    '/api/public/materials',
+    '/api/public/materials/1',
+    '/api/public/materials/filters',
+    '/api/public/schedules',
+    '/api/public/schedules/filters',
+]
+
+ADMIN_ENDPOINTS = [
+    '/api/admin/dashboard/stats',
+    '/api/admin/users',
+    '/api/admin/registrations',
+    '/api/admin/students',
+    '/api/admin/students/1',
+    '/api/admin/teachers',
+    '/api/admin/teachers/1',
+    '/api/admin/materials',
+    '/api/admin/materials/1',
+    '/api/admin/schedules',
+    '/api/admin/schedules/1',
+    '/api/admin/rollovers',
+    '/api/auth/me',
+]
+
+# ==================== FIND REPEATED ====================
+
+def test_find_repeated_reports_statements_at_threshold():
+    log = [('SELECT a', 'x.py:1'), ('SELECT a', 'x.py:1'), ('SELECT a', 'x.py:1'), ('SELECT b', 'x.py:2')]
+    
+    assert find_repeated(log, 3) == [('SELECT a', 'x.py:1', 3)]
+    assert find_repeated(log, 4) == []
+
+def test_find_repeated_keeps_call_sites_apart():
+    log = [('SELECT a', 'x.py:1'), ('SELECT a', 'x.py:1'), ('SELECT a', 'y.py:9'), ('SELECT a', 'y.py:9')]
+    
+    assert find_repeated(log, 3) == []
+    assert sorted(find_repeated(log, 2)) == [('SELECT a', 'x.py:1', 2), ('SELECT a', 'y.py:9', 2)]
+
+def test_normalize_sql_collapses_literals_and_in_lists():
+    assert normalize_sql("SELECT *\n  FROM t WHERE id IN (?, ?, ?) AND name = 'x'") == \
+        'SELECT * FROM t WHERE id IN (?) AND name = ?'
+
+# ==================== ENDPOINT BUDGETS ====================
+
+@pytest.mark.parametrize('url', PUBLIC_ENDPOINTS)
+def test_public_endpoints_stay_within_budget(client, url):
+    response = client.get(url)
+    
+    assert response.status_code == 200
+    assert int(response.headers['X-Query-Count']) >= 0
+
+@pytest.mark.parametrize('url', ADMIN_ENDPOINTS)
+def test_admin_endpoints_stay_within_budget(client, auth_headers, url):
+    response = client.get(url, headers=auth_headers)
+    
+    assert response.status_code == 200
+
+def test_home_never_queries(dataset_app):
+    client = dataset_app.test_client()
+    
+    # Cold start answers 503 rather than rendering inside the request
+    response = client.get('/api/public/home')
+    assert response.status_code == 503
+    assert response.headers['X-Query-Count'] == '0'
+    
+    with dataset_app.app_context():
+        home_snapshot.rebuild()
+    response = client.get('/api/public/home')
+    assert response.status_code == 200
+    assert response.headers['X-Query-Count'] == '0'
+    assert response.get_json()['success'] is True
+
+def test_budget_violation_fails_the_request(app):
+    @query_budget(0)
+    def probe():
+        return {'teachers': Teacher.query.count()}
+    
+    app.add_url_rule('/probe', view_func=probe)
+    
+    with pytest.raises(QueryBudgetExceeded, match=r'probe ran 1 SQL statements \(budget 0\)'):
+        app.test_client().get('/probe')
+
+def test_repeated_statement_fails_the_request(dataset_app):
+    def probe():
+        return {'names': [db.session.get(Teacher, teacher_id).last_name for teacher_id in (1, 2, 3)]}
+    
+    dataset_app.add_url_rule('/probe', view_func=probe)
+    
+    with pytest.raises(QueryBudgetExceeded, match='possible N\\+1'):
+        dataset_app.test_client().get('/probe')
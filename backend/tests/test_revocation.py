@@ -0,0 +1,63 @@
+import time
+import uuid
+
+from app.models import RevokedToken
+from app.utils.revocation import BloomFilter, revocation_store
+
+def payload(jti=None):
+    return {'jti': jti or uuid.uuid4().hex, 'exp': int(time.time()) + 3600, 'type': 'access', 'sub': '1'}
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    keys = [uuid.uuid4().hex for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    
+    assert all(key in bloom for key in keys)
+    assert bloom.count == 1000
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for _ in range(1000):
+        bloom.add(uuid.uuid4().hex)
+    
+    hits = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+    assert hits < 300
+
+def test_revoked_token_is_reported(app):
+    with app.app_context():
+        revoked, other = payload(), payload()
+        revocation_store.revoke(revoked)
+        
+        assert revocation_store.is_revoked(revoked['jti'])
+        assert not revocation_store.is_revoked(other['jti'])
+
+def test_revoking_twice_is_a_no_op(app):
+    with app.app_context():
+        token = payload()
+        revocation_store.revoke(token)
+        revocation_store.revoke(token)
+        
+        assert RevokedToken.query.filter_by(jti=token['jti']).count() == 1
+        assert revocation_store.is_revoked(token['jti'])
+
+def test_top_up_does_not_count_known_keys_twice(app):
+    app.config['REVOCATION_REFRESH_SECONDS'] = 0
+    with app.app_context():
+        tokens = [payload() for _ in range(3)]
+        revocation_store.is_revoked(tokens[0]['jti'])
+        for token in tokens:
+            revocation_store.revoke(token)
+        count = revocation_store._filter.count
+        
+        # Each sync overlaps the previous window and sees the same rows again
+        revocation_store.is_revoked(tokens[0]['jti'])
+        revocation_store.is_revoked(tokens[0]['jti'])
+        
+        assert revocation_store._filter.count == count
+
+def test_logout_revokes_the_token(client, auth_headers):
+    assert client.get('/api/auth/me', headers=auth_headers).status_code == 200
+    assert client.post('/api/auth/logout', headers=auth_headers).status_code == 200
+    
+    assert client.get('/api/auth/me', headers=auth_headers).status_code == 401
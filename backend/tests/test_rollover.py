@@ -0,0 +1,63 @@
+from datetime import date
+
+from app.extensions import db
+from app.models import ArchivedStudent, Schedule, Student
+
+def snapshot(app):
+    with app.app_context():
+        students = {s.id: (s.grade_level, s.status) for s in Student.query}
+        schedules = {s.id: s.effective_until for s in Schedule.query}
+    return students, schedules
+
+def test_dry_run_changes_nothing(client, auth_headers, dataset_app):
+    before = snapshot(dataset_app)
+    
+    response = client.post('/api/admin/rollover', json={'dry_run': True, 'effective_date': '2025-07-01'}, headers=auth_headers)
+    
+    assert response.status_code == 200
+    preview = response.get_json()['data']['preview']
+    assert preview['promoted'] > 0
+    assert preview['unmapped'] == []
+    assert snapshot(dataset_app) == before
+
+def test_invalid_requests_are_rejected(client, auth_headers):
+    assert client.post('/api/admin/rollover', json={'grade_map': {}}, headers=auth_headers).status_code == 400
+    assert client.post('/api/admin/rollover', json={'effective_date': 'x'}, headers=auth_headers).status_code == 400
+
+def test_rollover_then_undo_restores_everything(client, auth_headers, dataset_app):
+    before = snapshot(dataset_app)
+    
+    response = client.post('/api/admin/rollover', json={'effective_date': '2025-07-01'}, headers=auth_headers)
+    assert response.status_code == 201
+    rollover = response.get_json()['data']
+    with dataset_app.app_context():
+        assert ArchivedStudent.query.count() == rollover['counts']['archived'] > 0
+        assert Student.query.filter_by(grade_level='Grade 1', status='active').count() == 0
+        assert Schedule.query.filter(Schedule.effective_until.isnot(None)).count() == rollover['counts']['schedules_expired']
+    
+    response = client.post('/api/admin/rollovers/%d/undo' % rollover['id'], headers=auth_headers)
+    assert response.status_code == 200
+    assert snapshot(dataset_app) == before
+    with dataset_app.app_context():
+        assert ArchivedStudent.query.count() == 0
+    
+    response = client.post('/api/admin/rollovers/%d/undo' % rollover['id'], headers=auth_headers)
+    assert response.status_code == 400
+
+def test_only_latest_rollover_can_be_undone(client, auth_headers):
+    first = client.post('/api/admin/rollover', json={'effective_date': '2025-07-01'}, headers=auth_headers).get_json()['data']
+    second = client.post('/api/admin/rollover', json={'effective_date': '2026-07-01', 'expire_schedules': False},
+                         headers=auth_headers).get_json()['data']
+    
+    assert client.post('/api/admin/rollovers/%d/undo' % first['id'], headers=auth_headers).status_code == 400
+    assert client.post('/api/admin/rollovers/%d/undo' % second['id'], headers=auth_headers).status_code == 200
+    assert client.post('/api/admin/rollovers/%d/undo' % first['id'], headers=auth_headers).status_code == 200
+
+def test_expired_schedules_leave_public_listings(client, auth_headers, dataset_app):
+    with dataset_app.app_context():
+        total = Schedule.query.count()
+    assert client.get('/api/public/schedules').get_json()['data']['total'] == total
+    
+    client.post('/api/admin/rollover', json={'effective_date': date.today().isoformat()}, headers=auth_headers)
+    
+    assert client.get('/api/public/schedules').get_json()['data']['total'] == 0
@@ -0,0 +1,68 @@
+from app.extensions import db
+from app.models import Student
+
+URL = '/api/admin/students/5'
+
+def test_detail_carries_version_as_etag(client, auth_headers):
+    response = client.get(URL, headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"%d"' % response.get_json()['data']['version']
+
+def test_matching_if_match_updates_and_bumps_version(client, auth_headers):
+    etag = client.get(URL, headers=auth_headers).headers['ETag']
+    
+    response = client.patch(URL, json={'section': 'D'}, headers={**auth_headers, 'If-Match': etag})
+    
+    assert response.status_code == 200
+    assert response.get_json()['data']['section'] == 'D'
+    assert response.headers['ETag'] == '"%d"' % (int(etag.strip('"')) + 1)
+
+def test_stale_if_match_is_rejected(client, auth_headers, dataset_app):
+    etag = client.get(URL, headers=auth_headers).headers['ETag']
+    client.patch(URL, json={'section': 'D'}, headers={**auth_headers, 'If-Match': etag})
+    
+    response = client.patch(URL, json={'section': 'A'}, headers={**auth_headers, 'If-Match': etag})
+    
+    assert response.status_code == 412
+    assert response.headers['ETag'] == '"%d"' % (int(etag.strip('"')) + 1)
+    with dataset_app.app_context():
+        assert db.session.get(Student, 5).section == 'D'
+
+def test_missing_row_is_not_found_even_with_if_match(client, auth_headers):
+    response = client.patch('/api/admin/students/999999', json={'section': 'A'}, headers={**auth_headers, 'If-Match': '"1"'})
+    
+    assert response.status_code == 404
+
+def test_without_if_match_the_update_is_unconditional(client, auth_headers):
+    before = client.get(URL, headers=auth_headers).get_json()['data']['version']
+    
+    response = client.put(URL, json={'section': 'B'}, headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert response.get_json()['data']['version'] == before + 1
+
+def test_empty_body_does_not_bump_version(client, auth_headers):
+    etag = client.get(URL, headers=auth_headers).headers['ETag']
+    
+    response = client.patch(URL, json={}, headers={**auth_headers, 'If-Match': etag})
+    
+    assert response.status_code == 400
+    assert client.get(URL, headers=auth_headers).headers['ETag'] == etag
+
+def test_duplicate_email_is_a_conflict(client, auth_headers, dataset_app):
+    with dataset_app.app_context():
+        other = db.session.get(Student, 6).email
+    
+    response = client.patch(URL, json={'email': other}, headers=auth_headers)
+    
+    assert response.status_code == 409
+
+def test_orm_updates_bump_version(dataset_app):
+    with dataset_app.app_context():
+        student = db.session.get(Student, 5)
+        before = student.version
+        student.section = 'C'
+        db.session.commit()
+        
+        assert student.version == before + 1
@@ -68,7 +68,7 @@ function MaterialsPage() {
 
     try {
       if (selectedMaterial) {
-        const response = await adminApi.updateMaterial(selectedMaterial.id, formData);
+        const response = await adminApi.updateMaterial(selectedMaterial.id, formData, selectedMaterial.version);
         if (response.success) {
           showSuccess("Success", "Material updated successfully!");
         }
@@ -82,7 +82,15 @@ function MaterialsPage() {
       resetForm();
       fetchMaterials();
     } catch (error) {
-      showError("Error", error.message || "Failed to save material.");
+      if (error.status === 412) {
+        // Another admin saved this material first; reload instead of overwriting
+        showError("Changed by someone else", "This material was updated by another admin. The list has been reloaded, open it again to edit the latest version.");
+        setIsModalOpen(false);
+        resetForm();
+        fetchMaterials();
+      } else {
+        showError("Error", error.message || "Failed to save material.");
+      }
     } finally {
       setIsSubmitting(false);
     }
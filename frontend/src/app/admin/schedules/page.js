@@ -4,7 +4,7 @@ import { useState, useEffect } from "react";
 import { motion } from "framer-motion";
 import { Calendar, Plus, Search, Edit2, Trash2, Clock } from "lucide-react";
 import { withAuth } from "@/contexts/AuthContext";
-import { adminApi, publicApi } from "@/lib/api";
+import { adminApi, batchApi } from "@/lib/api";
 import { useToast } from "@/contexts/ToastContext";
 import { Button } from "@/components/Button";
 import { Input, Select } from "@/components/Input";
@@ -47,17 +47,22 @@ function SchedulesPage() {
   });
 
   useEffect(() => {
-    fetchSchedules();
-    fetchTeachers();
+    fetchInitialData();
   }, []);
 
-  const fetchSchedules = async () => {
+  const fetchInitialData = async () => {
     try {
       setIsLoading(true);
-      const response = await adminApi.getAllSchedules();
+      const [schedulesResponse, teachersResponse] = await batchApi.run([
+        { path: "/admin/schedules" },
+        { path: "/public/teachers", query: { per_page: 100, fields: "id,full_name" } },
+      ]);
       
-      if (response.success) {
-        setSchedules(response.data.schedules);
+      if (schedulesResponse.success) {
+        setSchedules(schedulesResponse.data.schedules);
+      }
+      if (teachersResponse.success) {
+        setTeachers(teachersResponse.data.teachers.map((t) => ({ value: t.id.toString(), label: t.full_name })));
       }
     } catch (error) {
       showError("Error", "Failed to load schedules.");
@@ -66,14 +71,18 @@ function SchedulesPage() {
     }
   };
 
-  const fetchTeachers = async () => {
+  const fetchSchedules = async () => {
     try {
-      const response = await publicApi.getTeachers({ per_page: 100 });
+      setIsLoading(true);
+      const response = await adminApi.getAllSchedules();
+      
       if (response.success) {
-        setTeachers(response.data.teachers.map((t) => ({ value: t.id.toString(), label: t.full_name })));
+        setSchedules(response.data.schedules);
       }
     } catch (error) {
-      console.error("Failed to load teachers:", error);
+      showError("Error", "Failed to load schedules.");
+    } finally {
+      setIsLoading(false);
     }
   };
 
@@ -83,7 +92,7 @@ function SchedulesPage() {
 
     try {
       if (selectedSchedule) {
-        const response = await adminApi.updateSchedule(selectedSchedule.id, formData);
+        const response = await adminApi.updateSchedule(selectedSchedule.id, formData, selectedSchedule.version);
         if (response.success) {
           showSuccess("Success", "Schedule updated successfully!");
         }
@@ -97,7 +106,15 @@ function SchedulesPage() {
       resetForm();
       fetchSchedules();
     } catch (error) {
-      showError("Error", error.message || "Failed to save schedule.");
+      if (error.status === 412) {
+        // Another admin saved this schedule first; reload instead of overwriting
+        showError("Changed by someone else", "This schedule was updated by another admin. The list has been reloaded, open it again to edit the latest version.");
+        setIsModalOpen(false);
+        resetForm();
+        fetchSchedules();
+      } else {
+        showError("Error", error.message || "Failed to save schedule.");
+      }
     } finally {
       setIsSubmitting(false);
     }
@@ -93,7 +93,7 @@ function StudentsPage() {
 
     try {
       if (selectedStudent) {
-        const response = await adminApi.updateStudent(selectedStudent.id, formData);
+        const response = await adminApi.updateStudent(selectedStudent.id, formData, selectedStudent.version);
         if (response.success) {
           showSuccess("Success", "Student updated successfully!");
         }
@@ -107,7 +107,15 @@ function StudentsPage() {
       resetForm();
       fetchStudents();
     } catch (error) {
-      showError("Error", error.message || "Failed to save student.");
+      if (error.status === 412) {
+        // Another admin saved this student first; reload instead of overwriting
+        showError("Changed by someone else", "This student was updated by another admin. The list has been reloaded, open it again to edit the latest version.");
+        setIsModalOpen(false);
+        resetForm();
+        fetchStudents();
+      } else {
+        showError("Error", error.message || "Failed to save student.");
+      }
     } finally {
       setIsSubmitting(false);
     }
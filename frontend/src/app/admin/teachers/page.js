@@ -73,7 +73,7 @@ function TeachersPage() {
 
     try {
       if (selectedTeacher) {
-        const response = await adminApi.updateTeacher(selectedTeacher.id, formData);
+        const response = await adminApi.updateTeacher(selectedTeacher.id, formData, selectedTeacher.version);
         if (response.success) {
           showSuccess("Success", "Teacher updated successfully!");
         }
@@ -87,7 +87,15 @@ function TeachersPage() {
       resetForm();
       fetchTeachers();
     } catch (error) {
-      showError("Error", error.message || "Failed to save teacher.");
+      if (error.status === 412) {
+        // Another admin saved this teacher first; reload instead of overwriting
+        showError("Changed by someone else", "This teacher was updated by another admin. The list has been reloaded, open it again to edit the latest version.");
+        setIsModalOpen(false);
+        resetForm();
+        fetchTeachers();
+      } else {
+        showError("Error", error.message || "Failed to save teacher.");
+      }
     } finally {
       setIsSubmitting(false);
     }
@@ -53,7 +53,9 @@ export async function apiRequest(endpoint, options = {}) {
     }
     
     if (!response.ok) {
-      throw new Error(data.message || "Something went wrong");
+      const error = new Error(data.message || "Something went wrong");
+      error.status = response.status;
+      throw error;
     }
     
     return data;
@@ -63,6 +65,15 @@ export async function apiRequest(endpoint, options = {}) {
   }
 }
 
+/**
+ * If-Match header for an edit, so it fails with 412 if someone else saved first
+ * @param {number} version - The record's version from the list or detail payload
+ * @returns {object} - Headers (empty when the version is unknown)
+ */
+function ifMatch(version) {
+  return version == null ? {} : { "If-Match": `"${version}"` };
+}
+
 /**
  * Refresh access token using refresh token
  * @returns {Promise<boolean>} - Whether refresh was successful
@@ -158,6 +169,11 @@ export const authApi = {
 // ==================== PUBLIC API ====================
 
 export const publicApi = {
+  // Home (featured teachers, latest materials, counts, today's classes)
+  getHome: async () => {
+    return apiRequest("/public/home");
+  },
+  
   // Teachers
   getTeachers: async (params = {}) => {
     const queryString = new URLSearchParams(params).toString();
@@ -279,9 +295,10 @@ export const adminApi = {
     });
   },
   
-  updateStudent: async (id, data) => {
+  updateStudent: async (id, data, version) => {
     return apiRequest(`/admin/students/${id}`, {
-      method: "PUT",
+      method: "PATCH",
+      headers: ifMatch(version),
       body: JSON.stringify(data),
     });
   },
@@ -305,9 +322,10 @@ export const adminApi = {
     });
   },
   
-  updateTeacher: async (id, data) => {
+  updateTeacher: async (id, data, version) => {
     return apiRequest(`/admin/teachers/${id}`, {
-      method: "PUT",
+      method: "PATCH",
+      headers: ifMatch(version),
       body: JSON.stringify(data),
     });
   },
@@ -331,9 +349,10 @@ export const adminApi = {
     });
   },
   
-  updateMaterial: async (id, data) => {
+  updateMaterial: async (id, data, version) => {
     return apiRequest(`/admin/materials/${id}`, {
-      method: "PUT",
+      method: "PATCH",
+      headers: ifMatch(version),
       body: JSON.stringify(data),
     });
   },
@@ -357,9 +376,10 @@ export const adminApi = {
     });
   },
   
-  updateSchedule: async (id, data) => {
+  updateSchedule: async (id, data, version) => {
     return apiRequest(`/admin/schedules/${id}`, {
-      method: "PUT",
+      method: "PATCH",
+      headers: ifMatch(version),
       body: JSON.stringify(data),
     });
   },
@@ -369,4 +389,29 @@ export const adminApi = {
       method: "DELETE",
     });
   },
-};
\ No newline at end of file
+};
+
+// Batch API (several calls in one round trip)
+export const batchApi = {
+  /**
+   * Run several API calls in one request
+   * @param {Array<{method?: string, path: string, query?: object, body?: object}>} requests - Paths without the /api prefix
+   * @param {boolean} retried - Whether this is the retry after a token refresh
+   * @returns {Promise<Array>} - Response bodies, in request order
+   */
+  run: async (requests, retried = false) => {
+    const response = await apiRequest("/batch", {
+      method: "POST",
+      body: JSON.stringify(
+        requests.map((req) => ({ method: "GET", ...req, path: `/api${req.path}` }))
+      ),
+    });
+    
+    // Sub-requests are authorized individually; retry once on an expired token
+    if (!retried && response.data.some((result) => result.status === 401) && (await refreshAccessToken())) {
+      return batchApi.run(requests, true);
+    }
+    
+    return response.data.map((result) => result.body);
+  },
+};